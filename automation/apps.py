@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class AutomationConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'automation'
+
+    def ready(self):
+        # Connects the receivers that mirror task status into the cache and drop stale device lists
+        from . import device_cache, tasks  # noqa: F401
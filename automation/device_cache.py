@@ -0,0 +1,39 @@
+"""
+Cached device lists.
+
+The task list filter, the device selects of every form and the form-helper APIs
+show lists read from Device rows or from the devices themselves. They are kept
+briefly in the cache under the keys below; the receivers here drop the shared
+lists whenever a device is added, edited or deleted.
+"""
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Device
+
+# (id, name) of every active device, for the task list's device filter
+ACTIVE_DEVICES_KEY = 'dev:active:list'
+ACTIVE_DEVICES_TIMEOUT = 60
+
+# (pk, label) choices of the active-device form selects
+DEVICE_CHOICES_KEY = 'dev:active:choices'
+DEVICE_CHOICES_TIMEOUT = 30
+
+# Interface and VRF lists read from a device, kept briefly for the form-helper APIs
+DEVICE_LISTING_TIMEOUT = 30
+
+
+def device_listing_cache_key(device_id, kind: str) -> str:
+    """Cache key for a device's parsed 'interfaces' or 'vrfs' list."""
+    return f"dev:{device_id}:{kind}"
+
+
+@receiver(post_save, sender=Device, dispatch_uid='automation.forget_active_devices_save')
+@receiver(post_delete, sender=Device, dispatch_uid='automation.forget_active_devices_delete')
+def forget_active_devices(sender, update_fields=None, **kwargs):
+    """Drop the cached device lists when a device is added, edited or deleted."""
+    if update_fields and set(update_fields) <= {'last_connected'}:
+        # Connection tests only touch last_connected, which the lists do not show
+        return
+    cache.delete_many([ACTIVE_DEVICES_KEY, DEVICE_CHOICES_KEY])
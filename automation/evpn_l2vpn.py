@@ -3,6 +3,8 @@ from .network_automation import NetworkAutomationError
 class EVPNManager:
     """EVPN and L2VPN management for Juniper MX."""
     
+    __slots__ = ('device', 'device_type')
+    
     def __init__(self, device_manager):
         self.device = device_manager
         self.device_type = device_manager.device_params['device_type']
@@ -2,13 +2,13 @@ from django.shortcuts import render, redirect
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
 from django.conf import settings
-import threading
 
 from .models import Device, NetworkTask
 from .forms import (
     DeviceSelectionForm, L2VPWSForm, L2VPNSVCForm, EVPNInstanceForm, BridgeDomainForm
 )
 from .evpn_l2vpn import EVPNManager
+from .tasks import submit_task
 
 def execute_task_async(task):
     from .views import execute_network_task
@@ -26,10 +26,10 @@ def execute_task_async(task):
         else:
             task.status = 'failed'
             task.error_message = error
-        task.save()
+        task.save(update_fields=['status', 'result', 'error_message'])
     except Exception:
         task.status = 'failed'
-        task.save()
+        task.save(update_fields=['status'])
 
 @login_required
 def l2vpws(request):
@@ -51,8 +51,7 @@ def l2vpws(request):
                 },
                 created_by=request.user
             )
-            thread = threading.Thread(target=execute_task_async, args=(task,))
-            thread.start()
+            submit_task(execute_task_async, task)
             messages.success(request, f'L2VPWS task submitted for {device.name}')
             return redirect('task_detail', task_id=task.id)
     else:
@@ -81,8 +80,7 @@ def l2vpn_vpls(request):
                 },
                 created_by=request.user
             )
-            thread = threading.Thread(target=execute_task_async, args=(task,))
-            thread.start()
+            submit_task(execute_task_async, task)
             messages.success(request, f'VPLS task submitted for {device.name}')
             return redirect('task_detail', task_id=task.id)
     else:
@@ -114,8 +112,7 @@ def evpn_instance(request):
                 },
                 created_by=request.user
             )
-            thread = threading.Thread(target=execute_task_async, args=(task,))
-            thread.start()
+            submit_task(execute_task_async, task)
             messages.success(request, f'EVPN Instance task submitted for {device.name}')
             return redirect('task_detail', task_id=task.id)
     else:
@@ -142,8 +139,7 @@ def bridge_domain(request):
                 },
                 created_by=request.user
             )
-            thread = threading.Thread(target=execute_task_async, args=(task,))
-            thread.start()
+            submit_task(execute_task_async, task)
             messages.success(request, 'Bridge Domain task submitted')
             return redirect('task_detail', task_id=task.id)
     else:
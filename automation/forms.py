@@ -1,8 +1,51 @@
 from django import forms
+from django.core.cache import cache
+from django.forms.models import ModelChoiceIterator
 from .models import Device, NetworkTask
+from .device_cache import DEVICE_CHOICES_KEY, DEVICE_CHOICES_TIMEOUT
 import json
 
 
+class CachedDeviceChoiceIterator(ModelChoiceIterator):
+    """Yields the field's cached (pk, label) pairs instead of running the queryset."""
+    
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        yield from self.field.cached_choices()
+    
+    def __len__(self):
+        return len(self.field.cached_choices()) + (self.field.empty_label is not None)
+    
+    def __bool__(self):
+        return self.field.empty_label is not None or bool(self.field.cached_choices())
+
+
+class ActiveDeviceChoiceField(forms.ModelChoiceField):
+    """Select of active devices whose options are cached between renders.
+    
+    Every instance lists the same devices, so they all share one cache entry;
+    the only argument just narrows the fields loaded for the submitted device.
+    Only rendering uses the cache; submitted values are still validated against
+    the database, so a device deactivated meanwhile is rejected.
+    """
+    iterator = CachedDeviceChoiceIterator
+    
+    def __init__(self, only=None, **kwargs):
+        queryset = Device.objects.filter(is_active=True)
+        if only:
+            queryset = queryset.only(*only)
+        super().__init__(queryset, **kwargs)
+    
+    def cached_choices(self):
+        return cache.get_or_set(
+            DEVICE_CHOICES_KEY,
+            lambda: [(device.pk, self.label_from_instance(device))
+                     for device in self.queryset.only('id', 'name', 'host')],
+            DEVICE_CHOICES_TIMEOUT,
+        )
+
+
 class DeviceForm(forms.ModelForm):
     password = forms.CharField(widget=forms.PasswordInput(), help_text="Device login password")
     
@@ -236,8 +279,7 @@ class OSPFv3ConfigForm(forms.Form):
 
 
 class TaskExecutionForm(forms.Form):
-    device = forms.ModelChoiceField(
-        queryset=Device.objects.filter(is_active=True),
+    device = ActiveDeviceChoiceField(
         empty_label="Select a device"
     )
     task_type = forms.ChoiceField(choices=[], label="Task Type")
@@ -249,8 +291,9 @@ class TaskExecutionForm(forms.Form):
 
 class DeviceTestForm(forms.Form):
     """Form to test device connectivity"""
-    device = forms.ModelChoiceField(
-        queryset=Device.objects.filter(is_active=True),
+    device = ActiveDeviceChoiceField(
+        # Only what the connection test reads
+        only=('id', 'name', *Device.CONNECTION_FIELDS),
         empty_label="Select a device",
         label="Device to Test"
     )
@@ -258,8 +301,7 @@ class DeviceTestForm(forms.Form):
 
 class DeviceSelectionForm(forms.Form):
     """Simple form for device selection (used by show commands)"""
-    device = forms.ModelChoiceField(
-        queryset=Device.objects.filter(is_active=True),
+    device = ActiveDeviceChoiceField(
         empty_label="Select a device",
         label="Target Device"
     )
@@ -267,8 +309,7 @@ class DeviceSelectionForm(forms.Form):
 
 class ShowRoutesForm(forms.Form):
     """Form for showing routing table with optional VRF support"""
-    device = forms.ModelChoiceField(
-        queryset=Device.objects.filter(is_active=True),
+    device = ActiveDeviceChoiceField(
         empty_label="Select a device",
         label="Target Device"
     )
@@ -885,8 +926,8 @@ class HuaweiEthTrunkForm(forms.Form):
     description = forms.CharField(max_length=255, required=False, widget=forms.TextInput(attrs={'class': 'form-control'}), help_text='Description (optional)')
 
 class HuaweiEthTrunkMLAGForm(forms.Form):
-    primary_device = forms.ModelChoiceField(queryset=Device.objects.filter(is_active=True), label='Primary Switch')
-    peer_device = forms.ModelChoiceField(queryset=Device.objects.filter(is_active=True), label='Peer Switch')
+    primary_device = ActiveDeviceChoiceField(label='Primary Switch')
+    peer_device = ActiveDeviceChoiceField(label='Peer Switch')
     trunk_id = forms.IntegerField(min_value=1, max_value=4096, widget=forms.NumberInput(attrs={'class': 'form-control', 'placeholder': '1'}), help_text='Eth-Trunk ID (e.g., 1)')
     mode = forms.ChoiceField(choices=[('lacp', 'LACP (dynamic)'), ('lacp-static', 'LACP Static')], initial='lacp', widget=forms.Select(attrs={'class': 'form-control'}), help_text='Aggregation mode')
     mlag_id = forms.IntegerField(required=False, min_value=1, max_value=65535, widget=forms.NumberInput(attrs={'class': 'form-control', 'placeholder': '1'}), help_text='M-LAG domain ID (optional)')
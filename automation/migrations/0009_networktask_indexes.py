@@ -0,0 +1,27 @@
+# Generated by Django 5.2.7 on 2026-10-16 07:59
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('automation', '0008_alter_fabricdeployment_options_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='networktask',
+            index=models.Index(fields=['-created_at'], name='automation__created_634cf8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='networktask',
+            index=models.Index(fields=['status', '-created_at'], name='automation__status_bfb1fc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='networktask',
+            index=models.Index(fields=['device', '-created_at'], name='automation__device__93ea0d_idx'),
+        ),
+    ]
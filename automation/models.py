@@ -3,6 +3,43 @@ from django.contrib.auth.models import User
 from django.utils import timezone
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _orjson_dumps(value):
+    try:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    except TypeError:
+        # orjson rejects integers beyond 64 bits and some key types that json.dumps accepts
+        return json.dumps(value)
+
+
+class OrjsonJSONField(models.JSONField):
+    """JSONField that encodes with orjson when it is installed.
+    
+    Values are decoded by JSONField itself, since orjson reads integers beyond
+    64 bits back as floats. Without orjson, or with a custom encoder, it behaves
+    exactly like JSONField. Migrations record it as a plain JSONField.
+    """
+    
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        return name, 'django.db.models.JSONField', args, kwargs
+    
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if orjson is None or self.encoder is not None or hasattr(value, 'as_sql'):
+            return super().get_db_prep_value(value, connection, prepared)
+        if not prepared:
+            value = self.get_prep_value(value)
+        # Same adaptation as connection.ops.adapt_json_value(), with orjson as the serializer
+        if connection.vendor == 'postgresql':
+            from django.db.backends.postgresql.psycopg_any import Jsonb
+            return Jsonb(value, dumps=_orjson_dumps)
+        return _orjson_dumps(value)
+
 
 class Device(models.Model):
     DEVICE_TYPES = [
@@ -26,6 +63,9 @@ class Device(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     last_connected = models.DateTimeField(null=True, blank=True)
     
+    # Columns read by get_connection_params(); lets callers load just these with only()
+    CONNECTION_FIELDS = ('device_type', 'host', 'username', 'password', 'port')
+    
     class Meta:
         ordering = ['name']
     
@@ -100,7 +140,7 @@ class NetworkTask(models.Model):
     
     device = models.ForeignKey(Device, on_delete=models.CASCADE)
     task_type = models.CharField(max_length=30, choices=TASK_TYPES)
-    parameters = models.JSONField(default=dict)  # Task-specific parameters
+    parameters = OrjsonJSONField(default=dict)  # Task-specific parameters
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
     created_by = models.ForeignKey(User, on_delete=models.CASCADE)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -111,6 +151,12 @@ class NetworkTask(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        # Match task_list: newest first, optionally filtered by status or device
+        indexes = [
+            models.Index(fields=['-created_at']),
+            models.Index(fields=['status', '-created_at']),
+            models.Index(fields=['device', '-created_at']),
+        ]
     
     def __str__(self):
         return f"{self.get_task_type_display()} on {self.device.name}"
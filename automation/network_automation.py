@@ -2,12 +2,21 @@
 Network automation scripts using Netmiko for Cisco and Huawei devices; PyEZ for Juniper.
 """
 
+import atexit
+import io
 import time
+import threading
 import logging
 from netmiko import ConnectHandler, NetmikoTimeoutException, NetmikoAuthenticationException
 from typing import Dict, List, Optional, Tuple
 import re
-from functools import wraps
+import ipaddress
+import socket
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from itertools import chain, repeat
+from operator import itemgetter
+from django.db import transaction
 from django.utils import timezone
 try:
     from .juniper_manager import JuniperDeviceManager
@@ -21,6 +30,108 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Exception text that indicates a dropped SSH session worth retrying
+_CONN_ERR_RE = re.compile(r'socket is closed|connection|broken pipe', re.IGNORECASE)
+
+# Shared tail that enables and leaves a Huawei interface view
+_HUAWEI_IFACE_TAIL = ("undo shutdown", "quit")
+
+# Interface name prefixes rewritten by DataCenterFabricManager._normalize_huawei_interface
+_HUAWEI_IFACE_RE = re.compile(r'^(GE|XGE|(?i:loopback))(.*)$')
+
+# Command skeletons rendered with str.format_map; plain strings pass through unchanged
+_HUAWEI_EVPN_INST_TMPL = (
+    "evpn vpn-instance {ei} bd-mode",
+    "route-distinguisher {rd}",
+    "vpn-target {ert} export-extcommunity",
+    "vpn-target {irt} import-extcommunity",
+    "quit",
+)
+
+_HUAWEI_BGP_EVPN_AF_TMPL = (
+    "ipv4-family unicast",
+    "undo peer {peer} enable",
+    "quit",
+    "l2vpn-family evpn",
+    "peer {peer} enable",
+    "peer {peer} advertise-community",
+    "quit",
+    "quit",
+)
+
+# Pre-encoded VXLAN batches filled with bytes.__mod__ and written to the channel as-is
+_VXLAN_TUNNEL_TMPL = b"\n".join([
+    b"interface Tunnel%d",
+    b"tunnel-protocol vxlan",
+    b"source %s",
+    b"destination %s",
+    b"vxlan vni %d",
+    b"undo shutdown",
+    b"quit",
+])
+
+_VXLAN_BD_BINDING_TMPL = b"\n".join([
+    b"bridge-domain %d",
+    b"vxlan vni %d",
+    b"vxlan binding nve %d",
+    b"quit",
+])
+
+_VXLAN_ACCESS_PORT_TMPL = b"\n".join([
+    b"interface %s",
+    b"portswitch",
+    b"bridge-domain %d",
+    b"undo shutdown",
+    b"quit",
+])
+
+# Fields every tenant in a multi-tenant deployment must carry
+_TENANT_REQUIRED = itemgetter('name', 'vni', 'vlan_id', 'gateway_ip', 'subnet_mask')
+
+# Constant run between the per-tenant bridge-domain header and its route targets
+_TENANT_EVPN_PREFIX = ("arp broadcast-suppress enable", "evpn", "route-distinguisher auto")
+
+# Tenant overlay skeletons, rendered with str.format and split back into command lists
+_TENANT_VBDIF_TMPL = "\n".join([
+    "interface Vbdif{vlan_id}",
+    "ip address {gateway_ip} {prefix_length}",
+    "bridge-domain {vlan_id}",
+    "arp broadcast-suppress enable",
+    "undo shutdown",
+    "quit",
+])
+
+_TENANT_ACCESS_TMPL = "\n".join([
+    "interface {iface}",
+    "portswitch",
+    "port link-type trunk",
+    "quit",
+    "interface {iface}.{vlan_id} mode l2",
+    "encapsulation dot1q vid {vlan_id}",
+    "bridge-domain {vlan_id}",
+    "undo shutdown",
+    "quit",
+])
+
+_TENANT_EXT_ADV_TMPL = "\n".join([
+    "# External Advertisement for {tenant_name}",
+    "bgp 65000",
+    "l2vpn-family evpn",
+    "vpn-target {rt} export-extcommunity",
+    "vpn-target {rt} import-extcommunity",
+    "quit",
+    "quit",
+])
+
+
+# (vendor, has_vrf) -> OSPF process header used for redistribution
+_OSPF_REDIST_HEADER_TMPL = {
+    ('cisco', False): "router ospf {pid}",
+    ('cisco', True): "router ospf {pid} vrf {vrf}",
+    ('huawei', False): "ospf {pid}",
+    ('huawei', True): "ospf {pid} vpn-instance {vrf}",
+}
+
 
 def performance_monitor(operation_name):
     """Decorator to monitor operation performance"""
@@ -31,11 +142,11 @@ def performance_monitor(operation_name):
             try:
                 result = func(*args, **kwargs)
                 duration = time.time() - start_time
-                logger.info(f"⚡ {operation_name} completed in {duration:.2f}s")
+                logger.info("⚡ %s completed in %.2fs", operation_name, duration)
                 return result
             except Exception as e:
                 duration = time.time() - start_time
-                logger.error(f"❌ {operation_name} failed after {duration:.2f}s: {e}")
+                logger.error("❌ %s failed after %.2fs: %s", operation_name, duration, e)
                 raise
         return wrapper
     return decorator
@@ -46,6 +157,111 @@ class NetworkAutomationError(Exception):
     pass
 
 
+class ConfigSentError(NetworkAutomationError):
+    """A configuration batch reached the device but did not complete; retrying it would apply it twice."""
+    pass
+
+
+@lru_cache(maxsize=4)
+def _parse_ip_base(ip_range: str) -> Tuple[int, int]:
+    """Parse an underlay range such as 10.0.0.0/30 into (base address as int, prefix length).
+    The base is the address as written, host bits included, so 10.0.0.5/30 starts at 10.0.0.5.
+    """
+    interface = ipaddress.ip_interface(ip_range)
+    return int(interface.ip), interface.network.prefixlen
+
+
+def _link_addr(ip_range: str, interface_idx: int, host_offset: int = 0) -> str:
+    """Address host_offset within the /30 at interface_idx of ip_range (0 gives the link's base)."""
+    return socket.inet_ntoa((_parse_ip_base(ip_range)[0] + (interface_idx << 2) + host_offset).to_bytes(4, 'big'))
+
+
+def generate_ipv4_sequence(base: str, count: int, stride: int = 1) -> List[str]:
+    """Return count IPv4 addresses starting at base and spaced stride apart."""
+    start = int.from_bytes(socket.inet_aton(base), 'big')
+    return [socket.inet_ntoa(addr.to_bytes(4, 'big')) for addr in range(start, start + count * stride, stride)]
+
+
+@lru_cache(maxsize=32)
+def _underlay_ip_table(ip_range: str, size: int, host_offset: int) -> Tuple[Tuple[str, str], ...]:
+    """(network, host) addresses of the first `size` /30s in ip_range, shared by same-shaped fabric nodes."""
+    return tuple(zip(generate_ipv4_sequence(_link_addr(ip_range, 0), size, 4),
+                     generate_ipv4_sequence(_link_addr(ip_range, 0, host_offset), size, 4)))
+
+
+@lru_cache(maxsize=512)
+def _mask_prefix_length(mask: str) -> int:
+    """Convert subnet mask to prefix length; shared by every manager's _mask_to_prefix."""
+    parts = mask.split('.')
+    return (int(parts[0]) << 24 | int(parts[1]) << 16 | int(parts[2]) << 8 | int(parts[3])).bit_count()
+
+
+def _vendor_of(device_type: str) -> Optional[str]:
+    """Reduce a Netmiko device_type to the vendor key used for command dispatch."""
+    if 'cisco' in device_type:
+        return 'cisco'
+    if 'huawei' in device_type:
+        return 'huawei'
+    return None
+
+
+# FabricDeployment JSON field holding the members of each fabric role
+_FABRIC_ROLE_FIELD = {
+    'spine': 'spine_devices',
+    'leaf': 'leaf_devices',
+    'border_leaf': 'border_leaf_devices',
+}
+
+# Hosts that already passed fabric deployment validation in this process
+_validated_devices = set()
+
+
+def _leaf_peer_block(spine_ip: str, remote_as: int) -> Tuple[str, ...]:
+    """EVPN peering block for one spine loopback, entered and left from the BGP view."""
+    return (
+        "undo default ipv4-unicast",
+        f"peer {spine_ip} as-number {remote_as}",
+        f"peer {spine_ip} connect-interface LoopBack0",
+        f"peer {spine_ip} ebgp-max-hop 2",
+        "l2vpn-family evpn",
+        f"peer {spine_ip} enable",
+        f"peer {spine_ip} advertise-community",
+        "quit",
+    )
+
+
+_FABRIC_MEMBER_FIELDS = ('spine_devices', 'leaf_devices', 'border_leaf_devices', 'tenant_networks')
+
+
+def _apply_fabric_changes(fabric_deployment, changes) -> None:
+    """Apply a deploy's member changes to the fabric row under a row lock and save them.
+    
+    changes holds (field, key, entry, replace) tuples: entry is appended to the field's list
+    unless an entry with the same key value exists, which is then overwritten only when
+    replace is set. Entries other workers added or removed since fabric_deployment was read
+    stay added or removed. The saved lists are copied back onto fabric_deployment.
+    """
+    with transaction.atomic():
+        locked = type(fabric_deployment).objects.select_for_update().get(pk=fabric_deployment.pk)
+        touched = []
+        for field, key, entry, replace in changes:
+            members = getattr(locked, field) or []
+            for idx, existing in enumerate(members):
+                if isinstance(existing, dict) and existing.get(key) == entry[key]:
+                    if replace:
+                        members[idx] = entry
+                    break
+            else:
+                members.append(entry)
+            setattr(locked, field, members)
+            if field not in touched:
+                touched.append(field)
+        if touched:
+            locked.save(update_fields=[*touched, 'updated_at'])
+    for field in _FABRIC_MEMBER_FIELDS:
+        setattr(fabric_deployment, field, getattr(locked, field))
+
+
 class NetworkDeviceManager:
     """
     Manager class for network device operations using Netmiko or PyEZ.
@@ -111,10 +327,10 @@ class NetworkDeviceManager:
             return self.driver.connect()
         # Original Netmiko path
         try:
-            logger.debug(f"Connecting to {self.device_params['host']}...")
+            logger.debug("Connecting to %s...", self.device_params['host'])
             
             self.connection = ConnectHandler(**self.device_params)
-            logger.debug(f"Socket connected to {self.device_params['host']}")
+            logger.debug("Socket connected to %s", self.device_params['host'])
             
             # Fast session setup - skip extensive testing in favor of speed
             self._fast_session_setup()
@@ -122,13 +338,13 @@ class NetworkDeviceManager:
             return True
             
         except NetmikoTimeoutException as e:
-            logger.error(f"Connection timeout to {self.device_params['host']}: {e}")
+            logger.error("Connection timeout to %s: %s", self.device_params['host'], e)
             raise NetworkAutomationError(f"Connection timeout: {e}")
         except NetmikoAuthenticationException as e:
-            logger.error(f"Authentication failed for {self.device_params['host']}: {e}")
+            logger.error("Authentication failed for %s: %s", self.device_params['host'], e)
             raise NetworkAutomationError(f"Authentication failed: {e}")
         except Exception as e:
-            logger.error(f"Connection failed to {self.device_params['host']}: {e}")
+            logger.error("Connection failed to %s: %s", self.device_params['host'], e)
             raise NetworkAutomationError(f"Connection failed: {e}")
     
     def _fast_session_setup(self):
@@ -145,7 +361,7 @@ class NetworkDeviceManager:
                 
             logger.debug("Fast session setup completed")
         except Exception as e:
-            logger.debug(f"Fast session setup failed (continuing anyway): {e}")
+            logger.debug("Fast session setup failed (continuing anyway): %s", e)
     
     def disconnect(self):
         """Close connection to network device."""
@@ -153,7 +369,7 @@ class NetworkDeviceManager:
             self.driver.disconnect()
         elif self.connection:
             self.connection.disconnect()
-            logger.info(f"Disconnected from {self.device_params['host']}")
+            logger.info("Disconnected from %s", self.device_params['host'])
     
     def execute_command(self, command: str, use_textfsm: bool = False) -> str:
         """Execute command with optimized performance settings"""
@@ -163,7 +379,7 @@ class NetworkDeviceManager:
         if not self.connection:
             raise NetworkAutomationError("Not connected to device")
         
-        logger.debug(f"Executing: {command}")
+        logger.debug("Executing: %s", command)
         start_time = time.time()
         
         try:
@@ -199,13 +415,13 @@ class NetworkDeviceManager:
             
             exec_time = time.time() - start_time
             output_length = len(output) if output else 0
-            logger.debug(f"Command completed in {exec_time:.2f}s - {output_length} chars")
+            logger.debug("Command completed in %.2fs - %s chars", exec_time, output_length)
             
             return output if output else "No output received from device"
             
         except Exception as e:
             exec_time = time.time() - start_time
-            logger.error(f"Command '{command}' failed after {exec_time:.2f}s: {e}")
+            logger.error("Command '%s' failed after %.2fs: %s", command, exec_time, e)
             raise NetworkAutomationError(f"Command failed: {e}")
     
     def _check_connection_health(self) -> bool:
@@ -249,26 +465,26 @@ class NetworkDeviceManager:
                 # Wait a bit before reconnecting (especially on retries)
                 if attempt > 0:
                     wait_time = 2 ** attempt  # Exponential backoff: 2, 4, 8 seconds
-                    logger.info(f"Waiting {wait_time}s before reconnection attempt {attempt + 1}")
+                    logger.info("Waiting %ss before reconnection attempt %s", wait_time, attempt + 1)
                     time.sleep(wait_time)
                 
                 # Attempt to reconnect
-                logger.info(f"Reconnection attempt {attempt + 1}/{max_reconnect_attempts} to {self.device_params['host']}")
+                logger.info("Reconnection attempt %s/%s to %s", attempt + 1, max_reconnect_attempts, self.device_params['host'])
                 self.connection = ConnectHandler(**self.device_params)
                 
                 # Verify the new connection works
                 if self._check_connection_health():
-                    logger.info(f"Successfully reconnected to {self.device_params['host']} on attempt {attempt + 1}")
+                    logger.info("Successfully reconnected to %s on attempt %s", self.device_params['host'], attempt + 1)
                     # Re-setup the session
                     self._fast_session_setup()
                     return True
                 else:
-                    logger.warning(f"Reconnection attempt {attempt + 1} succeeded but health check failed")
+                    logger.warning("Reconnection attempt %s succeeded but health check failed", attempt + 1)
                     
             except Exception as reconnect_error:
-                logger.warning(f"Reconnection attempt {attempt + 1} failed: {reconnect_error}")
+                logger.warning("Reconnection attempt %s failed: %s", attempt + 1, reconnect_error)
                 if attempt == max_reconnect_attempts - 1:
-                    logger.error(f"All {max_reconnect_attempts} reconnection attempts failed")
+                    logger.error("All %s reconnection attempts failed", max_reconnect_attempts)
                     raise NetworkAutomationError(f"Connection lost and reconnection failed after {max_reconnect_attempts} attempts: {reconnect_error}")
         
         return False
@@ -288,7 +504,7 @@ class NetworkDeviceManager:
             try:
                 # Check and restore connection if needed
                 if attempt > 0:
-                    logger.info(f"Retry attempt {attempt} for configuration commands")
+                    logger.info("Retry attempt %s for configuration commands", attempt)
                     self._reconnect_if_needed()
                 
                 return self._execute_config_commands_internal(commands, device_type)
@@ -297,14 +513,76 @@ class NetworkDeviceManager:
                 error_str = str(e).lower()
                 if ('socket is closed' in error_str or 'connection' in error_str or 
                     'broken pipe' in error_str or 'timeout' in error_str) and attempt < max_retries:
-                    logger.warning(f"Connection error on attempt {attempt + 1}: {e}. Retrying...")
+                    logger.warning("Connection error on attempt %s: %s. Retrying...", attempt + 1, e)
                     time.sleep(2)  # Brief pause before retry
                     continue
                 else:
                     # Final attempt failed or non-connection error
-                    logger.error(f"Configuration failed after {attempt + 1} attempts: {e}")
+                    logger.error("Configuration failed after %s attempts: %s", attempt + 1, e)
                     raise NetworkAutomationError(f"Configuration failed: {e}")
     
+    def execute_config_commands_bulk(self, commands: List[str]) -> str:
+        """Send a whole command batch with a single channel write, falling back to the per-command path."""
+        if self.driver or not self.connection or ('huawei' not in self.device_type and 'cisco' not in self.device_type):
+            return self.execute_config_commands(commands)
+
+        payload = "\n".join(commands) + "\n"
+        logger.info("Bulk-sending %s commands (%s bytes) in one write", len(commands), len(payload))
+        return self._send_config_payload(lambda: self.connection.write_channel(payload), commands)
+
+    def execute_config_commands_bytes(self, payload: bytes) -> str:
+        """Send a pre-encoded UTF-8 command batch straight to the SSH channel, skipping the str encode."""
+        commands = payload.decode('utf-8').splitlines()
+        remote_conn = getattr(self.connection, 'remote_conn', None)
+        if (self.driver or not hasattr(remote_conn, 'sendall')
+                or ('huawei' not in self.device_type and 'cisco' not in self.device_type)):
+            return self.execute_config_commands_bulk(commands)
+
+        if not payload.endswith(b"\n"):
+            payload += b"\n"
+        logger.info("Bulk-sending %s pre-encoded commands (%s bytes) in one write", len(commands), len(payload))
+        return self._send_config_payload(lambda: remote_conn.sendall(payload), commands)
+
+    def _send_config_payload(self, write, commands: List[str]) -> str:
+        """Enter config mode, perform one batch write, read back once, then exit and commit/save.
+        Falls back to per-command execution only if nothing has been written yet; a failure after
+        the write raises instead, since replaying the batch would apply and commit it twice.
+        """
+        written = False
+        try:
+            if 'huawei' in self.device_type:
+                self._fast_enter_huawei_config()
+            else:
+                self.connection.config_mode()
+
+            # One write for the whole batch, then one bounded read back to the prompt.
+            # A write that fails part-way may already have reached the device, so it counts as sent.
+            written = True
+            write()
+            config_output = self.connection.read_channel_timing(read_timeout=max(10, len(commands)))
+
+            lower_out = (config_output or "").lower()
+            if any(tok in lower_out for tok in ["[y/n]", " y/n ", "continue?", "are you sure"]):
+                config_output += self.connection.send_command_timing("Y", strip_prompt=False, strip_command=False)
+
+            if 'huawei' in self.device_type:
+                self._fast_exit_huawei_config()
+                if self.device_params.get('auto_commit', True):
+                    return config_output + "\n\n" + self._fast_huawei_commit_save()
+                return config_output + "\n\n--- COMMIT/SAVE SKIPPED FOR SPEED ---"
+
+            self.connection.exit_config_mode()
+            if self.device_params.get('auto_save', True):
+                return config_output + "\n\n--- SAVE OUTPUT ---\n" + self.connection.save_config()
+            return config_output + "\n\n--- SAVE SKIPPED FOR SPEED ---"
+
+        except Exception as e:
+            if written:
+                logger.error("Bulk send failed after the batch was written: %s", e)
+                raise ConfigSentError(f"Configuration failed after the batch was sent: {e}")
+            logger.warning("Bulk send failed (%s), falling back to per-command execution", e)
+            return self.execute_config_commands(commands)
+
     def _execute_config_commands_internal(self, commands: List[str], device_type: str) -> str:
         """Internal method to execute configuration commands using Netmiko built-in methods"""
         
@@ -318,7 +596,7 @@ class NetworkDeviceManager:
     @performance_monitor("Cisco Configuration")
     def _execute_cisco_config(self, commands: List[str]) -> str:
         """Execute Cisco configuration with optimized speed"""
-        logger.info(f"Configuring Cisco device with {len(commands)} commands")
+        logger.info("Configuring Cisco device with %s commands", len(commands))
         
         try:
             # Ensure we're in enable mode first
@@ -326,7 +604,7 @@ class NetworkDeviceManager:
                 logger.debug("Entering Cisco enable mode")
                 self.connection.enable()
                 enable_prompt = self.connection.find_prompt()
-                logger.debug(f"Enable mode prompt: '{enable_prompt}'")
+                logger.debug("Enable mode prompt: '%s'", enable_prompt)
             
             # High-speed configuration execution with proper mode handling
             logger.debug("Executing Cisco configuration commands")
@@ -348,13 +626,13 @@ class NetworkDeviceManager:
             return result
             
         except Exception as e:
-            logger.error(f"Cisco configuration failed: {e}")
+            logger.error("Cisco configuration failed: %s", e)
             raise NetworkAutomationError(f"Cisco configuration failed: {e}")
     
     @performance_monitor("Huawei Configuration")
     def _execute_huawei_config(self, commands: List[str]) -> str:
         """Execute Huawei configuration with maximum speed optimizations"""
-        logger.info(f"Configuring Huawei device with {len(commands)} commands")
+        logger.info("Configuring Huawei device with %s commands", len(commands))
         
         try:
             # Try fast manual config mode first
@@ -362,13 +640,13 @@ class NetworkDeviceManager:
                 self._fast_enter_huawei_config()
                 
                 # Execute with manual interactive handling to auto-ack Y/N prompts
-                logger.debug(f"Sending {len(commands)} commands with interactive handling")
+                logger.debug("Sending %s commands with interactive handling", len(commands))
                 config_output = self._send_huawei_interactive_commands(commands)
                 
                 self._fast_exit_huawei_config()
                 
             except Exception as manual_error:
-                logger.warning(f"Manual config mode failed: {manual_error}")
+                logger.warning("Manual config mode failed: %s", manual_error)
                 logger.info("Falling back to Netmiko automatic mode handling")
                 
                 # Fallback to Netmiko's built-in mode handling
@@ -380,7 +658,7 @@ class NetworkDeviceManager:
                     exit_config_mode=True     # Let Netmiko handle it
                 )
             
-            logger.debug(f"Configuration output length: {len(config_output)}")
+            logger.debug("Configuration output length: %s", len(config_output))
             
             # Fast commit and save (simplified)
             if self.device_params.get('auto_commit', True):
@@ -392,7 +670,7 @@ class NetworkDeviceManager:
             return result
             
         except Exception as e:
-            logger.error(f"Huawei configuration failed: {e}")
+            logger.error("Huawei configuration failed: %s", e)
             
             # Emergency exit from config mode
             try:
@@ -407,7 +685,7 @@ class NetworkDeviceManager:
         try:
             # Check current prompt to see if already in system-view
             current_prompt = self.connection.find_prompt()
-            logger.debug(f"Current Huawei prompt: '{current_prompt}'")
+            logger.debug("Current Huawei prompt: '%s'", current_prompt)
             
             # If already in system-view (prompt ends with ]), skip entry
             if current_prompt.strip().endswith(']'):
@@ -430,7 +708,7 @@ class NetworkDeviceManager:
             
             # Verify entry was successful
             new_prompt = self.connection.find_prompt()
-            logger.debug(f"After system-view prompt: '{new_prompt}'")
+            logger.debug("After system-view prompt: '%s'", new_prompt)
             
             # Check for errors in command output
             if any(err in (result or "") for err in ["Error", "Unrecognized", "Invalid"]):
@@ -438,11 +716,11 @@ class NetworkDeviceManager:
                 
             # Verify we're in config mode (prompt should end with ] for Huawei)
             if not new_prompt.strip().endswith(']'):
-                logger.warning(f"System-view verification failed. Expected ']' prompt, got: '{new_prompt}'")
+                logger.warning("System-view verification failed. Expected ']' prompt, got: '%s'", new_prompt)
                 # Still continue - some Huawei devices may have different prompt patterns
                 
         except Exception as e:
-            logger.error(f"Cannot enter Huawei system-view: {e}")
+            logger.error("Cannot enter Huawei system-view: %s", e)
             raise NetworkAutomationError(f"Cannot enter Huawei config mode: {e}")
     
     def _fast_exit_huawei_config(self):
@@ -450,7 +728,7 @@ class NetworkDeviceManager:
         try:
             # Check current prompt
             current_prompt = self.connection.find_prompt()
-            logger.debug(f"Before exit prompt: '{current_prompt}'")
+            logger.debug("Before exit prompt: '%s'", current_prompt)
             
             # If not in system-view (doesn't end with ]), already out
             if not current_prompt.strip().endswith(']'):
@@ -473,16 +751,16 @@ class NetworkDeviceManager:
             
             # Verify exit
             new_prompt = self.connection.find_prompt()
-            logger.debug(f"After quit prompt: '{new_prompt}'")
+            logger.debug("After quit prompt: '%s'", new_prompt)
             
             # Prefer '>' but accept other non-config prompts as success
             if new_prompt.strip().endswith(('>', '#')):
                 logger.debug("Successfully exited to operational view")
             else:
-                logger.warning(f"Exit may not have worked. Prompt: '{new_prompt}'")
+                logger.warning("Exit may not have worked. Prompt: '%s'", new_prompt)
                 
         except Exception as e:
-            logger.warning(f"Exit from Huawei system-view failed: {e}")
+            logger.warning("Exit from Huawei system-view failed: %s", e)
     
     def _fast_huawei_commit_save(self) -> str:
         """Fast commit and save for Huawei devices with timing-based prompt handling"""
@@ -585,11 +863,11 @@ class NetworkDeviceManager:
                     
                     if self.connection.check_enable_mode():
                         enable_prompt = self.connection.find_prompt()
-                        logger.info(f"Huawei enable mode successful - prompt: '{enable_prompt}'")
+                        logger.info("Huawei enable mode successful - prompt: '%s'", enable_prompt)
                         return True
                         
                 except Exception as enable_error:
-                    logger.info(f"Netmiko enable() not supported for this Huawei device: {enable_error}")
+                    logger.info("Netmiko enable() not supported for this Huawei device: %s", enable_error)
             
             # Method 2: Fallback to manual system-view
             logger.info("Attempting manual system-view entry")
@@ -597,14 +875,14 @@ class NetworkDeviceManager:
             
             if "Error" not in result and "Unrecognized" not in result:
                 system_prompt = self.connection.find_prompt()
-                logger.info(f"Huawei system-view successful - prompt: '{system_prompt}'")
+                logger.info("Huawei system-view successful - prompt: '%s'", system_prompt)
                 return True
             else:
-                logger.warning(f"System-view returned: {result[:100]}")
+                logger.warning("System-view returned: %s", result[:100])
                 return False
                 
         except Exception as e:
-            logger.error(f"Failed to enter Huawei config mode: {e}")
+            logger.error("Failed to enter Huawei config mode: %s", e)
             return False
     
     def _exit_huawei_config_mode(self):
@@ -615,23 +893,23 @@ class NetworkDeviceManager:
                 try:
                     self.connection.exit_config_mode()
                     exit_prompt = self.connection.find_prompt()
-                    logger.info(f"Exited config mode via Netmiko - prompt: '{exit_prompt}'")
+                    logger.info("Exited config mode via Netmiko - prompt: '%s'", exit_prompt)
                     return
                 except Exception as exit_error:
-                    logger.info(f"Netmiko exit_config_mode failed: {exit_error}")
+                    logger.info("Netmiko exit_config_mode failed: %s", exit_error)
             
             # Fallback to manual quit
             self.connection.send_command("quit")
             quit_prompt = self.connection.find_prompt()
-            logger.info(f"Exited config mode via quit - prompt: '{quit_prompt}'")
+            logger.info("Exited config mode via quit - prompt: '%s'", quit_prompt)
             
         except Exception as e:
-            logger.warning(f"Could not exit config mode cleanly: {e}")
+            logger.warning("Could not exit config mode cleanly: %s", e)
     
     @performance_monitor("Generic Configuration")
     def _execute_generic_config(self, commands: List[str]) -> str:
         """Execute configuration for generic/other device types"""
-        logger.info(f"Configuring generic device with {len(commands)} commands")
+        logger.info("Configuring generic device with %s commands", len(commands))
         
         try:
             # Use Netmiko's built-in config mode handling for reliability
@@ -655,7 +933,7 @@ class NetworkDeviceManager:
                 return config_output + "\n\n--- SAVE SKIPPED FOR SPEED ---"
                 
         except Exception as e:
-            logger.error(f"Generic configuration failed: {e}")
+            logger.error("Generic configuration failed: %s", e)
             raise NetworkAutomationError(f"Configuration failed: {e}")
     
     def _execute_commands_individually(self, commands: List[str], device_type: str) -> str:
@@ -666,7 +944,7 @@ class NetworkDeviceManager:
             # Try to enter system-view manually
             self.connection.send_command("system-view")
         except Exception as e:
-            logger.warning(f"Could not enter system-view manually: {e}")
+            logger.warning("Could not enter system-view manually: %s", e)
         
         # Process commands individually
         for command in commands:
@@ -674,7 +952,7 @@ class NetworkDeviceManager:
                 cmd_output = self.connection.send_command(command, delay_factor=2)
                 config_output += f"{command}: {cmd_output}\n"
             except Exception as e:
-                logger.warning(f"Command '{command}' failed: {e}")
+                logger.warning("Command '%s' failed: %s", command, e)
                 config_output += f"{command}: ERROR - {e}\n"
         
         # Try to exit configuration mode
@@ -756,14 +1034,14 @@ class NetworkDeviceManager:
                     logger.info("Netmiko commit() successful")
                     return True
                 else:
-                    logger.info(f"Netmiko commit() returned: {result}")
+                    logger.info("Netmiko commit() returned: %s", result)
                     return False
             else:
                 logger.debug("Netmiko commit() method not available")
                 return False
                 
         except Exception as e:
-            logger.info(f"Netmiko commit() failed: {e}")
+            logger.info("Netmiko commit() failed: %s", e)
             return False
     
     def _manual_huawei_commit(self) -> str:
@@ -773,7 +1051,7 @@ class NetworkDeviceManager:
             
             # Get current prompt before commit
             pre_commit_prompt = self.connection.find_prompt()
-            logger.info(f"Pre-commit prompt: '{pre_commit_prompt}'")
+            logger.info("Pre-commit prompt: '%s'", pre_commit_prompt)
             
             # Send commit command with enhanced expect patterns
             commit_output = self.connection.send_command(
@@ -803,7 +1081,7 @@ class NetworkDeviceManager:
             
             # Verify commit completion
             post_commit_prompt = self.connection.find_prompt()
-            logger.info(f"Post-commit prompt: '{post_commit_prompt}'")
+            logger.info("Post-commit prompt: '%s'", post_commit_prompt)
             
             return commit_output
             
@@ -819,7 +1097,7 @@ class NetworkDeviceManager:
             
             # Get current prompt before save
             pre_save_prompt = self.connection.find_prompt()
-            logger.info(f"Pre-save prompt: '{pre_save_prompt}'")
+            logger.info("Pre-save prompt: '%s'", pre_save_prompt)
             
             # Try Netmiko's save_config first
             try:
@@ -831,11 +1109,11 @@ class NetworkDeviceManager:
                         logger.info("Netmiko save_config() successful")
                         return save_output
                     else:
-                        logger.info(f"Netmiko save_config() returned: {save_output[:100]}")
+                        logger.info("Netmiko save_config() returned: %s", save_output[:100])
                         # Fall through to manual save
                         
             except Exception as netmiko_save_error:
-                logger.info(f"Netmiko save_config() failed: {netmiko_save_error}")
+                logger.info("Netmiko save_config() failed: %s", netmiko_save_error)
                 # Fall through to manual save
             
             # Manual save handling
@@ -867,7 +1145,7 @@ class NetworkDeviceManager:
             
             # Verify save completion
             post_save_prompt = self.connection.find_prompt()
-            logger.info(f"Post-save prompt: '{post_save_prompt}'")
+            logger.info("Post-save prompt: '%s'", post_save_prompt)
             
             return save_output
             
@@ -884,21 +1162,22 @@ class NetworkDeviceManager:
 class VLANManager:
     """VLAN management operations for network devices."""
     
+    __slots__ = ('device', 'device_type', '_vendor')
+    
     def __init__(self, device_manager: NetworkDeviceManager):
         self.device = device_manager
         self.device_type = device_manager.device_params['device_type']
+        self._vendor = _vendor_of(self.device_type)
     
     def create_vlan(self, vlan_id: int, vlan_name: str = None) -> str:
         """Create VLAN on the device."""
         if not (1 <= vlan_id <= 4094):
             raise NetworkAutomationError("VLAN ID must be between 1 and 4094")
         
-        if 'cisco' in self.device_type:
-            return self._create_cisco_vlan(vlan_id, vlan_name)
-        elif 'huawei' in self.device_type:
-            return self._create_huawei_vlan(vlan_id, vlan_name)
-        else:
+        builder = {'cisco': self._create_cisco_vlan, 'huawei': self._create_huawei_vlan}.get(self._vendor)
+        if builder is None:
             raise NetworkAutomationError(f"Unsupported device type: {self.device_type}")
+        return builder(vlan_id, vlan_name)
     
     def _create_cisco_vlan(self, vlan_id: int, vlan_name: str = None) -> str:
         """Create VLAN on Cisco device."""
@@ -922,9 +1201,9 @@ class VLANManager:
         if not (1 <= vlan_id <= 4094):
             raise NetworkAutomationError("VLAN ID must be between 1 and 4094")
         
-        if 'cisco' in self.device_type:
+        if self._vendor == 'cisco':
             commands = [f"no vlan {vlan_id}"]
-        elif 'huawei' in self.device_type:
+        elif self._vendor == 'huawei':
             commands = [f"undo vlan {vlan_id}"]
         else:
             raise NetworkAutomationError(f"Unsupported device type: {self.device_type}")
@@ -933,9 +1212,9 @@ class VLANManager:
     
     def show_vlans(self) -> str:
         """Show VLAN configuration."""
-        if 'cisco' in self.device_type:
+        if self._vendor == 'cisco':
             return self.device.execute_command("show vlan brief")
-        elif 'huawei' in self.device_type:
+        elif self._vendor == 'huawei':
             return self.device.execute_command("display vlan")
         else:
             raise NetworkAutomationError(f"Unsupported device type: {self.device_type}")
@@ -944,20 +1223,23 @@ class VLANManager:
 class InterfaceManager:
     """Interface configuration operations for network devices."""
     
+    __slots__ = ('device', 'device_type', '_vendor')
+    
     def __init__(self, device_manager: NetworkDeviceManager):
         self.device = device_manager
         self.device_type = device_manager.device_params['device_type']
+        self._vendor = _vendor_of(self.device_type)
     
     def configure_access_port(self, interface: str, vlan_id: int) -> str:
         """Configure interface as access port."""
-        if 'cisco' in self.device_type:
+        if self._vendor == 'cisco':
             commands = [
                 f"interface {interface}",
                 "switchport mode access",
                 f"switchport access vlan {vlan_id}",
                 "no shutdown"
             ]
-        elif 'huawei' in self.device_type:
+        elif self._vendor == 'huawei':
             commands = [
                 f"interface {interface}",
                 "port link-type access",
@@ -972,7 +1254,7 @@ class InterfaceManager:
     
     def configure_trunk_port(self, interface: str, allowed_vlans: str = "all") -> str:
         """Configure interface as trunk port."""
-        if 'cisco' in self.device_type:
+        if self._vendor == 'cisco':
             commands = [
                 f"interface {interface}",
                 "switchport mode trunk",
@@ -980,7 +1262,7 @@ class InterfaceManager:
             ]
             if allowed_vlans != "all":
                 commands.insert(-1, f"switchport trunk allowed vlan {allowed_vlans}")
-        elif 'huawei' in self.device_type:
+        elif self._vendor == 'huawei':
             commands = [
                 f"interface {interface}",
                 "port link-type trunk",
@@ -996,13 +1278,13 @@ class InterfaceManager:
     
     def configure_ip_address(self, interface: str, ip_address: str, subnet_mask: str) -> str:
         """Configure IPv4 address on interface."""
-        if 'cisco' in self.device_type:
+        if self._vendor == 'cisco':
             commands = [
                 f"interface {interface}",
                 f"ip address {ip_address} {subnet_mask}",
                 "no shutdown"
             ]
-        elif 'huawei' in self.device_type:
+        elif self._vendor == 'huawei':
             # Convert subnet mask to prefix length for Huawei
             prefix_length = self._mask_to_prefix(subnet_mask)
             commands = [
@@ -1018,13 +1300,13 @@ class InterfaceManager:
     
     def configure_ipv6_address(self, interface: str, ipv6_address: str, prefix_length: int) -> str:
         """Configure IPv6 address on interface."""
-        if 'cisco' in self.device_type:
+        if self._vendor == 'cisco':
             commands = [
                 f"interface {interface}",
                 f"ipv6 address {ipv6_address}/{prefix_length}",
                 "no shutdown"
             ]
-        elif 'huawei' in self.device_type:
+        elif self._vendor == 'huawei':
             commands = [
                 f"interface {interface}",
                 "ipv6 enable",
@@ -1036,21 +1318,15 @@ class InterfaceManager:
             raise NetworkAutomationError(f"Unsupported device type: {self.device_type}")
         return self.device.execute_config_commands(commands)
     
-    def _mask_to_prefix(self, mask: str) -> int:
-        """Convert subnet mask to prefix length."""
-        mask_parts = mask.split('.')
-        binary = ''.join([bin(int(part))[2:].zfill(8) for part in mask_parts])
-        return binary.count('1')
+    _mask_to_prefix = staticmethod(_mask_prefix_length)
     
     def configure_vlan_interface(self, vlan_id: int, ip_address: str, subnet_mask: str, 
                                vrf_name: str = None, description: str = None, enable: bool = True) -> str:
         """Configure VLAN interface (SVI) with Layer 3 settings."""
-        if 'cisco' in self.device_type:
-            return self._cisco_vlan_interface(vlan_id, ip_address, subnet_mask, vrf_name, description, enable)
-        elif 'huawei' in self.device_type:
-            return self._huawei_vlan_interface(vlan_id, ip_address, subnet_mask, vrf_name, description, enable)
-        else:
+        builder = {'cisco': self._cisco_vlan_interface, 'huawei': self._huawei_vlan_interface}.get(self._vendor)
+        if builder is None:
             raise NetworkAutomationError(f"Unsupported device type: {self.device_type}")
+        return builder(vlan_id, ip_address, subnet_mask, vrf_name, description, enable)
     
     def _cisco_vlan_interface(self, vlan_id: int, ip_address: str, subnet_mask: str, 
                             vrf_name: str = None, description: str = None, enable: bool = True) -> str:
@@ -1075,7 +1351,7 @@ class InterfaceManager:
     def configure_vlan_interface_ipv6(self, vlan_id: int, ipv6_address: str, prefix_length: int, 
                                     vrf_name: str = None, description: str = None, enable: bool = True) -> str:
         """Configure VLAN interface IPv6 on Cisco/Huawei."""
-        if 'cisco' in self.device_type:
+        if self._vendor == 'cisco':
             commands = [f"interface vlan {vlan_id}"]
             if description:
                 commands.append(f"description {description}")
@@ -1084,7 +1360,7 @@ class InterfaceManager:
             commands.append(f"ipv6 address {ipv6_address}/{prefix_length}")
             commands.append("no shutdown" if enable else "shutdown")
             return self.device.execute_config_commands(commands)
-        elif 'huawei' in self.device_type:
+        elif self._vendor == 'huawei':
             commands = [f"interface Vlanif{vlan_id}"]
             if description:
                 commands.append(f"description {description}")
@@ -1127,9 +1403,9 @@ class InterfaceManager:
     
     def show_interfaces(self) -> str:
         """Show interface status."""
-        if 'cisco' in self.device_type:
+        if self._vendor == 'cisco':
             return self.device.execute_command("show ip interface brief")
-        elif 'huawei' in self.device_type:
+        elif self._vendor == 'huawei':
             return self.device.execute_command("display interface brief")
         else:
             raise NetworkAutomationError(f"Unsupported device type: {self.device_type}")
@@ -1138,18 +1414,21 @@ class InterfaceManager:
 class RoutingManager:
     """Routing configuration operations for network devices."""
     
+    __slots__ = ('device', 'device_type', '_vendor')
+    
     def __init__(self, device_manager: NetworkDeviceManager):
         self.device = device_manager
         self.device_type = device_manager.device_params['device_type']
+        self._vendor = _vendor_of(self.device_type)
     
     def add_static_route(self, network: str, mask: str, next_hop: str, vrf_name: str = None) -> str:
         """Add static route."""
-        if 'cisco' in self.device_type:
+        if self._vendor == 'cisco':
             if vrf_name:
                 commands = [f"ip route vrf {vrf_name} {network} {mask} {next_hop}"]
             else:
                 commands = [f"ip route {network} {mask} {next_hop}"]
-        elif 'huawei' in self.device_type:
+        elif self._vendor == 'huawei':
             prefix_length = self._mask_to_prefix(mask)
             if vrf_name:
                 commands = [f"ip route-static vpn-instance {vrf_name} {network} {prefix_length} {next_hop}"]
@@ -1162,12 +1441,12 @@ class RoutingManager:
     
     def add_static_route_v6(self, prefix: str, next_hop: str, vrf_name: str = None) -> str:
         """Add IPv6 static route."""
-        if 'cisco' in self.device_type:
+        if self._vendor == 'cisco':
             if vrf_name:
                 commands = [f"ipv6 route vrf {vrf_name} {prefix} {next_hop}"]
             else:
                 commands = [f"ipv6 route {prefix} {next_hop}"]
-        elif 'huawei' in self.device_type:
+        elif self._vendor == 'huawei':
             if vrf_name:
                 commands = [f"ipv6 route-static vpn-instance {vrf_name} {prefix} {next_hop}"]
             else:
@@ -1178,12 +1457,12 @@ class RoutingManager:
     
     def remove_static_route(self, network: str, mask: str, next_hop: str, vrf_name: str = None) -> str:
         """Remove static route."""
-        if 'cisco' in self.device_type:
+        if self._vendor == 'cisco':
             if vrf_name:
                 commands = [f"no ip route vrf {vrf_name} {network} {mask} {next_hop}"]
             else:
                 commands = [f"no ip route {network} {mask} {next_hop}"]
-        elif 'huawei' in self.device_type:
+        elif self._vendor == 'huawei':
             prefix_length = self._mask_to_prefix(mask)
             if vrf_name:
                 commands = [f"undo ip route-static vpn-instance {vrf_name} {network} {prefix_length} {next_hop}"]
@@ -1196,12 +1475,12 @@ class RoutingManager:
     
     def remove_static_route_v6(self, prefix: str, next_hop: str, vrf_name: str = None) -> str:
         """Remove IPv6 static route."""
-        if 'cisco' in self.device_type:
+        if self._vendor == 'cisco':
             if vrf_name:
                 commands = [f"no ipv6 route vrf {vrf_name} {prefix} {next_hop}"]
             else:
                 commands = [f"no ipv6 route {prefix} {next_hop}"]
-        elif 'huawei' in self.device_type:
+        elif self._vendor == 'huawei':
             if vrf_name:
                 commands = [f"undo ipv6 route-static vpn-instance {vrf_name} {prefix} {next_hop}"]
             else:
@@ -1215,7 +1494,7 @@ class RoutingManager:
         
         networks format: [{'network': '192.168.1.0', 'wildcard': '0.0.0.255', 'area': '0'}]
         """
-        if 'cisco' in self.device_type:
+        if self._vendor == 'cisco':
             if vrf_name:
                 commands = [
                     f"router ospf {process_id} vrf {vrf_name}",
@@ -1228,7 +1507,7 @@ class RoutingManager:
                 ]
             for net in networks:
                 commands.append(f"network {net['network']} {net['wildcard']} area {net['area']}")
-        elif 'huawei' in self.device_type:
+        elif self._vendor == 'huawei':
             # Enter OSPF view, then set router id and areas/networks
             if vrf_name:
                 commands = [
@@ -1252,11 +1531,7 @@ class RoutingManager:
         
         return self.device.execute_config_commands(commands)
     
-    def _mask_to_prefix(self, mask: str) -> int:
-        """Convert subnet mask to prefix length."""
-        mask_parts = mask.split('.')
-        binary = ''.join([bin(int(part))[2:].zfill(8) for part in mask_parts])
-        return binary.count('1')
+    _mask_to_prefix = staticmethod(_mask_prefix_length)
     
     def _wildcard_to_prefix(self, wildcard: str) -> int:
         """Convert wildcard mask to prefix length."""
@@ -1280,12 +1555,12 @@ class RoutingManager:
     
     def show_routes(self, vrf_name: str = None) -> str:
         """Show routing table, optionally for a specific VRF."""
-        if 'cisco' in self.device_type:
+        if self._vendor == 'cisco':
             if vrf_name:
                 return self.device.execute_command(f"show ip route vrf {vrf_name}")
             else:
                 return self.device.execute_command("show ip route")
-        elif 'huawei' in self.device_type:
+        elif self._vendor == 'huawei':
             if vrf_name:
                 return self.device.execute_command(f"display ip routing-table vpn-instance {vrf_name}")
             else:
@@ -1297,9 +1572,12 @@ class RoutingManager:
 class AEManager:
     """Aggregated Ethernet (AE) management for Juniper."""
     
+    __slots__ = ('device', 'device_type', '_vendor')
+    
     def __init__(self, device_manager: NetworkDeviceManager):
         self.device = device_manager
         self.device_type = device_manager.device_params['device_type']
+        self._vendor = _vendor_of(self.device_type)
     
     def create_ae(self, ae_name, members=None, lacp=True):
         if 'juniper' not in self.device_type:
@@ -1325,24 +1603,27 @@ class AEManager:
 class DeviceInfoManager:
     """Device information and monitoring operations."""
     
+    __slots__ = ('device', 'device_type', '_vendor')
+    
     def __init__(self, device_manager: NetworkDeviceManager):
         self.device = device_manager
         self.device_type = device_manager.device_params['device_type']
+        self._vendor = _vendor_of(self.device_type)
     
     def get_version(self) -> str:
         """Get device version information."""
-        if 'cisco' in self.device_type:
+        if self._vendor == 'cisco':
             return self.device.execute_command("show version")
-        elif 'huawei' in self.device_type:
+        elif self._vendor == 'huawei':
             return self.device.execute_command("display version")
         else:
             raise NetworkAutomationError(f"Unsupported device type: {self.device_type}")
     
     def get_running_config(self) -> str:
         """Get running configuration."""
-        if 'cisco' in self.device_type:
+        if self._vendor == 'cisco':
             return self.device.execute_command("show running-config")
-        elif 'huawei' in self.device_type:
+        elif self._vendor == 'huawei':
             return self.device.execute_command("display current-configuration")
         else:
             raise NetworkAutomationError(f"Unsupported device type: {self.device_type}")
@@ -1360,7 +1641,7 @@ class DeviceInfoManager:
             info['vlans'] = VLANManager(self.device).show_vlans()
             info['routes'] = RoutingManager(self.device).show_routes()
         except Exception as e:
-            logger.error(f"Error gathering system info: {e}")
+            logger.error("Error gathering system info: %s", e)
             info['error'] = str(e)
         
         return info
@@ -1369,18 +1650,19 @@ class DeviceInfoManager:
 class VRFManager:
     """VRF management operations for network devices."""
     
+    __slots__ = ('device', 'device_type', '_vendor')
+    
     def __init__(self, device_manager: NetworkDeviceManager):
         self.device = device_manager
         self.device_type = device_manager.device_params['device_type']
+        self._vendor = _vendor_of(self.device_type)
     
     def create_vrf(self, vrf_name: str, rd: str = None, description: str = None, import_rt: str = None, export_rt: str = None) -> str:
         """Create VRF on the device."""
-        if 'cisco' in self.device_type:
-            return self._create_cisco_vrf(vrf_name, rd, description, import_rt, export_rt)
-        elif 'huawei' in self.device_type:
-            return self._create_huawei_vrf(vrf_name, rd, description, import_rt, export_rt)
-        else:
+        builder = {'cisco': self._create_cisco_vrf, 'huawei': self._create_huawei_vrf}.get(self._vendor)
+        if builder is None:
             raise NetworkAutomationError(f"Unsupported device type: {self.device_type}")
+        return builder(vrf_name, rd, description, import_rt, export_rt)
     
     def _create_cisco_vrf(self, vrf_name: str, rd: str = None, description: str = None, import_rt: str = None, export_rt: str = None) -> str:
         """Create VRF on Cisco device."""
@@ -1413,9 +1695,9 @@ class VRFManager:
     
     def delete_vrf(self, vrf_name: str) -> str:
         """Delete VRF from the device."""
-        if 'cisco' in self.device_type:
+        if self._vendor == 'cisco':
             commands = [f"no ip vrf {vrf_name}"]
-        elif 'huawei' in self.device_type:
+        elif self._vendor == 'huawei':
             commands = [f"undo ip vpn-instance {vrf_name}"]
         else:
             raise NetworkAutomationError(f"Unsupported device type: {self.device_type}")
@@ -1424,12 +1706,10 @@ class VRFManager:
     
     def assign_vrf_to_interface(self, interface: str, vrf_name: str, ip_address: str = None, subnet_mask: str = None) -> str:
         """Assign VRF to interface with optional IP configuration."""
-        if 'cisco' in self.device_type:
-            return self._cisco_vrf_interface(interface, vrf_name, ip_address, subnet_mask)
-        elif 'huawei' in self.device_type:
-            return self._huawei_vrf_interface(interface, vrf_name, ip_address, subnet_mask)
-        else:
+        builder = {'cisco': self._cisco_vrf_interface, 'huawei': self._huawei_vrf_interface}.get(self._vendor)
+        if builder is None:
             raise NetworkAutomationError(f"Unsupported device type: {self.device_type}")
+        return builder(interface, vrf_name, ip_address, subnet_mask)
     
     def _cisco_vrf_interface(self, interface: str, vrf_name: str, ip_address: str = None, subnet_mask: str = None) -> str:
         """Assign VRF to Cisco interface."""
@@ -1461,17 +1741,13 @@ class VRFManager:
         
         return self.device.execute_config_commands(commands)
     
-    def _mask_to_prefix(self, mask: str) -> int:
-        """Convert subnet mask to prefix length."""
-        mask_parts = mask.split('.')
-        binary = ''.join([bin(int(part))[2:].zfill(8) for part in mask_parts])
-        return binary.count('1')
+    _mask_to_prefix = staticmethod(_mask_prefix_length)
     
     def show_vrfs(self) -> str:
         """Show VRF configuration."""
-        if 'cisco' in self.device_type:
+        if self._vendor == 'cisco':
             return self.device.execute_command("show ip vrf")
-        elif 'huawei' in self.device_type:
+        elif self._vendor == 'huawei':
             return self.device.execute_command("display ip vpn-instance")
         else:
             raise NetworkAutomationError(f"Unsupported device type: {self.device_type}")
@@ -1480,19 +1756,20 @@ class VRFManager:
 class BGPManager:
     """BGP configuration operations for network devices."""
     
+    __slots__ = ('device', 'device_type', '_vendor')
+    
     def __init__(self, device_manager: NetworkDeviceManager):
         self.device = device_manager
         self.device_type = device_manager.device_params['device_type']
+        self._vendor = _vendor_of(self.device_type)
     
     def configure_bgp_neighbor(self, as_number: int, neighbor_ip: str, remote_as: int, 
                               vrf_name: str = None, description: str = None) -> str:
         """Configure BGP neighbor."""
-        if 'cisco' in self.device_type:
-            return self._cisco_bgp_neighbor(as_number, neighbor_ip, remote_as, vrf_name, description)
-        elif 'huawei' in self.device_type:
-            return self._huawei_bgp_neighbor(as_number, neighbor_ip, remote_as, vrf_name, description)
-        else:
+        builder = {'cisco': self._cisco_bgp_neighbor, 'huawei': self._huawei_bgp_neighbor}.get(self._vendor)
+        if builder is None:
             raise NetworkAutomationError(f"Unsupported device type: {self.device_type}")
+        return builder(as_number, neighbor_ip, remote_as, vrf_name, description)
     
     def _cisco_bgp_neighbor(self, as_number: int, neighbor_ip: str, remote_as: int, 
                            vrf_name: str = None, description: str = None) -> str:
@@ -1542,12 +1819,10 @@ class BGPManager:
     
     def advertise_network(self, as_number: int, network: str, mask: str, vrf_name: str = None) -> str:
         """Advertise network in BGP."""
-        if 'cisco' in self.device_type:
-            return self._cisco_bgp_network(as_number, network, mask, vrf_name)
-        elif 'huawei' in self.device_type:
-            return self._huawei_bgp_network(as_number, network, mask, vrf_name)
-        else:
+        builder = {'cisco': self._cisco_bgp_network, 'huawei': self._huawei_bgp_network}.get(self._vendor)
+        if builder is None:
             raise NetworkAutomationError(f"Unsupported device type: {self.device_type}")
+        return builder(as_number, network, mask, vrf_name)
     
     def _cisco_bgp_network(self, as_number: int, network: str, mask: str, vrf_name: str = None) -> str:
         """Advertise network in Cisco BGP."""
@@ -1589,7 +1864,7 @@ class BGPManager:
     
     def configure_bgp_neighbor_v6(self, as_number: int, neighbor_ip: str, remote_as: int, vrf_name: str = None, description: str = None, source_interface: str = None) -> str:
         """Configure BGP IPv6 neighbor."""
-        if 'cisco' in self.device_type:
+        if self._vendor == 'cisco':
             commands = [f"router bgp {as_number}"]
             if not vrf_name:
                 commands.append(f"neighbor {neighbor_ip} remote-as {remote_as}")
@@ -1602,7 +1877,7 @@ class BGPManager:
             commands.append(f"neighbor {neighbor_ip} activate")
             commands.append("exit-address-family")
             return self.device.execute_config_commands(commands)
-        elif 'huawei' in self.device_type:
+        elif self._vendor == 'huawei':
             commands = [f"bgp {as_number}"]
             if vrf_name:
                 commands.append(f"ipv6-family vpn-instance {vrf_name}")
@@ -1618,7 +1893,7 @@ class BGPManager:
     
     def advertise_network_v6(self, as_number: int, prefix: str, vrf_name: str = None) -> str:
         """Advertise IPv6 network in BGP."""
-        if 'cisco' in self.device_type:
+        if self._vendor == 'cisco':
             commands = [
                 f"router bgp {as_number}",
                 f"address-family ipv6{' vrf ' + vrf_name if vrf_name else ''}",
@@ -1626,7 +1901,7 @@ class BGPManager:
                 "exit-address-family"
             ]
             return self.device.execute_config_commands(commands)
-        elif 'huawei' in self.device_type:
+        elif self._vendor == 'huawei':
             commands = [f"bgp {as_number}"]
             if vrf_name:
                 commands.append(f"ipv6-family vpn-instance {vrf_name}")
@@ -1644,21 +1919,15 @@ class BGPManager:
         else:
             raise NetworkAutomationError(f"Unsupported device type: {self.device_type}")
     
-    def _mask_to_prefix(self, mask: str) -> int:
-        """Convert subnet mask to prefix length."""
-        mask_parts = mask.split('.')
-        binary = ''.join([bin(int(part))[2:].zfill(8) for part in mask_parts])
-        return binary.count('1')
+    _mask_to_prefix = staticmethod(_mask_prefix_length)
     
     def configure_bgp_vrf(self, as_number: int, vrf_name: str, router_id: str = None, 
                          import_rt: str = None, export_rt: str = None) -> str:
         """Configure BGP for VRF with route targets."""
-        if 'cisco' in self.device_type:
-            return self._cisco_bgp_vrf(as_number, vrf_name, router_id, import_rt, export_rt)
-        elif 'huawei' in self.device_type:
-            return self._huawei_bgp_vrf(as_number, vrf_name, router_id, import_rt, export_rt)
-        else:
+        builder = {'cisco': self._cisco_bgp_vrf, 'huawei': self._huawei_bgp_vrf}.get(self._vendor)
+        if builder is None:
             raise NetworkAutomationError(f"Unsupported device type: {self.device_type}")
+        return builder(as_number, vrf_name, router_id, import_rt, export_rt)
     
     def _cisco_bgp_vrf(self, as_number: int, vrf_name: str, router_id: str = None, 
                       import_rt: str = None, export_rt: str = None) -> str:
@@ -1709,7 +1978,7 @@ class BGPManager:
     
     def configure_bgp_route_reflector(self, as_number: int, router_id: str, clients: list = None) -> str:
         """Configure BGP Route Reflector."""
-        if 'cisco' in self.device_type:
+        if self._vendor == 'cisco':
             commands = [
                 f"router bgp {as_number}",
                 f"bgp router-id {router_id}",
@@ -1718,7 +1987,7 @@ class BGPManager:
             if clients:
                 for client in clients:
                     commands.append(f"neighbor {client} route-reflector-client")
-        elif 'huawei' in self.device_type:
+        elif self._vendor == 'huawei':
             commands = [
                 f"bgp {as_number}",
                 f"router-id {router_id}",
@@ -1735,7 +2004,7 @@ class BGPManager:
     
     def configure_bgp_confederation(self, as_number: int, confed_id: int, confed_peers: list = None) -> str:
         """Configure BGP Confederation."""
-        if 'cisco' in self.device_type:
+        if self._vendor == 'cisco':
             commands = [
                 f"router bgp {as_number}",
                 f"bgp confederation identifier {confed_id}"
@@ -1743,7 +2012,7 @@ class BGPManager:
             if confed_peers:
                 peers_str = ' '.join(map(str, confed_peers))
                 commands.append(f"bgp confederation peers {peers_str}")
-        elif 'huawei' in self.device_type:
+        elif self._vendor == 'huawei':
             commands = [
                 f"bgp {as_number}",
                 f"confederation id {confed_id}"
@@ -1759,13 +2028,13 @@ class BGPManager:
     
     def configure_bgp_community(self, as_number: int, community_list: str, action: str = 'permit') -> str:
         """Configure BGP Community lists."""
-        if 'cisco' in self.device_type:
+        if self._vendor == 'cisco':
             commands = [
                 f"ip community-list standard {community_list} {action} {community_list}",
                 f"router bgp {as_number}",
                 "bgp community new-format"
             ]
-        elif 'huawei' in self.device_type:
+        elif self._vendor == 'huawei':
             commands = [
                 f"ip community-filter {community_list} {action} {community_list}",
                 f"bgp {as_number}",
@@ -1778,12 +2047,12 @@ class BGPManager:
     
     def configure_bgp_route_map(self, as_number: int, route_map: str, neighbor_ip: str, direction: str = 'in') -> str:
         """Apply route-map to BGP neighbor."""
-        if 'cisco' in self.device_type:
+        if self._vendor == 'cisco':
             commands = [
                 f"router bgp {as_number}",
                 f"neighbor {neighbor_ip} route-map {route_map} {direction}"
             ]
-        elif 'huawei' in self.device_type:
+        elif self._vendor == 'huawei':
             commands = [
                 f"bgp {as_number}",
                 f"peer {neighbor_ip} route-policy {route_map} {direction}",
@@ -1796,13 +2065,13 @@ class BGPManager:
     
     def configure_bgp_multipath(self, as_number: int, paths: int = 4) -> str:
         """Configure BGP multipath."""
-        if 'cisco' in self.device_type:
+        if self._vendor == 'cisco':
             commands = [
                 f"router bgp {as_number}",
                 f"maximum-paths {paths}",
                 f"maximum-paths ibgp {paths}"
             ]
-        elif 'huawei' in self.device_type:
+        elif self._vendor == 'huawei':
             commands = [
                 f"bgp {as_number}",
                 f"maximum load-balancing {paths}",
@@ -1815,7 +2084,7 @@ class BGPManager:
     
     def configure_bgp_route_reflector(self, as_number: int, router_id: str, cluster_id: int = 1, clients: list = None) -> str:
         """Configure BGP Route Reflector."""
-        if 'cisco' in self.device_type:
+        if self._vendor == 'cisco':
             commands = [
                 f"router bgp {as_number}",
                 f"bgp router-id {router_id}",
@@ -1824,7 +2093,7 @@ class BGPManager:
             if clients:
                 for client in clients:
                     commands.append(f"neighbor {client} route-reflector-client")
-        elif 'huawei' in self.device_type:
+        elif self._vendor == 'huawei':
             commands = [
                 f"bgp {as_number}",
                 f"router-id {router_id}",
@@ -1841,7 +2110,7 @@ class BGPManager:
     
     def configure_bgp_confederation(self, as_number: int, confed_id: int, confed_peers: list = None) -> str:
         """Configure BGP Confederation."""
-        if 'cisco' in self.device_type:
+        if self._vendor == 'cisco':
             commands = [
                 f"router bgp {as_number}",
                 f"bgp confederation identifier {confed_id}"
@@ -1849,7 +2118,7 @@ class BGPManager:
             if confed_peers:
                 peers_str = ' '.join(map(str, confed_peers))
                 commands.append(f"bgp confederation peers {peers_str}")
-        elif 'huawei' in self.device_type:
+        elif self._vendor == 'huawei':
             commands = [
                 f"bgp {as_number}",
                 f"confederation id {confed_id}"
@@ -1865,13 +2134,13 @@ class BGPManager:
     
     def configure_bgp_multipath(self, as_number: int, ebgp_paths: int = 4, ibgp_paths: int = 4) -> str:
         """Configure BGP multipath load balancing."""
-        if 'cisco' in self.device_type:
+        if self._vendor == 'cisco':
             commands = [
                 f"router bgp {as_number}",
                 f"maximum-paths {ebgp_paths}",
                 f"maximum-paths ibgp {ibgp_paths}"
             ]
-        elif 'huawei' in self.device_type:
+        elif self._vendor == 'huawei':
             commands = [
                 f"bgp {as_number}",
                 f"maximum load-balancing {max(ebgp_paths, ibgp_paths)}",
@@ -1884,12 +2153,12 @@ class BGPManager:
     
     def show_bgp_summary(self, vrf_name: str = None) -> str:
         """Show BGP summary."""
-        if 'cisco' in self.device_type:
+        if self._vendor == 'cisco':
             if vrf_name:
                 return self.device.execute_command(f"show ip bgp vpnv4 vrf {vrf_name} summary")
             else:
                 return self.device.execute_command("show ip bgp summary")
-        elif 'huawei' in self.device_type:
+        elif self._vendor == 'huawei':
             if vrf_name:
                 return self.device.execute_command(f"display bgp vpnv4 vpn-instance {vrf_name} peer")
             else:
@@ -1901,14 +2170,19 @@ class BGPManager:
 class AdvancedOSPFManager:
     """Advanced OSPF configuration operations for network devices."""
     
+    __slots__ = ('device', 'device_type', '_vendor')
+    
     def __init__(self, device_manager: NetworkDeviceManager):
         self.device = device_manager
         self.device_type = device_manager.device_params['device_type']
+        self._vendor = _vendor_of(self.device_type)
     
     def configure_ospf_area(self, process_id: int, area_id: str, area_type: str = 'standard', 
                            stub_default_cost: int = None, nssa_default: bool = False) -> str:
         """Configure OSPF area with different types."""
-        if 'cisco' in self.device_type:
+        device = self.device
+        vendor = self._vendor
+        if vendor == 'cisco':
             commands = [f"router ospf {process_id}"]
             
             if area_type == 'stub':
@@ -1925,7 +2199,7 @@ class AdvancedOSPFManager:
             elif area_type == 'totally_nssa':
                 commands.append(f"area {area_id} nssa no-summary")
                 
-        elif 'huawei' in self.device_type:
+        elif vendor == 'huawei':
             commands = [f"ospf {process_id}"]
             
             if area_type == 'stub':
@@ -1958,13 +2232,15 @@ class AdvancedOSPFManager:
         else:
             raise NetworkAutomationError(f"Unsupported device type: {self.device_type}")
         
-        return self.device.execute_config_commands(commands)
+        return device.execute_config_commands(commands)
     
     def configure_ospf_authentication(self, process_id: int, area_id: str = None, 
                                     interface: str = None, auth_type: str = 'md5', 
                                     key_id: int = 1, password: str = 'cisco123') -> str:
         """Configure OSPF authentication."""
-        if 'cisco' in self.device_type:
+        device = self.device
+        vendor = self._vendor
+        if vendor == 'cisco':
             commands = []
             if interface:
                 # Interface-level authentication
@@ -1979,7 +2255,7 @@ class AdvancedOSPFManager:
                     f"area {area_id} authentication {'message-digest' if auth_type == 'md5' else ''}"
                 ])
                 
-        elif 'huawei' in self.device_type:
+        elif vendor == 'huawei':
             commands = []
             if interface:
                 commands.extend([
@@ -1998,12 +2274,14 @@ class AdvancedOSPFManager:
         else:
             raise NetworkAutomationError(f"Unsupported device type: {self.device_type}")
         
-        return self.device.execute_config_commands(commands)
+        return device.execute_config_commands(commands)
     
     def configure_ospf_summarization(self, process_id: int, area_id: str, network: str, 
                                    mask: str, cost: int = None, not_advertise: bool = False) -> str:
         """Configure OSPF area range summarization."""
-        if 'cisco' in self.device_type:
+        device = self.device
+        vendor = self._vendor
+        if vendor == 'cisco':
             cmd = f"area {area_id} range {network} {mask}"
             if not_advertise:
                 cmd += " not-advertise"
@@ -2011,7 +2289,7 @@ class AdvancedOSPFManager:
                 cmd += f" cost {cost}"
             commands = [f"router ospf {process_id}", cmd]
             
-        elif 'huawei' in self.device_type:
+        elif vendor == 'huawei':
             commands = [
                 f"ospf {process_id}",
                 f"area {area_id}"
@@ -2026,11 +2304,13 @@ class AdvancedOSPFManager:
         else:
             raise NetworkAutomationError(f"Unsupported device type: {self.device_type}")
         
-        return self.device.execute_config_commands(commands)
+        return device.execute_config_commands(commands)
     
     def configure_ospf_v6(self, process_id: int, router_id: str, interfaces: List[Dict]) -> str:
         """Configure OSPFv3 (IPv6). interfaces: [{"interface": "GE1/0/1", "area": "0"}]"""
-        if 'cisco' in self.device_type:
+        device = self.device
+        vendor = self._vendor
+        if vendor == 'cisco':
             commands = [
                 "ipv6 unicast-routing",
                 f"ipv6 router ospf {process_id}",
@@ -2043,8 +2323,8 @@ class AdvancedOSPFManager:
                     f"ipv6 ospf {process_id} area {itf['area']}",
                     "no shutdown"
                 ])
-            return self.device.execute_config_commands(commands)
-        elif 'huawei' in self.device_type:
+            return device.execute_config_commands(commands)
+        elif vendor == 'huawei':
             commands = [
                 f"ospfv3 {process_id}",
                 f"router-id {router_id}",
@@ -2054,23 +2334,24 @@ class AdvancedOSPFManager:
                 commands.extend([
                     f"interface {itf['interface']}",
                     "ipv6 enable",
-                    f"ospfv3 {process_id} area {itf['area']}",
-                    "undo shutdown",
-                    "quit"
+                    f"ospfv3 {process_id} area {itf['area']}"
                 ])
-            return self.device.execute_config_commands(commands)
+                commands.extend(_HUAWEI_IFACE_TAIL)
+            return device.execute_config_commands(commands)
         else:
             raise NetworkAutomationError(f"Unsupported device type: {self.device_type}")
     
     def configure_ospf_virtual_link(self, process_id: int, area_id: str, neighbor_id: str, 
                                   hello_interval: int = 10, dead_interval: int = 40) -> str:
         """Configure OSPF virtual link."""
-        if 'cisco' in self.device_type:
+        device = self.device
+        vendor = self._vendor
+        if vendor == 'cisco':
             commands = [
                 f"router ospf {process_id}",
                 f"area {area_id} virtual-link {neighbor_id} hello-interval {hello_interval} dead-interval {dead_interval}"
             ]
-        elif 'huawei' in self.device_type:
+        elif vendor == 'huawei':
             commands = [
                 f"ospf {process_id}",
                 f"area {area_id}",
@@ -2083,16 +2364,16 @@ class AdvancedOSPFManager:
         else:
             raise NetworkAutomationError(f"Unsupported device type: {self.device_type}")
         
-        return self.device.execute_config_commands(commands)
+        return device.execute_config_commands(commands)
     
     def configure_ospf_redistribution(self, process_id: int, protocol: str, metric: int = None, 
                                     metric_type: int = None, vrf_name: str = None) -> str:
         """Configure OSPF redistribution."""
-        if 'cisco' in self.device_type:
-            if vrf_name:
-                commands = [f"router ospf {process_id} vrf {vrf_name}"]
-            else:
-                commands = [f"router ospf {process_id}"]
+        device = self.device
+        vendor = self._vendor
+        params = {'pid': process_id, 'vrf': vrf_name}
+        if vendor == 'cisco':
+            commands = [_OSPF_REDIST_HEADER_TMPL['cisco', bool(vrf_name)].format_map(params)]
             
             cmd = f"redistribute {protocol}"
             if metric:
@@ -2101,11 +2382,8 @@ class AdvancedOSPFManager:
                 cmd += f" metric-type {metric_type}"
             commands.append(cmd)
             
-        elif 'huawei' in self.device_type:
-            if vrf_name:
-                commands = [f"ospf {process_id} vpn-instance {vrf_name}"]
-            else:
-                commands = [f"ospf {process_id}"]
+        elif vendor == 'huawei':
+            commands = [_OSPF_REDIST_HEADER_TMPL['huawei', bool(vrf_name)].format_map(params)]
             
             cmd = f"import-route {protocol}"
             if metric:
@@ -2116,13 +2394,9 @@ class AdvancedOSPFManager:
         else:
             raise NetworkAutomationError(f"Unsupported device type: {self.device_type}")
         
-        return self.device.execute_config_commands(commands)
+        return device.execute_config_commands(commands)
     
-    def _mask_to_prefix(self, mask: str) -> int:
-        """Convert subnet mask to prefix length."""
-        mask_parts = mask.split('.')
-        binary = ''.join([bin(int(part))[2:].zfill(8) for part in mask_parts])
-        return binary.count('1')
+    _mask_to_prefix = staticmethod(_mask_prefix_length)
 
 
 # Create alias for backward compatibility
@@ -2132,6 +2406,8 @@ OSPFManager = AdvancedOSPFManager
 class EVPNManager:
     """EVPN configuration operations for Huawei devices."""
     
+    __slots__ = ('device', 'device_type')
+    
     def __init__(self, device_manager: NetworkDeviceManager):
         self.device = device_manager
         self.device_type = device_manager.device_params['device_type']
@@ -2142,15 +2418,10 @@ class EVPNManager:
     def configure_evpn_instance(self, evpn_instance: str, route_distinguisher: str, 
                               export_rt: str, import_rt: str) -> str:
         """Configure EVPN instance."""
-        commands = [
-            f"evpn vpn-instance {evpn_instance} bd-mode",
-            f"route-distinguisher {route_distinguisher}",
-            f"vpn-target {export_rt} export-extcommunity",
-            f"vpn-target {import_rt} import-extcommunity",
-            "quit"
-        ]
+        params = {'ei': evpn_instance, 'rd': route_distinguisher, 'ert': export_rt, 'irt': import_rt}
+        commands = [t.format_map(params) for t in _HUAWEI_EVPN_INST_TMPL]
         
-        return self.device.execute_config_commands(commands)
+        return self.device.execute_config_commands_bulk(commands)
     
     def configure_bgp_evpn(self, as_number: int, neighbor_ip: str, source_interface: str = None) -> str:
         """Configure BGP EVPN address family."""
@@ -2162,18 +2433,9 @@ class EVPNManager:
         if source_interface:
             commands.append(f"peer {neighbor_ip} connect-interface {source_interface}")
         
-        commands.extend([
-            "ipv4-family unicast",
-            f"undo peer {neighbor_ip} enable",
-            "quit",
-            "l2vpn-family evpn",
-            f"peer {neighbor_ip} enable",
-            f"peer {neighbor_ip} advertise-community",
-            "quit",
-            "quit"
-        ])
+        commands.extend(t.format_map({'peer': neighbor_ip}) for t in _HUAWEI_BGP_EVPN_AF_TMPL)
         
-        return self.device.execute_config_commands(commands)
+        return self.device.execute_config_commands_bulk(commands)
     
     def configure_vbdif_interface(self, vbdif_id: int, ip_address: str, mask: str, 
                                  bridge_domain: int) -> str:
@@ -2188,7 +2450,7 @@ class EVPNManager:
             "quit"
         ]
         
-        return self.device.execute_config_commands(commands)
+        return self.device.execute_config_commands_bulk(commands)
     
     def configure_bridge_domain(self, bd_id: int, evpn_instance: str = None) -> str:
         """Configure Bridge Domain for EVPN."""
@@ -2201,7 +2463,7 @@ class EVPNManager:
             "quit"
         ])
         
-        return self.device.execute_config_commands(commands)
+        return self.device.execute_config_commands_bulk(commands)
     
     def configure_evpn_ethernet_segment(self, interface: str, esi: str, df_election: str = 'mod') -> str:
         """Configure EVPN Ethernet Segment Identifier."""
@@ -2212,18 +2474,16 @@ class EVPNManager:
             "quit"
         ]
         
-        return self.device.execute_config_commands(commands)
+        return self.device.execute_config_commands_bulk(commands)
     
-    def _mask_to_prefix(self, mask: str) -> int:
-        """Convert subnet mask to prefix length."""
-        mask_parts = mask.split('.')
-        binary = ''.join([bin(int(part))[2:].zfill(8) for part in mask_parts])
-        return binary.count('1')
+    _mask_to_prefix = staticmethod(_mask_prefix_length)
 
 
 class VXLANManager:
     """VXLAN configuration operations for Huawei devices."""
     
+    __slots__ = ('device', 'device_type')
+    
     def __init__(self, device_manager: NetworkDeviceManager):
         self.device = device_manager
         self.device_type = device_manager.device_params['device_type']
@@ -2234,17 +2494,10 @@ class VXLANManager:
     def configure_vxlan_tunnel(self, tunnel_id: int, source_ip: str, destination_ip: str, 
                              vni: int) -> str:
         """Configure VXLAN tunnel interface."""
-        commands = [
-            f"interface Tunnel{tunnel_id}",
-            "tunnel-protocol vxlan",
-            f"source {source_ip}",
-            f"destination {destination_ip}",
-            f"vxlan vni {vni}",
-            "undo shutdown",
-            "quit"
-        ]
+        payload = _VXLAN_TUNNEL_TMPL % (int(tunnel_id), source_ip.encode('utf-8'),
+                                        destination_ip.encode('utf-8'), int(vni))
         
-        return self.device.execute_config_commands(commands)
+        return self.device.execute_config_commands_bytes(payload)
     
     def configure_nve_interface(self, nve_id: int, source_ip: str, vni_mapping: dict = None) -> str:
         """Configure NVE (Network Virtualization Edge) interface."""
@@ -2257,39 +2510,26 @@ class VXLANManager:
             for vni, bd_id in vni_mapping.items():
                 commands.append(f"vni {vni} l2-vni {bd_id}")
         
-        commands.extend([
-            "undo shutdown",
-            "quit"
-        ])
+        commands.extend(_HUAWEI_IFACE_TAIL)
         
-        return self.device.execute_config_commands(commands)
+        return self.device.execute_config_commands_bulk(commands)
     
     def configure_vxlan_bd_binding(self, bd_id: int, vni: int, nve_interface: int) -> str:
         """Bind Bridge Domain to VNI."""
-        commands = [
-            f"bridge-domain {bd_id}",
-            f"vxlan vni {vni}",
-            f"vxlan binding nve {nve_interface}",
-            "quit"
-        ]
+        payload = _VXLAN_BD_BINDING_TMPL % (int(bd_id), int(vni), int(nve_interface))
         
-        return self.device.execute_config_commands(commands)
+        return self.device.execute_config_commands_bytes(payload)
     
     def configure_vxlan_access_port(self, interface: str, bd_id: int) -> str:
         """Configure interface as VXLAN access port."""
-        commands = [
-            f"interface {interface}",
-            "portswitch",
-            f"bridge-domain {bd_id}",
-            "undo shutdown",
-            "quit"
-        ]
+        payload = _VXLAN_ACCESS_PORT_TMPL % (interface.encode('utf-8'), int(bd_id))
         
-        return self.device.execute_config_commands(commands)
+        return self.device.execute_config_commands_bytes(payload)
     
     def configure_vxlan_gateway(self, bd_id: int, gateway_ip: str, mask: str, 
                               vbdif_id: int = None) -> str:
         """Configure VXLAN gateway."""
+        device = self.device
         if not vbdif_id:
             vbdif_id = bd_id
         
@@ -2311,25 +2551,26 @@ class VXLANManager:
             "quit"
         ]
         
-        return (self.device.execute_config_commands(bd_commands) + "\n" + 
-                self.device.execute_config_commands(vbdif_commands))
+        return (device.execute_config_commands_bulk(bd_commands) + "\n" + 
+                device.execute_config_commands_bulk(vbdif_commands))
     
-    def _mask_to_prefix(self, mask: str) -> int:
-        """Convert subnet mask to prefix length."""
-        mask_parts = mask.split('.')
-        binary = ''.join([bin(int(part))[2:].zfill(8) for part in mask_parts])
-        return binary.count('1')
+    _mask_to_prefix = staticmethod(_mask_prefix_length)
 
 
 class DataCenterFabricManager:
     """Comprehensive DataCenter Fabric automation for Huawei EVPN VXLAN spine-leaf architecture."""
     
+    __slots__ = ('device', 'device_type', '_last_success_ts')
+    
     def __init__(self, device_manager: NetworkDeviceManager):
         self.device = device_manager
         self.device_type = device_manager.device_params['device_type']
         
         if 'huawei' not in self.device_type:
             raise NetworkAutomationError("DataCenter Fabric configuration is only supported on Huawei devices")
+        
+        # Last time a chunk went through; health probes are skipped while the session is fresh
+        self._last_success_ts = time.monotonic()
     
     def _ensure_evpn_overlay(self) -> str:
         """Ensure EVPN overlay feature is enabled and EVPN view initialized."""
@@ -2356,27 +2597,17 @@ class DataCenterFabricManager:
             ]
             
             for cmd, description in test_commands:
-                try:
-                    result = self.device.execute_command(cmd)
-                    if result and len(result.strip()) > 5:
-                        logger.info(f"✓ {description}: PASSED ({len(result)} chars)")
-                        validation_results.append(True)
-                    else:
-                        logger.warning(f"✗ {description}: FAILED - Minimal output: '{result[:50]}'")
-                        validation_results.append(False)
-                except Exception as e:
-                    logger.warning(f"✗ {description}: FAILED - {e}")
-                    validation_results.append(False)
+                validation_results.append(self._check_display_command(cmd, description, 5))
             
             # Test 2: Configuration mode access
             try:
                 logger.info("Testing system-view access...")
                 result = self.device.execute_command("system-view")
                 if "Error" in result or "Unrecognized" in result:
-                    logger.warning(f"✗ System-view test: FAILED - {result[:100]}")
+                    logger.warning("✗ System-view test: FAILED - %s", result[:100])
                     validation_results.append(False)
                 else:
-                    logger.info(f"✓ System-view test: PASSED")
+                    logger.info("✓ System-view test: PASSED")
                     validation_results.append(True)
                 
                 # Try to exit cleanly
@@ -2386,30 +2617,21 @@ class DataCenterFabricManager:
                     pass
                     
             except Exception as e:
-                logger.warning(f"✗ System-view test: FAILED - {e}")
+                logger.warning("✗ System-view test: FAILED - %s", e)
                 validation_results.append(False)
             
             # Test 3: Interface command syntax
-            try:
-                logger.info("Testing interface command syntax...")
-                # Test with a common interface that should exist
-                result = self.device.execute_command("display interface brief")
-                if result and len(result) > 20:
-                    logger.info(f"✓ Interface command test: PASSED")
-                    validation_results.append(True)
-                else:
-                    logger.warning(f"✗ Interface command test: FAILED - {result[:50]}")
-                    validation_results.append(False)
-            except Exception as e:
-                logger.warning(f"✗ Interface command test: FAILED - {e}")
-                validation_results.append(False)
+            logger.info("Testing interface command syntax...")
+            validation_results.append(
+                self._check_display_command("display interface brief", "Interface command test", 20)
+            )
             
             # Summarize results
             passed = sum(validation_results)
             total = len(validation_results)
             success_rate = (passed / total) * 100 if total > 0 else 0
             
-            logger.info(f"Device validation summary: {passed}/{total} tests passed ({success_rate:.1f}%)")
+            logger.info("Device validation summary: %s/%s tests passed (%.1f%%)", passed, total, success_rate)
             
             if strict:
                 # All tests must pass for strict validation
@@ -2419,7 +2641,20 @@ class DataCenterFabricManager:
                 return success_rate >= 50
                 
         except Exception as e:
-            logger.error(f"Device validation failed with exception: {e}")
+            logger.error("Device validation failed with exception: %s", e)
+            return False
+    
+    def _check_display_command(self, cmd: str, description: str, min_length: int) -> bool:
+        """Run one read-only validation command and report whether it returned real output."""
+        try:
+            result = self.device.execute_command(cmd)
+            if result and len(result.strip()) > min_length:
+                logger.info("✓ %s: PASSED (%s chars)", description, len(result))
+                return True
+            logger.warning("✗ %s: FAILED - Minimal output: '%s'", description, (result or '')[:50])
+            return False
+        except Exception as e:
+            logger.warning("✗ %s: FAILED - %s", description, e)
             return False
     
     def diagnose_device_connectivity(self) -> str:
@@ -2450,7 +2685,7 @@ class DataCenterFabricManager:
                 if result and len(result.strip()) > 0:
                     diagnostics.append(f"✓ '{cmd}': SUCCESS ({len(result)} chars)")
                     # Show first line of output for context
-                    first_line = result.strip().split('\n')[0][:60]
+                    first_line = result.strip().partition('\n')[0][:60]
                     diagnostics.append(f"  Output preview: {first_line}")
                 else:
                     diagnostics.append(f"✗ '{cmd}': FAILED - No output")
@@ -2492,13 +2727,13 @@ class DataCenterFabricManager:
         total_chunks = (len(commands) - 1) // chunk_size + 1
         failed_chunks = 0
         
-        logger.info(f"Executing {len(commands)} commands in {total_chunks} chunks of {chunk_size}")
+        logger.info("Executing %s commands in %s chunks of %s", len(commands), total_chunks, chunk_size)
         
         for i in range(0, len(commands), chunk_size):
             chunk = commands[i:i + chunk_size]
             chunk_num = i // chunk_size + 1
             
-            logger.info(f"Processing chunk {chunk_num}/{total_chunks} ({len(chunk)} commands)")
+            logger.info("Processing chunk %s/%s (%s commands)", chunk_num, total_chunks, len(chunk))
             
             # Try chunk execution with multiple attempts and connection recovery
             chunk_success = False
@@ -2506,42 +2741,43 @@ class DataCenterFabricManager:
             
             for attempt in range(max_chunk_retries):
                 try:
-                    # Check and restore connection before each chunk (especially after failures)
-                    if attempt > 0 or failed_chunks > 0:
-                        logger.info(f"Checking connection health before chunk {chunk_num}, attempt {attempt + 1}")
+                    # Check and restore connection after a failure or once the session has idled
+                    if attempt > 0 or time.monotonic() - self._last_success_ts > 30:
+                        logger.info("Checking connection health before chunk %s, attempt %s", chunk_num, attempt + 1)
                         if not self.device._check_connection_health():
-                            logger.warning(f"Connection unhealthy, attempting to reconnect for chunk {chunk_num}")
+                            logger.warning("Connection unhealthy, attempting to reconnect for chunk %s", chunk_num)
                             self.device._reconnect_if_needed()
                             # Give device time to stabilize after reconnection
                             time.sleep(2)
                     
-                    result = self.device.execute_config_commands(chunk)
+                    result = self.device.execute_config_commands_bulk(chunk)
                     results.append(f"--- CHUNK {chunk_num} ---\n{result}")
                     chunk_success = True
-                    logger.info(f"Chunk {chunk_num} completed successfully")
+                    self._last_success_ts = time.monotonic()
+                    logger.info("Chunk %s completed successfully", chunk_num)
                     break
                     
                 except Exception as e:
-                    error_str = str(e).lower()
-                    if ('socket is closed' in error_str or 'connection' in error_str or 
-                        'broken pipe' in error_str) and attempt < max_chunk_retries - 1:
-                        logger.warning(f"Chunk {chunk_num} attempt {attempt + 1} failed with connection error: {e}. Retrying...")
+                    # A chunk that already reached the device is never resent
+                    if (not isinstance(e, ConfigSentError) and _CONN_ERR_RE.search(str(e))
+                            and attempt < max_chunk_retries - 1):
+                        logger.warning("Chunk %s attempt %s failed with connection error: %s. Retrying...", chunk_num, attempt + 1, e)
                         time.sleep(2)  # Longer pause before retry
                         continue
                     else:
-                        logger.error(f"Chunk {chunk_num} failed after {attempt + 1} attempts: {e}")
+                        logger.error("Chunk %s failed after %s attempts: %s", chunk_num, attempt + 1, e)
                         results.append(f"--- CHUNK {chunk_num} FAILED ---\nError: {e}")
                         break
             
             if not chunk_success:
                 failed_chunks += 1
-                logger.warning(f"Chunk {chunk_num} could not be completed after {max_chunk_retries} attempts")
+                logger.warning("Chunk %s could not be completed after %s attempts", chunk_num, max_chunk_retries)
                 # Try to reconnect for next chunk
                 try:
                     logger.info("Attempting connection recovery for next chunk...")
                     self.device._reconnect_if_needed()
                 except Exception as reconnect_error:
-                    logger.error(f"Connection recovery failed: {reconnect_error}")
+                    logger.error("Connection recovery failed: %s", reconnect_error)
             
             # Pause between chunks to let the device process and recover
             if chunk_num < total_chunks:
@@ -2550,50 +2786,111 @@ class DataCenterFabricManager:
                 failure_penalty = min(failed_chunks * 0.5, 3)  # Up to 3 extra seconds for failures
                 pause_time = base_pause + failure_penalty
                 
-                logger.info(f"Pausing {pause_time:.1f}s before next chunk (base: {base_pause}s, failure penalty: {failure_penalty:.1f}s)...")
+                logger.info("Pausing %.1fs before next chunk (base: %ss, failure penalty: %.1fs)...", pause_time, base_pause, failure_penalty)
                 time.sleep(pause_time)
-                
-                # Periodic connection health check every 5 chunks
-                if chunk_num % 5 == 0:
-                    logger.info(f"Periodic connection health check after chunk {chunk_num}")
-                    if not self.device._check_connection_health():
-                        logger.warning("Periodic health check failed, preemptively reconnecting")
-                        try:
-                            self.device._reconnect_if_needed()
-                        except Exception as e:
-                            logger.warning(f"Preemptive reconnection failed: {e}")
         
         success_rate = ((total_chunks - failed_chunks) / total_chunks) * 100
         summary = f"\n\n=== EXECUTION SUMMARY ===\nTotal chunks: {total_chunks}\nSuccessful: {total_chunks - failed_chunks}\nFailed: {failed_chunks}\nSuccess rate: {success_rate:.1f}%"
         
         return "\n\n".join(results) + summary
     
+    def _iter_ospf_underlay(self, router_id: str, nets: list):
+        """Yield the OSPF area 0 section advertising the /30 links and the loopback."""
+        yield f"ospf 1 router-id {router_id}"  # Single-line to avoid context flip
+        yield "ospf 1"
+        yield "area 0.0.0.0"
+        for net_ip in nets:
+            yield f"network {net_ip} 0.0.0.3"
+        # Advertise loopback as host
+        yield f"network {router_id} 0.0.0.0"
+        # Exit area and OSPF view
+        yield "quit"
+        yield "quit"
+    
+    def _iter_spine_bgp(self, router_id: str, as_number: int, links_sorted: list):
+        """Yield the spine BGP section with one EVPN reflect-client block per link."""
+        yield f"bgp {as_number}"
+        yield f"router-id {router_id}"
+        if not links_sorted:
+            # No links provided: just exit BGP view cleanly
+            yield "quit"
+            return
+        
+        # Create external group and add peers to it
+        yield "group spine-leaf-evpn external"
+        for link in links_sorted:
+            peer_ip = link.get('peer_loopback_ip') or f"10.255.254.{link.get('peer_device_id', 1)}"
+            peer_as = link.get('peer_as') or as_number
+            yield from (
+                "undo default ipv4-unicast",
+                f"peer {peer_ip} as-number {peer_as}",
+                f"peer {peer_ip} connect-interface LoopBack0",
+                f"peer {peer_ip} ebgp-max-hop 2",
+                f"peer {peer_ip} group spine-leaf-evpn",
+                "l2vpn-family evpn",
+                f"peer {peer_ip} enable",
+                f"peer {peer_ip} advertise-community",
+                f"peer {peer_ip} reflect-client",
+                "quit",
+                f"bgp {as_number}"
+            )
+    
+    def _iter_leaf_bgp_peers(self, as_number: int, links_sorted: list, spine_interfaces: list,
+                             spine_peer_as_numbers: list = None):
+        """Yield the leaf BGP section peering with every spine loopback for EVPN."""
+        yield f"bgp {as_number}"
+        if links_sorted:
+            # links_sorted is already ordered by link_index; read peer and ASN in the same pass
+            yield from chain.from_iterable(
+                _leaf_peer_block(link.get('peer_loopback_ip'), link.get('peer_as', as_number))
+                for link in links_sorted
+            )
+        else:
+            spine_loopbacks = self._get_spine_loopbacks(spine_interfaces)
+            # Spines without an explicit ASN fall back to the local AS; zip trims the padding
+            as_fill = [*(spine_peer_as_numbers or ()), *[as_number] * len(spine_loopbacks)]
+            for spine_ip, remote_as in zip(spine_loopbacks, as_fill):
+                yield from (
+                    f"peer {spine_ip} as-number {remote_as}",
+                    f"peer {spine_ip} connect-interface LoopBack0",
+                    f"peer {spine_ip} ebgp-max-hop 2",
+                    "l2vpn-family evpn",
+                    f"peer {spine_ip} enable",
+                    f"peer {spine_ip} advertise-community",
+                )
+    
     def configure_spine_underlay(self, router_id: str, as_number: int, spine_interfaces: list,
                                 spine_ip_range: str = "10.0.0.0/30",
                                 underlay_links: list = None) -> str:
         """Configure spine switch underlay (BGP + OSPF) on Huawei."""
-        commands = []
-        
-        # Configure OSPF for underlay (router id and area, then network statements)
-        commands.extend([
-            f"ospf 1 router-id {router_id}",  # Single-line to avoid context flip
-            "ospf 1",
-            "area 0.0.0.0"
-        ])
-        
-        # Add /30 underlay networks and loopback to area 0
-        if underlay_links:
-            for link in sorted(underlay_links, key=lambda x: x['link_index']):
-                net_ip = self._calculate_link_network(spine_ip_range, link['link_index'] - 1)
-                commands.append(f"network {net_ip} 0.0.0.3")
+        device = self.device
+        # Sort links once and precompute the (network, host) /30 table for every index used
+        links_sorted = sorted(underlay_links, key=itemgetter('link_index')) if underlay_links else []
+        if links_sorted:
+            table_size = max(link['link_index'] for link in links_sorted)
         else:
-            for idx, interface in enumerate(spine_interfaces):
-                net_ip = self._calculate_link_network(spine_ip_range, idx)
-                commands.append(f"network {net_ip} 0.0.0.3")
-        # Advertise loopback as host
-        commands.append(f"network {router_id} 0.0.0.0")
-        # Exit area and OSPF view
-        commands.extend(["quit", "quit"])
+            table_size = len(spine_interfaces)
+        ip_table = _underlay_ip_table(spine_ip_range, table_size, 1)
+        
+        # /30 underlay networks and the matching spine interface addressing
+        if links_sorted:
+            nets = [ip_table[link['link_index'] - 1][0] for link in links_sorted]
+            blocks = [
+                (f"interface {self._normalize_huawei_interface(link['local_interface'])}",
+                 "undo portswitch",
+                 f"ip address {ip_table[link['link_index'] - 1][1]} 255.255.255.252",
+                 *_HUAWEI_IFACE_TAIL)
+                for link in links_sorted
+            ]
+        else:
+            nets = [net_ip for net_ip, _ in ip_table]
+            blocks = [
+                (f"interface {self._normalize_huawei_interface(interface)}",
+                 "undo portswitch",
+                 f"ip address {ip_table[idx][1]} 255.255.255.252",
+                 *_HUAWEI_IFACE_TAIL)
+                for idx, interface in enumerate(spine_interfaces)
+            ]
         
         # Ensure EVPN overlay is enabled before BGP EVPN
         try:
@@ -2601,83 +2898,17 @@ class DataCenterFabricManager:
         except Exception:
             pass
         
-        commands.extend([
-            "interface LoopBack0",
-            f"ip address {router_id} 255.255.255.255",
-            "quit"
-        ])
-        # Configure base BGP on spine
-        commands.extend([
-            f"bgp {as_number}",
-            f"router-id {router_id}",
-        ])
-        
-           # Configure loopback address (no shutdown command on LoopBack)
-        
-        # If links provided, create external group and add peers to it
-        if underlay_links:
-            peer_as = link.get('peer_as') or as_number
-            commands.extend([
-                "group spine-leaf-evpn external"
-            ])
-            for link in sorted(underlay_links, key=lambda x: x['link_index']):
-                peer_ip = link.get('peer_loopback_ip') or f"10.255.254.{link.get('peer_device_id', 1)}"
-                peer_as = link.get('peer_as') or as_number
-                commands.extend([
-                    "undo default ipv4-unicast",
-                    f"peer {peer_ip} as-number {peer_as}",
-                    f"peer {peer_ip} connect-interface LoopBack0",
-                    f"peer {peer_ip} ebgp-max-hop 2",
-                    f"peer {peer_ip} group spine-leaf-evpn",
-                    "l2vpn-family evpn",
-                    f"peer {peer_ip} enable",
-                    f"peer {peer_ip} advertise-community",
-                    f"peer {peer_ip} reflect-client",
-                    "quit",
-                    f"bgp {as_number}"
-                ])
-            # EVPN settings for the group
-          ##     "l2vpn-family evpn",
-            #    "peer spine-leaf-evpn enable",
-            #   "peer spine-leaf-evpn advertise-community",
-             #   "peer spine-leaf-evpn reflect-client",
-              #  "quit",
-               # "quit"
-            #])
-        else:
-            # No links provided: just exit BGP view cleanly
-            commands.extend(["quit"])
-        
-      
-        
-        # Configure spine interfaces with IP addressing and enable
-        if underlay_links:
-            for link in sorted(underlay_links, key=lambda x: x['link_index']):
-                base_ip = self._calculate_spine_ip(spine_ip_range, link['link_index'] - 1)
-                iface = self._normalize_huawei_interface(link['local_interface'])
-                commands.extend([
-                    f"interface {iface}",
-                    "undo portswitch",
-                    f"ip address {base_ip} 255.255.255.252",
-                    "undo shutdown",
-                    "quit"
-                ])
-        else:
-            for idx, interface in enumerate(spine_interfaces):
-                base_ip = self._calculate_spine_ip(spine_ip_range, idx)
-                iface = self._normalize_huawei_interface(interface)
-                commands.extend([
-                    f"interface {iface}",
-                    "undo portswitch",
-                    f"ip address {base_ip} 255.255.255.252",
-                    "undo shutdown",
-                    "quit"
-                ])
-        
-       
+        # Stream every section through one chain so the batch is materialized once
+        commands = list(chain(
+            self._iter_ospf_underlay(router_id, nets),
+            # Configure loopback address (no shutdown command on LoopBack)
+            ("interface LoopBack0", f"ip address {router_id} 255.255.255.255", "quit"),
+            self._iter_spine_bgp(router_id, as_number, links_sorted),
+            chain.from_iterable(blocks),
+        ))
         
         # Execute all commands in a single batch to preserve context
-        return self.device.execute_config_commands(commands)
+        return device.execute_config_commands_bulk(commands)
     
     def configure_leaf_underlay(self, router_id: str, as_number: int, spine_interfaces: list,
                                leaf_id: int, spine_ip_range: str = "10.0.0.0/30",
@@ -2691,25 +2922,38 @@ class DataCenterFabricManager:
         uplink_spine_indices: optional list mapping each uplink interface to the target spine
         index (1-based) as ordered in the spine list; drives deterministic /30 selection.
         """
-        commands = []
-        
-        # OSPF: set router id, area, and advertise networks
-        commands.extend([
-            f"ospf 1 router-id {router_id}",
-            "ospf 1",
-            "area 0.0.0.0"
-        ])
-        if underlay_links:
-            for link in sorted(underlay_links, key=lambda x: x['link_index']):
-                net_ip = self._calculate_link_network(spine_ip_range, link['link_index'] - 1)
-                commands.append(f"network {net_ip} 0.0.0.3")
+        device = self.device
+        # Sort links once and precompute the (network, leaf host) /30 table for every index used
+        links_sorted = sorted(underlay_links, key=itemgetter('link_index')) if underlay_links else []
+        if links_sorted:
+            table_size = max(link['link_index'] for link in links_sorted)
         else:
-            for idx, interface in enumerate(spine_interfaces):
-                net_index = (uplink_spine_indices[idx] - 1) if (uplink_spine_indices and idx < len(uplink_spine_indices)) else idx
-                net_ip = self._calculate_link_network(spine_ip_range, net_index)
-                commands.append(f"network {net_ip} 0.0.0.3")
-        commands.append(f"network {router_id} 0.0.0.0")
-        commands.extend(["quit", "quit"])
+            table_size = max([len(spine_interfaces)] + list(uplink_spine_indices or []))
+        ip_table = _underlay_ip_table(spine_ip_range, table_size, 2)
+        
+        # /30 underlay networks and leaf uplink interfaces to spines (L3 addressing)
+        if links_sorted:
+            nets = [ip_table[link['link_index'] - 1][0] for link in links_sorted]
+            blocks = [
+                (f"interface {self._normalize_huawei_interface(link['local_interface'])}",
+                 "undo portswitch",
+                 f"ip address {ip_table[link['link_index'] - 1][1]} 255.255.255.252",
+                 *_HUAWEI_IFACE_TAIL)
+                for link in links_sorted
+            ]
+        else:
+            # Explicit spine index per uplink where given, positional index for the rest
+            uplink_count = len(spine_interfaces)
+            mapped = [i - 1 for i in (uplink_spine_indices or ())[:uplink_count]]
+            net_indices = mapped + list(range(len(mapped), uplink_count))
+            nets = [ip_table[net_index][0] for net_index in net_indices]
+            blocks = [
+                (f"interface {self._normalize_huawei_interface(interface)}",
+                 "undo portswitch",
+                 f"ip address {ip_table[net_index][1]} 255.255.255.252",
+                 *_HUAWEI_IFACE_TAIL)
+                for interface, net_index in zip(spine_interfaces, net_indices)
+            ]
         
         # Ensure EVPN overlay is enabled before BGP EVPN
         try:
@@ -2717,299 +2961,160 @@ class DataCenterFabricManager:
         except Exception:
             pass
         
-        # BGP base with external group definition (stay in BGP view)
-        commands.extend([
-            f"bgp {as_number}",
-            f"router-id {router_id}",
-            "group spine-leaf-evpn external"
-        ])
-        
-        # Configure loopback interface
-        commands.extend([
-            "interface LoopBack0",
-            f"ip address {router_id} 255.255.255.255",
-            "undo shutdown",
-            "quit",
-            "interface nve1",
-            f"source {router_id}",
-            "quit"
-        ])
-        
-        # Configure leaf uplink interfaces to spines (L3 addressing)
-        if underlay_links:
-            for link in sorted(underlay_links, key=lambda x: x['link_index']):
-                net_index = link['link_index'] - 1
-                peer_ip = self._calculate_leaf_ip(spine_ip_range, leaf_id, net_index)
-                iface = self._normalize_huawei_interface(link['local_interface'])
-                commands.extend([
-                    f"interface {iface}",
-                    "undo portswitch",
-                    f"ip address {peer_ip} 255.255.255.252",
-                    "undo shutdown",
-                    "quit"
-                ])
-        else:
-            for idx, interface in enumerate(spine_interfaces):
-                net_index = (uplink_spine_indices[idx] - 1) if (uplink_spine_indices and idx < len(uplink_spine_indices)) else idx
-                peer_ip = self._calculate_leaf_ip(spine_ip_range, leaf_id, net_index)
-                iface = self._normalize_huawei_interface(interface)
-                commands.extend([
-                    f"interface {iface}",
-                    "undo portswitch",
-                    f"ip address {peer_ip} 255.255.255.252",
-                    "undo shutdown",
-                    "quit"
-                ])
-        
-        # Add spine peers to BGP for EVPN (assign to external group)
-        if underlay_links:
-            peers = [l.get('peer_loopback_ip') for l in sorted(underlay_links, key=lambda x: x['link_index'])]
-            peer_ases = [l.get('peer_as', as_number) for l in sorted(underlay_links, key=lambda x: x['link_index'])]
-            commands.extend([f"bgp {as_number}"])
-            for spine_ip, remote_as in zip(peers, peer_ases):
-                commands.extend([
-                    "undo default ipv4-unicast",
-                    f"peer {spine_ip} as-number {remote_as}",
-                    f"peer {spine_ip} connect-interface LoopBack0",
-                    f"peer {spine_ip} ebgp-max-hop 2",
-                    "l2vpn-family evpn",
-                    f"peer {spine_ip} enable",
-                    f"peer {spine_ip} advertise-community",
-                    "quit",
-                ])
-            # EVPN group enable
-          #  commands.extend([
-           #     "l2vpn-family evpn",
-            #    "peer spine-leaf-evpn enable",
-             #   "peer spine-leaf-evpn advertise-community",
-              #  "quit",
-            #])
-        else:
-            spine_loopbacks = self._get_spine_loopbacks(spine_interfaces)
-            commands.extend([f"bgp {as_number}"])
-            for idx, spine_ip in enumerate(spine_loopbacks):
-                remote_as = (spine_peer_as_numbers[idx]
-                             if spine_peer_as_numbers and idx < len(spine_peer_as_numbers)
-                             else as_number)
-                commands.extend([
-                    f"peer {spine_ip} as-number {remote_as}",
-                    f"peer {spine_ip} connect-interface LoopBack0",
-                    f"peer {spine_ip} ebgp-max-hop 2",
-                    f"l2vpn-family evpn",
-                    f"peer {spine_ip} enable",
-                    f"peer {spine_ip} advertise-community",
-                ])
+        # Stream every section through one chain so the batch is materialized once
+        commands = list(chain(
+            self._iter_ospf_underlay(router_id, nets),
+            # BGP base with external group definition (stay in BGP view)
+            (f"bgp {as_number}", f"router-id {router_id}", "group spine-leaf-evpn external"),
+            # Loopback and NVE source interface
+            ("interface LoopBack0", f"ip address {router_id} 255.255.255.255", "undo shutdown", "quit",
+             "interface nve1", f"source {router_id}", "quit"),
+            chain.from_iterable(blocks),
+            # Spine peers in BGP for EVPN
+            self._iter_leaf_bgp_peers(as_number, links_sorted, spine_interfaces, spine_peer_as_numbers),
+        ))
         
         # Execute in one go to preserve contexts
-        return self.device.execute_config_commands(commands)
+        return device.execute_config_commands_bulk(commands)
     
     def deploy_tenant_network(self, tenant_name: str, vni: int, vlan_id: int,
                             gateway_ip: str, subnet_mask: str, 
                             access_interfaces: list = None, 
                             route_target: str = None) -> str:
         """Deploy a complete tenant network with EVPN VXLAN."""
+        return self.device.execute_config_commands_bulk(self._build_tenant_network_commands(
+            tenant_name, vni, vlan_id, gateway_ip, subnet_mask, access_interfaces, route_target
+        ))
+    
+    def _build_tenant_network_commands(self, tenant_name: str, vni: int, vlan_id: int,
+                                       gateway_ip: str, subnet_mask: str,
+                                       access_interfaces: list = None,
+                                       route_target: str = None) -> list:
+        """Build the bridge-domain, NVE, VBDIF and access-port commands for one tenant network."""
         if not route_target:
             route_target = f"65000:{vni}"
         
         prefix_length = self._mask_to_prefix(subnet_mask)
         
-        commands = [
-            # Create EVPN instance
-          #  f"evpn vpn-instance {tenant_name} bd-mode",
-           # f"route-distinguisher auto",
-          #  f"vpn-target {route_target} export-extcommunity",
-           # f"vpn-target {route_target} import-extcommunity",
-          #  "quit",
-            
-            # Create bridge domain
-            f"bridge-domain {vlan_id}",
-            f"vxlan vni {vni}",
-            "arp broadcast-suppress enable",
-            "evpn",
-            f"route-distinguisher auto",
-            f"vpn-target {route_target} export-extcommunity",
-            f"vpn-target {route_target} import-extcommunity",
-            "quit",
-            
-            # Create VLAN
-            #f"vlan {vlan_id}",
-            #f"description {tenant_name}_VLAN",
-           # "quit",
-            
-            # Configure NVE interface (assuming NVE1 exists)
-            "interface Nve1",
-            f"vni {vni} head-end peer-list protocol bgp",
-            "quit",
-            
-            # Create VBDIF for gateway
-            f"interface Vbdif{vlan_id}",
-            f"ip address {gateway_ip} {prefix_length}",
-            f"bridge-domain {vlan_id}",
-            "arp broadcast-suppress enable",
-            "undo shutdown",
-            "quit"
+        rendered = [
+            _TENANT_VBDIF_TMPL.format(vlan_id=vlan_id, gateway_ip=gateway_ip,
+                                      prefix_length=prefix_length),
         ]
         
         # Configure access interfaces if provided
         if access_interfaces:
-            for interface in access_interfaces:
-                commands.extend([
-                    f"interface {interface}",
-                    "portswitch",
-                    "port link-type trunk",
-                    "quit",
-                    f"interface {interface}.{vlan_id} mode l2",
-                    f"encapsulation dot1q vid {vlan_id}",
-                    f"bridge-domain {vlan_id}",
-                    "undo shutdown",
-                    "quit"
-                ])
+            rendered.extend(_TENANT_ACCESS_TMPL.format(iface=interface, vlan_id=vlan_id)
+                            for interface in access_interfaces)
         
-        return self.device.execute_config_commands(commands)
+        return [*self._tenant_bd_block(vni, vlan_id, route_target), *"\n".join(rendered).split("\n")]
     
     def deploy_multi_tenant_configuration(self, fabric_name: str, tenant_networks: list) -> str:
         """Deploy multiple tenant networks with EVPN VXLAN configuration."""
-        commands = []
-        results = []
+        results = io.StringIO()
         
         # Add fabric description
-        commands.extend([
+        commands = [
             f"# Multi-Tenant Deployment for Fabric: {fabric_name}",
             f"# Deploying {len(tenant_networks)} tenant networks"
-        ])
+        ]
         
         # Process each tenant network
         for tenant in tenant_networks:
-            tenant_name = tenant.get('name')
-            vni = tenant.get('vni')
-            vlan_id = tenant.get('vlan_id')
-            gateway_ip = tenant.get('gateway_ip')
-            subnet_mask = tenant.get('subnet_mask')
+            # Only absent/null/empty values count as missing, so VLAN or VNI 0 is accepted
+            try:
+                required = _TENANT_REQUIRED(tenant)
+            except KeyError:
+                required = None
+            if required is None or any(value is None or value == '' for value in required):
+                error_msg = f"Missing required parameters for tenant {tenant.get('name')}"
+                results.write(f"ERROR: {error_msg}\n")
+                continue
+            
+            tenant_name, vni, vlan_id, gateway_ip, subnet_mask = required
             access_interfaces = tenant.get('access_interfaces', [])
             route_target = tenant.get('route_target', f"65000:{vni}")
             advertise_external = tenant.get('advertise_external', False)
             
-            if not all([tenant_name, vni, vlan_id, gateway_ip, subnet_mask]):
-                error_msg = f"Missing required parameters for tenant {tenant_name}"
-                results.append(f"ERROR: {error_msg}")
-                continue
-            
             # Generate commands for this tenant
             tenant_commands = self._generate_tenant_commands(
                 tenant_name, vni, vlan_id, gateway_ip, 
                 subnet_mask, access_interfaces, route_target
             )
             
-            commands.extend(tenant_commands)
-            results.append(f"✓ Configured tenant: {tenant_name} (VNI: {vni}, VLAN: {vlan_id})")
+            commands += tenant_commands
+            results.write(f"✓ Configured tenant: {tenant_name} (VNI: {vni}, VLAN: {vlan_id})\n")
             
             # Configure external advertisement if requested
             if advertise_external:
                 ext_commands = self._generate_external_advertisement_commands(
                     tenant_name, vni, route_target
                 )
-                commands.extend(ext_commands)
-                results.append(f"✓ Configured external advertisement for: {tenant_name}")
+                commands += ext_commands
+                results.write(f"✓ Configured external advertisement for: {tenant_name}\n")
         
-        # Execute all commands in one batch for efficiency
+        # Send every tenant's commands in a single channel write
         try:
-            output = self.device.execute_config_commands(commands)
-            results.append(f"\n=== Configuration Summary ===")
-            results.append(f"Fabric: {fabric_name}")
-            results.append(f"Total Tenants: {len(tenant_networks)}")
-            results.append(f"Commands Executed: {len(commands)}")
-            return "\n".join(results) + f"\n\n=== Device Output ===\n{output}"
+            output = self.device.execute_config_commands_bulk(commands)
+            results.write("\n=== Configuration Summary ===\n")
+            results.write(f"Fabric: {fabric_name}\n")
+            results.write(f"Total Tenants: {len(tenant_networks)}\n")
+            results.write(f"Commands Executed: {len(commands)}\n")
+            results.write("\n=== Device Output ===\n")
+            results.write(output)
+            return results.getvalue()
             
         except Exception as e:
             error_msg = f"Failed to deploy multi-tenant configuration: {str(e)}"
-            results.append(f"ERROR: {error_msg}")
-            return "\n".join(results)
+            results.write(f"ERROR: {error_msg}")
+            return results.getvalue()
     
     def _generate_tenant_commands(self, tenant_name: str, vni: int, vlan_id: int,
                                  gateway_ip: str, subnet_mask: str, 
                                  access_interfaces: list = None, 
                                  route_target: str = None) -> list:
         """Generate configuration commands for a single tenant network."""
-        prefix_length = self._mask_to_prefix(subnet_mask)
+        commands = [f"# Tenant: {tenant_name} Configuration", *self._tenant_bd_block(vni, vlan_id, route_target)]
         
-        commands = [
-            f"# Tenant: {tenant_name} Configuration",
-            
-            # Create bridge domain
+        # Configure access interfaces if provided
+        if access_interfaces:
+            commands += "\n".join(_TENANT_ACCESS_TMPL.format(iface=interface, vlan_id=vlan_id)
+                                  for interface in access_interfaces).split("\n")
+        
+        return commands
+    
+    @staticmethod
+    def _tenant_bd_block(vni: int, vlan_id: int, route_target: str) -> tuple:
+        """Bridge domain with EVPN route targets plus the NVE head-end peer list for one VNI."""
+        return (
             f"bridge-domain {vlan_id}",
             f"vxlan vni {vni}",
-            "arp broadcast-suppress enable",
-            "evpn",
-            f"route-distinguisher auto",
+            *_TENANT_EVPN_PREFIX,
             f"vpn-target {route_target} export-extcommunity",
             f"vpn-target {route_target} import-extcommunity",
             "quit",
-            
-            # Create VLAN
-           # f"vlan {vlan_id}",
-           # f"description {tenant_name}_VLAN",
-           # "quit",
-            
-            # Configure NVE interface
             "interface Nve1",
             f"vni {vni} head-end peer-list protocol bgp",
             "quit",
-            
-            # Create VBDIF for gateway
-         #   f"interface Vbdif{vlan_id}",
-         #   f"ip address {gateway_ip} {prefix_length}",
-         #   f"bridge-domain {vlan_id}",
-         #   "arp broadcast-suppress enable",
-         #   "undo shutdown",
-          #  "quit"
-        ]
-        
-        # Configure access interfaces if provided
-        if access_interfaces:
-            for interface in access_interfaces:
-                commands.extend([
-                    f"interface {interface}",
-                    "portswitch",
-                    "port link-type trunk",
-                    "quit",
-                    f"interface {interface}.{vlan_id} mode l2",
-                    f"encapsulation dot1q vid {vlan_id}",
-                    f"bridge-domain {vlan_id}",
-                    "undo shutdown",
-                    "quit"
-                ])
-        
-        return commands
+        )
     
     def _generate_external_advertisement_commands(self, tenant_name: str, vni: int, route_target: str) -> list:
         """Generate commands for external advertisement of tenant networks."""
-        commands = [
-            f"# External Advertisement for {tenant_name}",
-            "bgp 65000",
-            "l2vpn-family evpn",
-            f"vpn-target {route_target} export-extcommunity",
-            f"vpn-target {route_target} import-extcommunity",
-            "quit",
-            "quit"
-        ]
-        return commands
+        return _TENANT_EXT_ADV_TMPL.format(tenant_name=tenant_name, rt=route_target).split("\n")
     
     def configure_external_connectivity(self, border_leaf_config: dict) -> str:
         """Configure external connectivity for tenant networks (DCI/WAN)."""
-        commands = []
-        
         # Configure VRF for external connectivity
         vrf_name = border_leaf_config.get('vrf_name', 'EXTERNAL_VRF')
         rd = border_leaf_config.get('rd', 'auto')
         rt = border_leaf_config.get('rt', '65000:999')
         
-        commands.extend([
+        commands = [
             f"ip vpn-instance {vrf_name}",
             f"route-distinguisher {rd}",
             f"vpn-target {rt} export-extcommunity",
             f"vpn-target {rt} import-extcommunity",
             "quit"
-        ])
+        ]
         
         # Configure external interface
         ext_interface = border_leaf_config.get('external_interface')
@@ -3018,13 +3123,12 @@ class DataCenterFabricManager:
         
         if ext_interface and ext_ip and ext_mask:
             prefix_length = self._mask_to_prefix(ext_mask)
-            commands.extend([
+            commands += (
                 f"interface {ext_interface}",
                 f"ip binding vpn-instance {vrf_name}",
                 f"ip address {ext_ip} {prefix_length}",
-                "undo shutdown",
-                "quit"
-            ])
+                *_HUAWEI_IFACE_TAIL
+            )
         
         # Configure BGP for external advertisement
         as_number = border_leaf_config.get('as_number', 65000)
@@ -3032,13 +3136,13 @@ class DataCenterFabricManager:
         external_as = border_leaf_config.get('external_as')
         
         if external_peer and external_as:
-            commands.extend([
+            commands += (
                 f"bgp {as_number}",
                 f"ipv4-family vpn-instance {vrf_name}",
                 f"peer {external_peer} as-number {external_as}",
                 "quit",
                 "quit"
-            ])
+            )
         
         return self.device.execute_config_commands(commands)
     
@@ -3060,26 +3164,27 @@ class DataCenterFabricManager:
                     "quit"
                 ])
                 
-                # Configure route leaking if needed
+                # Configure route leaking if needed (one import block per advertised network)
                 tenant_networks_to_advertise = tenant.get('networks', [])
-                for network in tenant_networks_to_advertise:
-                    commands.extend([
+                if tenant_networks_to_advertise:
+                    rt = tenant.get('rt', f"65000:{tenant.get('vni', 10000)}")
+                    leak_block = (
                         f"ip vpn-instance {external_vrf}",
-                        f"import route-target {tenant.get('rt', f'65000:{tenant.get("vni", 10000)}')} policy TENANT_TO_EXTERNAL",
+                        f"import route-target {rt} policy TENANT_TO_EXTERNAL",
                         "quit"
-                    ])
+                    )
+                    commands += chain.from_iterable(repeat(leak_block, len(tenant_networks_to_advertise)))
         
         return self.device.execute_config_commands(commands)
     
-    def deploy_full_fabric_configuration(self, fabric_config: dict) -> str:
-        """Deploy complete datacenter fabric with all tenant networks."""
-        from .models import FabricDeployment, Device
-        
-        # Check if validation should be skipped
-        skip_validation = fabric_config.get('skip_validation', False)
+    def _maybe_validate(self, skip_validation: bool = False) -> None:
+        """Validate the session before a fabric deploy, once per host per process.
+        Raises NetworkAutomationError when even the minimal display version check fails.
+        """
+        device_host = self.device.device_params.get('host')
         
-        if not skip_validation:
-            # First validate the device connection and basic functionality
+        if not skip_validation and device_host not in _validated_devices:
+            # First validate device connection and basic functionality
             logger.info("Running device validation (set 'skip_validation': true to bypass)...")
             if not self._validate_huawei_connection(strict=False):
                 logger.warning("Device validation failed with lenient checks")
@@ -3102,8 +3207,17 @@ class DataCenterFabricManager:
                     )
             else:
                 logger.info("Device validation passed successfully")
+            _validated_devices.add(device_host)
+        elif not skip_validation:
+            logger.info("Device %s already validated in this process", device_host)
         else:
             logger.warning("Device validation SKIPPED - proceeding without validation checks")
+    
+    def deploy_full_fabric_configuration(self, fabric_config: dict) -> str:
+        """Deploy complete datacenter fabric with all tenant networks."""
+        from .models import FabricDeployment, Device
+        
+        self._maybe_validate(fabric_config.get('skip_validation', False))
         
         device_role = fabric_config.get('device_role')  # 'spine' or 'leaf'
         device_id = fabric_config.get('device_id', 1)
@@ -3111,14 +3225,14 @@ class DataCenterFabricManager:
         fabric_name = fabric_config.get('fabric_name', 'DefaultFabric')
         current_device_id = fabric_config.get('current_device_id')
         
-        logger.info(f"Full fabric deployment: {device_role} ID {device_id} for fabric {fabric_name}")
+        logger.info("Full fabric deployment: %s ID %s for fabric %s", device_role, device_id, fabric_name)
         
         # Get or create fabric deployment record
         try:
             fabric_deployment = FabricDeployment.objects.get(fabric_name=fabric_name)
-            logger.info(f"Found existing fabric: {fabric_name}")
+            logger.info("Found existing fabric: %s", fabric_name)
         except FabricDeployment.DoesNotExist:
-            logger.info(f"Fabric '{fabric_name}' not found, creating new fabric...")
+            logger.info("Fabric '%s' not found, creating new fabric...", fabric_name)
             # Create new fabric deployment if it doesn't exist
             from django.contrib.auth.models import User
             system_user = User.objects.first()
@@ -3140,52 +3254,32 @@ class DataCenterFabricManager:
         try:
             current_device = Device.objects.get(id=current_device_id)
         except Device.DoesNotExist:
-            logger.warning(f"Device with ID {current_device_id} not found, fabric tracking disabled")
+            logger.warning("Device with ID %s not found, fabric tracking disabled", current_device_id)
             # Fallback: deploy without fabric tracking
             return self._fallback_single_switch_deployment(fabric_config)
         
-        result = ""
+        result = io.StringIO()
+        # Member entries to add to the fabric row once the switch is configured
+        changes = []
         
         if device_role == 'spine':
             # Use loopback_ip from form, fallback to auto-generated
             router_id = fabric_config.get('loopback_ip') or f"10.255.255.{device_id}"
             spine_interfaces = fabric_config.get('spine_interfaces', [])
             spine_ip_range = fabric_config.get('underlay_ip_range', '10.0.0.0/30')
-            result = self.configure_spine_underlay(
+            result.write(self.configure_spine_underlay(
                 router_id, as_number, spine_interfaces, spine_ip_range,
                 fabric_config.get('underlay_links')
-            )
+            ))
             
-            # Update fabric deployment with this spine
-            try:
-                spine_devices = fabric_deployment.spine_devices or []
-                logger.info(f"Current spine devices: {spine_devices}")
-                
-                # Check if device already exists
-                device_exists = False
-                for d in spine_devices:
-                    if isinstance(d, dict) and d.get('id') == current_device.id:
-                        device_exists = True
-                        break
-                
-                if not device_exists:
-                    spine_devices = spine_devices.copy()
-                    new_spine = {
-                        'id': current_device.id,
-                        'name': current_device.name,
-                        'device_id': device_id,
-                        'router_id': router_id,
-                        'configured_at': timezone.now().isoformat()
-                    }
-                    spine_devices.append(new_spine)
-                    fabric_deployment.spine_devices = spine_devices
-                    logger.info(f"Added spine {current_device.name} to fabric: {new_spine}")
-                else:
-                    logger.info(f"Spine {current_device.name} already exists in fabric")
-            except Exception as e:
-                logger.error(f"Error updating spine devices: {e}")
-                import traceback
-                traceback.print_exc()
+            # Add this spine to the fabric unless it is already a member
+            changes.append(('spine_devices', 'id', {
+                'id': current_device.id,
+                'name': current_device.name,
+                'device_id': device_id,
+                'router_id': router_id,
+                'configured_at': timezone.now().isoformat()
+            }, False))
         
         elif device_role == 'leaf' or device_role == 'border_leaf':
             # Use loopback_ip from form, fallback to auto-generated
@@ -3195,86 +3289,34 @@ class DataCenterFabricManager:
             spine_ip_range = fabric_config.get('underlay_ip_range', '10.0.0.0/30')
             
             # Configure underlay
-            result = self.configure_leaf_underlay(
+            result.write(self.configure_leaf_underlay(
                 router_id, as_number, spine_interfaces, device_id, spine_ip_range,
                 fabric_config.get('spine_peer_as_numbers'),
                 fabric_config.get('uplink_spine_indices'),
                 fabric_config.get('underlay_links')
-            )
+            ))
             
             # Configure NVE interface
             nve_config = fabric_config.get('nve_config', {})
             if nve_config:
-                nve_commands = [
-                    "interface Nve1",
-                    f"source {router_id}",
-                    "undo shutdown",
-                    "quit"
-                ]
-                result += "\n" + self.device.execute_config_commands(nve_commands)
-            
-            # Update fabric deployment with this leaf
-            try:
-                if device_role == 'leaf':
-                    leaf_devices = fabric_deployment.leaf_devices or []
-                    logger.info(f"Current leaf devices: {leaf_devices}")
-                    
-                    # Check if device already exists
-                    device_exists = False
-                    for d in leaf_devices:
-                        if isinstance(d, dict) and d.get('id') == current_device.id:
-                            device_exists = True
-                            break
-                    
-                    if not device_exists:
-                        leaf_devices = leaf_devices.copy()
-                        new_leaf = {
-                            'id': current_device.id,
-                            'name': current_device.name,
-                            'device_id': device_id,
-                            'router_id': router_id,
-                            'configured_at': timezone.now().isoformat()
-                        }
-                        leaf_devices.append(new_leaf)
-                        fabric_deployment.leaf_devices = leaf_devices
-                        logger.info(f"Added leaf {current_device.name} to fabric: {new_leaf}")
-                    else:
-                        logger.info(f"Leaf {current_device.name} already exists in fabric")
-                        
-                else:  # border_leaf
-                    border_leaf_devices = fabric_deployment.border_leaf_devices or []
-                    logger.info(f"Current border leaf devices: {border_leaf_devices}")
-                    
-                    # Check if device already exists
-                    device_exists = False
-                    for d in border_leaf_devices:
-                        if isinstance(d, dict) and d.get('id') == current_device.id:
-                            device_exists = True
-                            break
-                    
-                    if not device_exists:
-                        border_leaf_devices = border_leaf_devices.copy()
-                        new_border_leaf = {
-                            'id': current_device.id,
-                            'name': current_device.name,
-                            'device_id': device_id,
-                            'router_id': router_id,
-                            'configured_at': timezone.now().isoformat()
-                        }
-                        border_leaf_devices.append(new_border_leaf)
-                        fabric_deployment.border_leaf_devices = border_leaf_devices
-                        logger.info(f"Added border leaf {current_device.name} to fabric: {new_border_leaf}")
-                    else:
-                        logger.info(f"Border leaf {current_device.name} already exists in fabric")
-            except Exception as e:
-                logger.error(f"Error updating leaf/border leaf devices: {e}")
-                import traceback
-                traceback.print_exc()
+                nve_commands = ["interface Nve1", f"source {router_id}", *_HUAWEI_IFACE_TAIL]
+                result.write("\n")
+                result.write(self.device.execute_config_commands(nve_commands))
+            
+            # Add this leaf or border leaf to the fabric unless it is already a member
+            changes.append((_FABRIC_ROLE_FIELD[device_role], 'id', {
+                'id': current_device.id,
+                'name': current_device.name,
+                'device_id': device_id,
+                'router_id': router_id,
+                'configured_at': timezone.now().isoformat()
+            }, False))
             
-            # Deploy tenant networks
+            # Deploy tenant networks, collecting every tenant into one configuration batch
             tenant_networks = fabric_config.get('tenant_networks', [])
+            tenant_commands = []
             for tenant in tenant_networks:
-                tenant_result = self.deploy_tenant_network(
+                tenant_commands += self._build_tenant_network_commands(
                     tenant['name'],
                     tenant['vni'],
                     tenant['vlan_id'],
@@ -3282,39 +3324,20 @@ class DataCenterFabricManager:
                     tenant['subnet_mask'],
                     tenant.get('access_interfaces', [])
                 )
-                result += "\n" + tenant_result
                 
-                # Update fabric deployment with tenant network
-                try:
-                    tenant_networks_list = fabric_deployment.tenant_networks or []
-                    logger.info(f"Current tenant networks: {tenant_networks_list}")
-                    
-                    # Check if tenant network already exists
-                    network_exists = False
-                    for t in tenant_networks_list:
-                        if isinstance(t, dict) and t.get('vni') == tenant['vni']:
-                            network_exists = True
-                            break
-                    
-                    if not network_exists:
-                        tenant_networks_list = tenant_networks_list.copy()
-                        new_tenant = {
-                            'name': tenant['name'],
-                            'vni': tenant['vni'],
-                            'vlan_id': tenant['vlan_id'],
-                            'gateway_ip': tenant['gateway_ip'],
-                            'subnet_mask': tenant['subnet_mask'],
-                            'created_at': timezone.now().isoformat()
-                        }
-                        tenant_networks_list.append(new_tenant)
-                        fabric_deployment.tenant_networks = tenant_networks_list
-                        logger.info(f"Added tenant network {tenant['name']} to fabric: {new_tenant}")
-                    else:
-                        logger.info(f"Tenant network {tenant['name']} already exists in fabric")
-                except Exception as e:
-                    logger.error(f"Error updating tenant networks: {e}")
-                    import traceback
-                    traceback.print_exc()
+                # Record the tenant network in the fabric unless its VNI is already there
+                changes.append(('tenant_networks', 'vni', {
+                    'name': tenant['name'],
+                    'vni': tenant['vni'],
+                    'vlan_id': tenant['vlan_id'],
+                    'gateway_ip': tenant['gateway_ip'],
+                    'subnet_mask': tenant['subnet_mask'],
+                    'created_at': timezone.now().isoformat()
+                }, False))
+            
+            if tenant_commands:
+                result.write("\n")
+                result.write(self.device.execute_config_commands(tenant_commands))
             
             # Configure external connectivity if this is a border leaf
             if device_role == 'border_leaf':
@@ -3326,69 +3349,46 @@ class DataCenterFabricManager:
                     'rt': '65000:999'
                 }
                 external_result = self.configure_external_connectivity(external_config)
-                result += "\n\n--- EXTERNAL CONNECTIVITY ---\n" + external_result
+                result.write("\n\n--- EXTERNAL CONNECTIVITY ---\n")
+                result.write(external_result)
         
-        # Save fabric deployment with all updates
-        fabric_deployment.save()
-        logger.info(f"Saved fabric deployment {fabric_name} with all device updates")
+        # Apply this deploy's additions to the locked fabric row, the same way single-switch deploys do
+        _apply_fabric_changes(fabric_deployment, changes)
+        logger.info("Saved fabric deployment %s with all device updates", fabric_name)
         
         # Add deployment summary
-        summary = f"\n\n=== FABRIC DEPLOYMENT SUMMARY ===\n"
-        summary += f"Fabric Name: {fabric_name}\n"
-        summary += f"Device Role: {device_role}\n"
-        summary += f"Device Name: {current_device.name}\n"
-        summary += f"Device ID: {device_id}\n"
-        summary += f"Router ID: {router_id}\n"
-        summary += f"AS Number: {as_number}\n"
-        summary += f"Total Spines in Fabric: {len(fabric_deployment.spine_devices)}\n"
-        summary += f"Total Leaves in Fabric: {len(fabric_deployment.leaf_devices)}\n"
-        summary += f"Total Border Leaves in Fabric: {len(fabric_deployment.border_leaf_devices)}\n"
-        summary += f"Total Tenant Networks: {len(fabric_deployment.tenant_networks)}\n"
+        summary = "\n".join([
+            "\n\n=== FABRIC DEPLOYMENT SUMMARY ===",
+            f"Fabric Name: {fabric_name}",
+            f"Device Role: {device_role}",
+            f"Device Name: {current_device.name}",
+            f"Device ID: {device_id}",
+            f"Router ID: {router_id}",
+            f"AS Number: {as_number}",
+            f"Total Spines in Fabric: {len(fabric_deployment.spine_devices)}",
+            f"Total Leaves in Fabric: {len(fabric_deployment.leaf_devices)}",
+            f"Total Border Leaves in Fabric: {len(fabric_deployment.border_leaf_devices)}",
+            f"Total Tenant Networks: {len(fabric_deployment.tenant_networks)}",
+            "",
+        ])
         
-        return result + summary
+        result.write(summary)
+        return result.getvalue()
     
     def deploy_single_switch_to_fabric(self, fabric_config: dict) -> str:
         """Deploy a single switch to an existing fabric with proper peer configuration."""
         from .models import FabricDeployment, Device
         
-        logger.info(f"Starting single switch deployment with config: {fabric_config}")
-        
-        # Check if validation should be skipped
-        skip_validation = fabric_config.get('skip_validation', False)
+        logger.info("Starting single switch deployment with config: %s", fabric_config)
         
-        if not skip_validation:
-            # First validate device connection and basic functionality
-            logger.info("Running device validation (set 'skip_validation': true to bypass)...")
-            if not self._validate_huawei_connection(strict=False):
-                logger.warning("Device validation failed with lenient checks")
-                logger.info("Attempting with minimal validation...")
-                
-                # Try one more basic test
-                try:
-                    result = self.device.execute_command("display version")
-                    if not result or len(result.strip()) < 10:
-                        raise NetworkAutomationError(
-                            "Device validation failed - cannot execute basic commands. "
-                            "Check device connectivity and credentials. "
-                            "You can bypass validation by adding 'skip_validation': true to fabric_config."
-                        )
-                    logger.info("Minimal validation passed, proceeding with configuration...")
-                except Exception as e:
-                    raise NetworkAutomationError(
-                        f"Device validation failed: {e}. "
-                        "You can bypass validation by adding 'skip_validation': true to fabric_config."
-                    )
-            else:
-                logger.info("Device validation passed successfully")
-        else:
-            logger.warning("Device validation SKIPPED - proceeding without validation checks")
+        self._maybe_validate(fabric_config.get('skip_validation', False))
         
         device_role = fabric_config.get('device_role')  # 'spine' or 'leaf'
         device_id = fabric_config.get('device_id', 1)
         as_number = fabric_config.get('as_number', 65000)
         fabric_name = fabric_config.get('fabric_name')
         
-        logger.info(f"Device role: {device_role}, Device ID: {device_id}, AS: {as_number}, Fabric: {fabric_name}")
+        logger.info("Device role: %s, Device ID: %s, AS: %s, Fabric: %s", device_role, device_id, as_number, fabric_name)
         
         if not fabric_name:
             raise NetworkAutomationError("fabric_name is required for single switch deployment")
@@ -3396,9 +3396,9 @@ class DataCenterFabricManager:
         # Get fabric deployment record
         try:
             fabric_deployment = FabricDeployment.objects.get(fabric_name=fabric_name)
-            logger.info(f"Found existing fabric: {fabric_name}")
+            logger.info("Found existing fabric: %s", fabric_name)
         except FabricDeployment.DoesNotExist:
-            logger.info(f"Fabric '{fabric_name}' not found, creating new fabric...")
+            logger.info("Fabric '%s' not found, creating new fabric...", fabric_name)
             # Create new fabric deployment if it doesn't exist
             from django.contrib.auth.models import User
             # Get first user or create a system user
@@ -3412,7 +3412,7 @@ class DataCenterFabricManager:
                 created_by=system_user
             )
         except Exception as e:
-            logger.error(f"Error with fabric deployment: {e}")
+            logger.error("Error with fabric deployment: %s", e)
             # Fallback: Create a simple deployment without fabric tracking
             logger.info("Using fallback deployment without fabric tracking...")
             return self._fallback_single_switch_deployment(fabric_config)
@@ -3450,10 +3450,7 @@ class DataCenterFabricManager:
             }
             
             # Add or update spine in fabric
-            fabric_deployment.spine_devices = [
-                s for s in fabric_deployment.spine_devices 
-                if s['device_id'] != current_device_id
-            ] + [spine_config]
+            member = spine_config
             
         elif device_role == 'leaf' or device_role == 'border_leaf':
             # Use loopback_ip from form, fallback to auto-generated
@@ -3484,18 +3481,14 @@ class DataCenterFabricManager:
             # Configure NVE interface
             nve_config = fabric_config.get('nve_config', {})
             if nve_config:
-                nve_commands = [
-                    "interface Nve1",
-                    f"source {router_id}",
-                    "undo shutdown",
-                    "quit"
-                ]
+                nve_commands = ["interface Nve1", f"source {router_id}", *_HUAWEI_IFACE_TAIL]
                 result += "\n" + self.device.execute_config_commands(nve_commands)
             
-            # Deploy tenant networks from fabric
+            # Deploy tenant networks from fabric in a single configuration batch
             tenant_networks = fabric_deployment.tenant_networks
+            tenant_commands = []
             for tenant in tenant_networks:
-                tenant_result = self.deploy_tenant_network(
+                tenant_commands += self._build_tenant_network_commands(
                     tenant['name'],
                     tenant['vni'],
                     tenant['vlan_id'],
@@ -3503,7 +3496,8 @@ class DataCenterFabricManager:
                     tenant['subnet_mask'],
                     tenant.get('access_interfaces', [])
                 )
-                result += "\n" + tenant_result
+            if tenant_commands:
+                result += "\n" + self.device.execute_config_commands(tenant_commands)
             
             # Configure external connectivity if this is a border leaf
             if device_role == 'border_leaf':
@@ -3529,34 +3523,28 @@ class DataCenterFabricManager:
             }
             
             # Add or update leaf in appropriate list
-            if device_role == 'border_leaf':
-                fabric_deployment.border_leaf_devices = [
-                    bl for bl in fabric_deployment.border_leaf_devices 
-                    if bl['device_id'] != current_device_id
-                ] + [leaf_config]
-            else:
-                fabric_deployment.leaf_devices = [
-                    l for l in fabric_deployment.leaf_devices 
-                    if l['device_id'] != current_device_id
-                ] + [leaf_config]
+            member = leaf_config
         
         else:
             raise NetworkAutomationError(f"Unknown device role: {device_role}")
         
-        # Save fabric deployment updates
-        fabric_deployment.save()
+        # Upsert this switch into its role's list on the locked row, not the copy read above
+        _apply_fabric_changes(fabric_deployment, [(_FABRIC_ROLE_FIELD[device_role], 'device_id', member, True)])
         
         # Add configuration summary
-        summary = f"\n\n=== FABRIC DEPLOYMENT SUMMARY ===\n"
-        summary += f"Fabric: {fabric_name}\n"
-        summary += f"Device Role: {device_role}\n"
-        summary += f"Device ID: {device_id}\n"
-        summary += f"Router ID: {router_id}\n"
-        summary += f"AS Number: {as_number}\n"
-        summary += f"Total Spines in Fabric: {len(fabric_deployment.spine_devices)}\n"
-        summary += f"Total Leaves in Fabric: {len(fabric_deployment.leaf_devices)}\n"
-        summary += f"Total Border Leaves in Fabric: {len(fabric_deployment.border_leaf_devices)}\n"
-        summary += f"Total Tenant Networks: {len(fabric_deployment.tenant_networks)}\n"
+        summary = "\n".join([
+            "\n\n=== FABRIC DEPLOYMENT SUMMARY ===",
+            f"Fabric: {fabric_name}",
+            f"Device Role: {device_role}",
+            f"Device ID: {device_id}",
+            f"Router ID: {router_id}",
+            f"AS Number: {as_number}",
+            f"Total Spines in Fabric: {len(fabric_deployment.spine_devices)}",
+            f"Total Leaves in Fabric: {len(fabric_deployment.leaf_devices)}",
+            f"Total Border Leaves in Fabric: {len(fabric_deployment.border_leaf_devices)}",
+            f"Total Tenant Networks: {len(fabric_deployment.tenant_networks)}",
+            "",
+        ])
         
         return result + summary
     
@@ -3569,7 +3557,7 @@ class DataCenterFabricManager:
         spine_interfaces = fabric_config.get('spine_interfaces', [])
         underlay_ip_range = fabric_config.get('underlay_ip_range', '10.0.0.0/30')
         
-        logger.info(f"Fallback deployment: {device_role} with {len(spine_interfaces)} interfaces")
+        logger.info("Fallback deployment: %s with %s interfaces", device_role, len(spine_interfaces))
         
         # Generate configuration based on device role
         if device_role == 'spine':
@@ -3593,579 +3581,434 @@ class DataCenterFabricManager:
             raise NetworkAutomationError(f"Unknown device role: {device_role}")
         
         # Add fallback summary
-        summary = f"\n\n=== FALLBACK DEPLOYMENT SUMMARY ===\n"
-        summary += f"Device Role: {device_role}\n"
-        summary += f"Device ID: {device_id}\n"
-        summary += f"Router ID: {router_id}\n"
-        summary += f"AS Number: {as_number}\n"
-        summary += "Note: Fabric tracking disabled - using fallback mode\n"
+        summary = "\n".join([
+            "\n\n=== FALLBACK DEPLOYMENT SUMMARY ===",
+            f"Device Role: {device_role}",
+            f"Device ID: {device_id}",
+            f"Router ID: {router_id}",
+            f"AS Number: {as_number}",
+            "Note: Fabric tracking disabled - using fallback mode",
+            "",
+        ])
         
         return result + summary
     
     def _calculate_spine_ip(self, ip_range: str, interface_idx: int) -> str:
         """Calculate spine interface IP address."""
-        # Simple IP calculation - in production, use proper IP addressing library
-        base_ip = ip_range.split('/')[0]
-        octets = base_ip.split('.')
-        octets[3] = str(int(octets[3]) + (interface_idx * 4) + 1)
-        return '.'.join(octets)
+        return _link_addr(ip_range, interface_idx, 1)
     
     def _calculate_leaf_ip(self, ip_range: str, leaf_id: int, interface_idx: int) -> str:
         """Calculate leaf interface IP address."""
-        base_ip = ip_range.split('/')[0]
-        octets = base_ip.split('.')
-        octets[3] = str(int(octets[3]) + (interface_idx * 4) + 2)  # second usable in /30 for leaf
-        return '.'.join(octets)
+        return _link_addr(ip_range, interface_idx, 2)  # second usable in /30 for leaf
     
     def _get_spine_loopbacks(self, spine_interfaces: list) -> list:
         """Get spine loopback addresses for BGP peering."""
         # Return predefined spine loopbacks - in production, this would be dynamic
-        return [f"10.255.255.{i+1}" for i in range(len(spine_interfaces))]
+        return generate_ipv4_sequence("10.255.255.1", len(spine_interfaces))
     
     def _calculate_link_network(self, ip_range: str, interface_idx: int) -> str:
         """Calculate /30 network address for given link index based on base ip_range."""
-        base_ip = ip_range.split('/')[0]
-        octets = base_ip.split('.')
-        octets[3] = str(int(octets[3]) + (interface_idx * 4))
-        return '.'.join(octets)
+        return _link_addr(ip_range, interface_idx)
     
-    def _normalize_huawei_interface(self, name: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _normalize_huawei_interface(name: str) -> str:
         """Normalize Huawei interface names conservatively (keep GE as-is)."""
         n = name.strip()
-        if n.startswith('GE'):
+        m = _HUAWEI_IFACE_RE.match(n)
+        if not m:
+            return n
+        prefix, rest = m.groups()
+        if prefix == 'GE':
             return n  # Keep short GE naming which your device accepts
-        if n.startswith('XGE'):
-            return '10GE' + n[3:]
-        if n.lower().startswith('loopback'):
-            # Huawei uses LoopBack with capital B sometimes; accept both
-            return 'LoopBack' + n.split('loopback',1)[-1] if 'loopback' in n.lower() else n
-        return n
-    
-    def _mask_to_prefix(self, mask: str) -> int:
-        """Convert subnet mask to prefix length."""
-        mask_parts = mask.split('.')
-        binary = ''.join([bin(int(part))[2:].zfill(8) for part in mask_parts])
-        return binary.count('1')
+        if prefix == 'XGE':
+            return '10GE' + rest
+        # Huawei uses LoopBack with capital B; accept any spelling of loopback
+        return 'LoopBack' + rest
+    
+    _mask_to_prefix = staticmethod(_mask_prefix_length)
+
+
+
+def _run_interface_config(manager, p):
+    mode = p['mode']
+    if mode == 'access':
+        return manager.configure_access_port(p['interface'], p['vlan_id'])
+    if mode == 'trunk':
+        return manager.configure_trunk_port(p['interface'], p.get('allowed_vlans', 'all'))
+    if mode == 'ip':
+        return manager.configure_ip_address(p['interface'], p['ip_address'], p['subnet_mask'])
+    raise NetworkAutomationError(f"Unknown interface mode: {mode}")
+
+
+def _run_static_route(manager, p):
+    method = manager.remove_static_route if p.get('action') == 'remove' else manager.add_static_route
+    return method(p['network'], p['mask'], p['next_hop'], p.get('vrf_name'))
+
+
+def _run_static_route_v6(manager, p):
+    method = manager.remove_static_route_v6 if p.get('action') == 'remove' else manager.add_static_route_v6
+    return method(p['prefix'], p['next_hop'], p.get('vrf_name'))
+
 
+def _run_nve_interface(manager, p):
+    vni_mapping = p.get('vni_mapping') or p.get('vni_mappings')
+    if isinstance(vni_mapping, list):
+        # Entries without both keys are skipped rather than discarding the whole mapping
+        vni_mapping = {item['vni']: item['bridge_domain'] for item in vni_mapping
+                       if isinstance(item, dict) and 'vni' in item and 'bridge_domain' in item}
+    elif not isinstance(vni_mapping, dict):
+        vni_mapping = {}
+    return manager.configure_nve_interface(p['nve_id'], p['source_ip'], vni_mapping)
 
 
-def execute_network_task(device_params: Dict, task_type: str, parameters: Dict) -> Tuple[bool, str, str]:
+def _run_ae_config(manager, p):
+    result = manager.create_ae(p['ae_name'], p.get('members', []), p.get('lacp', True))
+    if p.get('ip_address') and p.get('prefix_length'):
+        result += ' ' + manager.configure_ae_unit(
+            p['ae_name'], p['unit'], p['ip_address'], p['prefix_length'], p.get('description')
+        )
+    return result
+
+
+def _run_single_switch_deploy(manager, p):
+    logger.debug("Deploying %s switch into fabric %s", p.get('device_role'), p.get('fabric_name'))
+    try:
+        return manager.deploy_single_switch_to_fabric(p)
+    except Exception:
+        logger.exception("Single switch deployment into fabric %s failed", p.get('fabric_name'))
+        raise
+
+
+# task_type -> (manager class, handler(manager, parameters)); one dict lookup per task
+TASK_DISPATCH = {
+    'vlan_create': (VLANManager, lambda m, p: m.create_vlan(p['vlan_id'], p.get('vlan_name'))),
+    'vlan_delete': (VLANManager, lambda m, p: m.delete_vlan(p['vlan_id'])),
+    'interface_config': (InterfaceManager, _run_interface_config),
+    'interface_ipv6': (InterfaceManager, lambda m, p: m.configure_ipv6_address(
+        p['interface'], p['ipv6_address'], p['prefix_length'])),
+    'vlan_interface_config': (InterfaceManager, lambda m, p: m.configure_vlan_interface(
+        p['vlan_id'], p['ip_address'], p['subnet_mask'], p.get('vrf_name'),
+        p.get('description'), p.get('enable_interface', True))),
+    'routing_static': (RoutingManager, _run_static_route),
+    'vlan_interface_ipv6': (InterfaceManager, lambda m, p: m.configure_vlan_interface_ipv6(
+        p['vlan_id'], p['ipv6_address'], p['prefix_length'], p.get('vrf_name'),
+        p.get('description'), p.get('enable_interface', True))),
+    'routing_ospf': (RoutingManager, lambda m, p: m.configure_ospf(
+        p['process_id'], p['router_id'], p['networks'], p.get('vrf_name'))),
+    'routing_static_v6': (RoutingManager, _run_static_route_v6),
+    'bgp_neighbor_v6': (BGPManager, lambda m, p: m.configure_bgp_neighbor_v6(
+        p['as_number'], p['neighbor_ip'], p['remote_as'], p.get('vrf_name'),
+        p.get('description'), p.get('source_interface'))),
+    'bgp_network_v6': (BGPManager, lambda m, p: m.advertise_network_v6(
+        p['as_number'], p['prefix'], p.get('vrf_name'))),
+    'routing_ospf_v6': (OSPFManager, lambda m, p: m.configure_ospf_v6(
+        p['process_id'], p['router_id'], p['interfaces'])),
+    'show_version': (DeviceInfoManager, lambda m, p: m.get_version()),
+    'show_interfaces': (InterfaceManager, lambda m, p: m.show_interfaces()),
+    'show_vlan': (VLANManager, lambda m, p: m.show_vlans()),
+    'show_routes': (RoutingManager, lambda m, p: m.show_routes(p.get('vrf_name'))),
+    'show_vrfs': (VRFManager, lambda m, p: m.show_vrfs()),
+    'backup_config': (DeviceInfoManager, lambda m, p: m.backup_config()),
+    # VRF tasks
+    'vrf_create': (VRFManager, lambda m, p: m.create_vrf(
+        p['vrf_name'], p.get('rd'), p.get('description'), p.get('import_rt'), p.get('export_rt'))),
+    'vrf_assign_interface': (VRFManager, lambda m, p: m.assign_vrf_to_interface(
+        p['interface'], p['vrf_name'], p.get('ip_address'), p.get('subnet_mask'))),
+    # BGP tasks
+    'bgp_neighbor': (BGPManager, lambda m, p: m.configure_bgp_neighbor(
+        p['as_number'], p['neighbor_ip'], p['remote_as'], p.get('vrf_name'), p.get('description'))),
+    'bgp_network': (BGPManager, lambda m, p: m.advertise_network(
+        p['as_number'], p['network'], p['mask'], p.get('vrf_name'))),
+    'bgp_vrf_config': (BGPManager, lambda m, p: m.configure_bgp_vrf(
+        p['as_number'], p['vrf_name'], p.get('router_id'), p.get('import_rt'), p.get('export_rt'))),
+    # Advanced BGP tasks
+    'bgp_route_reflector': (BGPManager, lambda m, p: m.configure_bgp_route_reflector(
+        p['as_number'], p['router_id'], p.get('cluster_id', 1), p.get('clients', []))),
+    'bgp_confederation': (BGPManager, lambda m, p: m.configure_bgp_confederation(
+        p['as_number'], p['confederation_id'], p.get('confederation_peers', []))),
+    'bgp_community': (BGPManager, lambda m, p: m.configure_bgp_community(
+        p['as_number'], p['community_list'], p.get('action', 'permit'))),
+    'bgp_route_map': (BGPManager, lambda m, p: m.configure_bgp_route_map(
+        p['as_number'], p['route_map'], p['neighbor_ip'], p.get('direction', 'in'))),
+    'bgp_multipath': (BGPManager, lambda m, p: m.configure_bgp_multipath(
+        p['as_number'], p.get('ebgp_paths', 4), p.get('ibgp_paths', 4))),
+    # Advanced OSPF tasks
+    'ospf_area': (OSPFManager, lambda m, p: m.configure_ospf_area(
+        p['process_id'], p['area_id'], p.get('area_type', 'standard'),
+        p.get('stub_default_cost'), p.get('nssa_default_route', False))),
+    'ospf_authentication': (OSPFManager, lambda m, p: m.configure_ospf_authentication(
+        p['process_id'], p.get('area_id'), p.get('interface'), p.get('auth_type', 'md5'),
+        p.get('key_id', 1), p.get('password', 'cisco123'))),
+    'ospf_redistribution': (OSPFManager, lambda m, p: m.configure_ospf_redistribution(
+        p['process_id'], p['protocol'], p.get('metric'), p.get('metric_type'), p.get('vrf_name'))),
+    # EVPN tasks
+    'evpn_instance': (JuniperEVPNManager, lambda m, p: m.create_evpn_instance(
+        p['instance_name'], p['vpls_id'], p.get('rd'), p.get('route_target'),
+        p.get('route_target_id'), p.get('encapsulation', 'mpls'),
+        p.get('replication_type', 'ingress'), p.get('description'))),
+    'bgp_evpn': (EVPNManager, lambda m, p: m.configure_bgp_evpn(
+        p['as_number'], p['neighbor_ip'], p.get('source_interface'))),
+    'vbdif_interface': (EVPNManager, lambda m, p: m.configure_vbdif_interface(
+        p['vbdif_id'], p['ip_address'], p['mask'], p['bridge_domain'])),
+    'bridge_domain': (JuniperEVPNManager, lambda m, p: m.add_bridge_domain_to_evpn(
+        p['instance_name'], p['bd_name'], p['vlan_id'], p.get('interface'), p.get('description'))),
+    'evpn_ethernet_segment': (EVPNManager, lambda m, p: m.configure_evpn_ethernet_segment(
+        p['interface'], p['esi'], p.get('df_election', 'mod'))),
+    # VXLAN tasks
+    'vxlan_tunnel': (VXLANManager, lambda m, p: m.configure_vxlan_tunnel(
+        p['tunnel_id'], p['source_ip'], p['destination_ip'], p['vni'])),
+    'nve_interface': (VXLANManager, _run_nve_interface),
+    'vxlan_bd_binding': (VXLANManager, lambda m, p: m.configure_vxlan_bd_binding(
+        p['bd_id'], p['vni'], p['nve_interface'])),
+    'vxlan_access_port': (VXLANManager, lambda m, p: m.configure_vxlan_access_port(
+        p['interface'], p.get('bd_id') or p.get('bridge_domain_id'))),
+    'vxlan_gateway': (VXLANManager, lambda m, p: m.configure_vxlan_gateway(
+        p.get('bd_id') or p.get('bridge_domain_id'), p['gateway_ip'],
+        p.get('mask') or p.get('subnet_mask'), p.get('vbdif_id'))),
+    # Datacenter Fabric tasks
+    'ae_config': (AEManager, _run_ae_config),
+    # EVPN/L2VPN task handlers
+    'l2vpws': (JuniperEVPNManager, lambda m, p: m.create_l2vpws(
+        p['service_name'], p['local_if'], p['remote_ip'], p['vc_id'], p.get('description'))),
+    'l2vpn_vpls': (JuniperEVPNManager, lambda m, p: m.create_l2vpn_vpls(
+        p['service_name'], p['vpls_id'], p.get('rd'), p.get('rt_both'), p.get('description'))),
+    # Parameters are passed straight through as fabric_config
+    'datacenter_fabric': (DataCenterFabricManager, lambda m, p: m.deploy_full_fabric_configuration(p)),
+    'datacenter_fabric_single': (DataCenterFabricManager, _run_single_switch_deploy),
+    'spine_underlay': (DataCenterFabricManager, lambda m, p: m.configure_spine_underlay(
+        p['router_id'], p['as_number'], p['spine_interfaces'], p.get('spine_ip_range', '10.0.0.0/30'))),
+    'leaf_underlay': (DataCenterFabricManager, lambda m, p: m.configure_leaf_underlay(
+        p['router_id'], p['as_number'], p['spine_interfaces'], p['leaf_id'])),
+    'tenant_network': (DataCenterFabricManager, lambda m, p: m.deploy_tenant_network(
+        p['tenant_name'], p['vni'], p['vlan_id'], p['gateway_ip'], p['subnet_mask'],
+        p.get('access_interfaces', []), p.get('route_target'))),
+    'external_connectivity': (DataCenterFabricManager, lambda m, p: m.configure_external_connectivity(
+        p['border_leaf_config'])),
+    'device_diagnostics': (DataCenterFabricManager, lambda m, p: m.diagnose_device_connectivity()),
+    'multi_tenant_deployment': (DataCenterFabricManager, lambda m, p: m.deploy_multi_tenant_configuration(
+        p['fabric_name'], p['tenant_networks'])),
+}
+
+
+# task_type -> parameters every run of that task reads unconditionally; checked before connecting
+TASK_REQUIRED_PARAMS = {
+    'vlan_create': ('vlan_id',),
+    'vlan_delete': ('vlan_id',),
+    'interface_config': ('mode', 'interface'),
+    'interface_ipv6': ('interface', 'ipv6_address', 'prefix_length'),
+    'vlan_interface_config': ('vlan_id', 'ip_address', 'subnet_mask'),
+    'routing_static': ('network', 'mask', 'next_hop'),
+    'vlan_interface_ipv6': ('vlan_id', 'ipv6_address', 'prefix_length'),
+    'routing_ospf': ('process_id', 'router_id', 'networks'),
+    'routing_static_v6': ('prefix', 'next_hop'),
+    'bgp_neighbor_v6': ('as_number', 'neighbor_ip', 'remote_as'),
+    'bgp_network_v6': ('as_number', 'prefix'),
+    'routing_ospf_v6': ('process_id', 'router_id', 'interfaces'),
+    'vrf_create': ('vrf_name',),
+    'vrf_assign_interface': ('interface', 'vrf_name'),
+    'bgp_neighbor': ('as_number', 'neighbor_ip', 'remote_as'),
+    'bgp_network': ('as_number', 'network', 'mask'),
+    'bgp_vrf_config': ('as_number', 'vrf_name'),
+    'bgp_route_reflector': ('as_number', 'router_id'),
+    'bgp_confederation': ('as_number', 'confederation_id'),
+    'bgp_community': ('as_number', 'community_list'),
+    'bgp_route_map': ('as_number', 'route_map', 'neighbor_ip'),
+    'bgp_multipath': ('as_number',),
+    'ospf_area': ('process_id', 'area_id'),
+    'ospf_authentication': ('process_id',),
+    'ospf_redistribution': ('process_id', 'protocol'),
+    'evpn_instance': ('instance_name', 'vpls_id'),
+    'bgp_evpn': ('as_number', 'neighbor_ip'),
+    'vbdif_interface': ('vbdif_id', 'ip_address', 'mask', 'bridge_domain'),
+    'bridge_domain': ('instance_name', 'bd_name', 'vlan_id'),
+    'evpn_ethernet_segment': ('interface', 'esi'),
+    'vxlan_tunnel': ('tunnel_id', 'source_ip', 'destination_ip', 'vni'),
+    'nve_interface': ('nve_id', 'source_ip'),
+    'vxlan_bd_binding': ('bd_id', 'vni', 'nve_interface'),
+    'vxlan_access_port': ('interface',),
+    'vxlan_gateway': ('gateway_ip',),
+    'ae_config': ('ae_name',),
+    'l2vpws': ('service_name', 'local_if', 'remote_ip', 'vc_id'),
+    'l2vpn_vpls': ('service_name', 'vpls_id'),
+    'spine_underlay': ('router_id', 'as_number', 'spine_interfaces'),
+    'leaf_underlay': ('router_id', 'as_number', 'spine_interfaces', 'leaf_id'),
+    'tenant_network': ('tenant_name', 'vni', 'vlan_id', 'gateway_ip', 'subnet_mask'),
+    'external_connectivity': ('border_leaf_config',),
+    'multi_tenant_deployment': ('fabric_name', 'tenant_networks'),
+}
+
+
+class _SessionPool:
+    """
+    Keeps connected NetworkDeviceManager sessions between tasks, keyed by host, port, credentials
+    and device_type, so a session is only handed to a caller that would have opened the same one.
+    A session is owned by one caller between acquire() and release(). A daemon thread closes
+    sessions left idle past the TTL, and close_all() closes the rest at interpreter exit.
+    """
+    
+    _KEY_FIELDS = ('host', 'port', 'username', 'password', 'device_type')
+    
+    def __init__(self, ttl: float = 300, reap_interval: float = 30):
+        self._ttl = ttl
+        self._reap_interval = reap_interval
+        self._lock = threading.Lock()
+        self._idle = {}  # key -> (NetworkDeviceManager, expiry)
+        self._reaper = None
+        self._closed = False
+    
+    @classmethod
+    def _key(cls, device_params: Dict) -> Tuple:
+        return tuple(device_params.get(field, 22 if field == 'port' else None) for field in cls._KEY_FIELDS)
+    
+    def acquire(self, device_params: Dict) -> 'NetworkDeviceManager':
+        """Return a live session for device_params, reusing an idle one when it still answers."""
+        self.reap()
+        with self._lock:
+            entry = self._idle.pop(self._key(device_params), None)
+        
+        if entry is not None:
+            device = entry[0]
+            if device._check_connection_health():
+                return device
+            self._close(device)
+        
+        device = NetworkDeviceManager(dict(device_params))
+        device.connect()
+        return device
+    
+    def release(self, device: 'NetworkDeviceManager', healthy: bool = True) -> None:
+        """Hand a session back for reuse, or close it if it may be left in a bad state."""
+        previous = None
+        with self._lock:
+            if healthy and not self._closed:
+                key = self._key(device.device_params)
+                previous = self._idle.get(key)
+                self._idle[key] = (device, time.monotonic() + self._ttl)
+                if self._reaper is None:
+                    self._reaper = threading.Thread(target=self._reap_loop, name='netauto-session-reaper',
+                                                    daemon=True)
+                    self._reaper.start()
+                device = None
+        if device is not None:
+            self._close(device)
+        if previous is not None:
+            self._close(previous[0])
+    
+    def reap(self) -> None:
+        """Close every idle session whose TTL has passed."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [key for key, (_, expiry) in self._idle.items() if expiry <= now]
+            stale = [self._idle.pop(key)[0] for key in expired]
+        for device in stale:
+            self._close(device)
+    
+    def close_all(self) -> None:
+        """Close every idle session; sessions released afterwards are closed instead of pooled."""
+        with self._lock:
+            self._closed = True
+            stale = [device for device, _ in self._idle.values()]
+            self._idle.clear()
+        for device in stale:
+            self._close(device)
+    
+    def _reap_loop(self) -> None:
+        # Runs while sessions are idle; release() starts a new one once the pool has emptied
+        while True:
+            time.sleep(self._reap_interval)
+            self.reap()
+            with self._lock:
+                if not self._idle:
+                    self._reaper = None
+                    return
+    
+    @staticmethod
+    def _close(device: 'NetworkDeviceManager') -> None:
+        try:
+            device.disconnect()
+        except Exception as e:
+            logger.debug("Closing pooled session failed: %s", e)
+
+
+# Shared by execute_network_task(..., reuse=True); TTL matches SPEED_OPTIMIZED_PARAMS['session_timeout']
+_SESSION_POOL = _SessionPool(ttl=300)
+atexit.register(_SESSION_POOL.close_all)
+
+
+@contextmanager
+def pooled_session(device_params: Dict):
+    """Borrow a connected NetworkDeviceManager from the shared pool for the duration of a with-block.
+    The session goes back to the pool on success and is closed if the block raises.
+    """
+    device = _SESSION_POOL.acquire(device_params)
+    try:
+        yield device
+    except BaseException:
+        _SESSION_POOL.release(device, healthy=False)
+        raise
+    _SESSION_POOL.release(device)
+
+
+def _resolve_task(task_type: str, parameters: Dict):
+    """Look up the (manager class, handler) pair for task_type and check its required parameters,
+    failing before any device session opens.
+    """
+    try:
+        manager_cls, handler = TASK_DISPATCH[task_type]
+    except KeyError:
+        raise NetworkAutomationError(f"Unknown task type: {task_type}")
+    if manager_cls is None:
+        # Optional Juniper EVPN/L2VPN support failed to import
+        raise NetworkAutomationError("EVPNManager not available")
+    missing = [key for key in TASK_REQUIRED_PARAMS.get(task_type, ()) if key not in parameters]
+    if missing:
+        raise NetworkAutomationError(f"Missing required parameters for {task_type}: {', '.join(missing)}")
+    return manager_cls, handler
+
+
+def _dispatch_one(device: 'NetworkDeviceManager', task_type: str, parameters: Dict) -> str:
+    """Run a single task on an already connected device, with a manager built for this task only."""
+    manager_cls, handler = _resolve_task(task_type, parameters)
+    return handler(manager_cls(device), parameters)
+
+
+def execute_network_task(device_params: Dict, task_type: str, parameters: Dict,
+                         reuse: bool = False) -> Tuple[bool, str, str]:
     """
     Execute a network automation task.
+    With reuse=True the device session is taken from and returned to the shared session pool
+    instead of being opened and closed around this one task.
     
     Returns:
         Tuple of (success: bool, result: str, error_message: str)
     """
-    print(f"DEBUG: execute_network_task called with task_type='{task_type}'")
-    print(f"DEBUG: device_params: {device_params}")
-    print(f"DEBUG: parameters: {parameters}")
+    # Parameters and connection settings can carry passwords, so only names are logged
+    logger.debug("execute_network_task %s on %s with parameters %s",
+                 task_type, device_params.get('host'), sorted(parameters))
     
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     
+    # Unknown task types and missing parameters are rejected without touching the device
     try:
-        with NetworkDeviceManager(device_params) as device:
-            if task_type == 'vlan_create':
-                manager = VLANManager(device)
-                result = manager.create_vlan(
-                    parameters['vlan_id'], 
-                    parameters.get('vlan_name')
-                )
-            
-            elif task_type == 'vlan_delete':
-                manager = VLANManager(device)
-                result = manager.delete_vlan(parameters['vlan_id'])
-            
-            elif task_type == 'interface_config':
-                manager = InterfaceManager(device)
-                if parameters['mode'] == 'access':
-                    result = manager.configure_access_port(
-                        parameters['interface'], 
-                        parameters['vlan_id']
-                    )
-                elif parameters['mode'] == 'trunk':
-                    result = manager.configure_trunk_port(
-                        parameters['interface'], 
-                        parameters.get('allowed_vlans', 'all')
-                    )
-                elif parameters['mode'] == 'ip':
-                    result = manager.configure_ip_address(
-                        parameters['interface'],
-                        parameters['ip_address'],
-                        parameters['subnet_mask']
-                    )
-                else:
-                    raise NetworkAutomationError(f"Unknown interface mode: {parameters['mode']}")
-            
-            elif task_type == 'interface_ipv6':
-                manager = InterfaceManager(device)
-                result = manager.configure_ipv6_address(
-                    parameters['interface'],
-                    parameters['ipv6_address'],
-                    parameters['prefix_length']
-                )
-            
-            elif task_type == 'vlan_interface_config':
-                manager = InterfaceManager(device)
-                result = manager.configure_vlan_interface(
-                    parameters['vlan_id'],
-                    parameters['ip_address'],
-                    parameters['subnet_mask'],
-                    parameters.get('vrf_name'),
-                    parameters.get('description'),
-                    parameters.get('enable_interface', True)
-                )
-            
-            elif task_type == 'routing_static':
-                manager = RoutingManager(device)
-                if parameters.get('action') == 'remove':
-                    result = manager.remove_static_route(
-                        parameters['network'],
-                        parameters['mask'],
-                        parameters['next_hop'],
-                        parameters.get('vrf_name')
-                    )
-                else:
-                    result = manager.add_static_route(
-                        parameters['network'],
-                        parameters['mask'],
-                        parameters['next_hop'],
-                        parameters.get('vrf_name')
-                    )
-            
-            elif task_type == 'vlan_interface_ipv6':
-                manager = InterfaceManager(device)
-                result = manager.configure_vlan_interface_ipv6(
-                    parameters['vlan_id'],
-                    parameters['ipv6_address'],
-                    parameters['prefix_length'],
-                    parameters.get('vrf_name'),
-                    parameters.get('description'),
-                    parameters.get('enable_interface', True)
-                )
-            
-            elif task_type == 'routing_ospf':
-                manager = RoutingManager(device)
-                result = manager.configure_ospf(
-                    parameters['process_id'],
-                    parameters['router_id'],
-                    parameters['networks'],
-                    parameters.get('vrf_name')
-                    )
-            
-            elif task_type == 'routing_static_v6':
-                manager = RoutingManager(device)
-                if parameters.get('action') == 'remove':
-                    result = manager.remove_static_route_v6(
-                        parameters['prefix'],
-                        parameters['next_hop'],
-                        parameters.get('vrf_name')
-                    )
-                else:
-                    result = manager.add_static_route_v6(
-                        parameters['prefix'],
-                        parameters['next_hop'],
-                        parameters.get('vrf_name')
-                )
-            
-            elif task_type == 'bgp_neighbor_v6':
-                manager = BGPManager(device)
-                result = manager.configure_bgp_neighbor_v6(
-                    parameters['as_number'],
-                    parameters['neighbor_ip'],
-                    parameters['remote_as'],
-                    parameters.get('vrf_name'),
-                    parameters.get('description'),
-                    parameters.get('source_interface')
-                )
-            
-            elif task_type == 'bgp_network_v6':
-                manager = BGPManager(device)
-                result = manager.advertise_network_v6(
-                    parameters['as_number'],
-                    parameters['prefix'],
-                    parameters.get('vrf_name')
-                )
-            
-            elif task_type == 'routing_ospf_v6':
-                manager = OSPFManager(device)
-                result = manager.configure_ospf_v6(
-                    parameters['process_id'],
-                    parameters['router_id'],
-                    parameters['interfaces']
-                )
-            
-            elif task_type == 'show_version':
-                manager = DeviceInfoManager(device)
-                result = manager.get_version()
-            
-            elif task_type == 'show_interfaces':
-                manager = InterfaceManager(device)
-                result = manager.show_interfaces()
-            
-            elif task_type == 'show_vlan':
-                manager = VLANManager(device)
-                result = manager.show_vlans()
-            
-            elif task_type == 'show_routes':
-                manager = RoutingManager(device)
-                result = manager.show_routes(parameters.get('vrf_name'))
-            
-            elif task_type == 'show_vrfs':
-                manager = VRFManager(device)
-                result = manager.show_vrfs()
-            
-            elif task_type == 'backup_config':
-                manager = DeviceInfoManager(device)
-                result = manager.backup_config()
-            
-            # VRF tasks
-            elif task_type == 'vrf_create':
-                manager = VRFManager(device)
-                result = manager.create_vrf(
-                    parameters['vrf_name'],
-                    parameters.get('rd'),
-                    parameters.get('description'),
-                    parameters.get('import_rt'),
-                    parameters.get('export_rt')
-                )
-            
-            elif task_type == 'vrf_assign_interface':
-                manager = VRFManager(device)
-                result = manager.assign_vrf_to_interface(
-                    parameters['interface'],
-                    parameters['vrf_name'],
-                    parameters.get('ip_address'),
-                    parameters.get('subnet_mask')
-                )
-            
-            # BGP tasks
-            elif task_type == 'bgp_neighbor':
-                manager = BGPManager(device)
-                result = manager.configure_bgp_neighbor(
-                    parameters['as_number'],
-                    parameters['neighbor_ip'],
-                    parameters['remote_as'],
-                    parameters.get('vrf_name'),
-                    parameters.get('description')
-                )
-            
-            elif task_type == 'bgp_network':
-                manager = BGPManager(device)
-                result = manager.advertise_network(
-                    parameters['as_number'],
-                    parameters['network'],
-                    parameters['mask'],
-                    parameters.get('vrf_name')
-                )
-            
-            elif task_type == 'bgp_vrf_config':
-                manager = BGPManager(device)
-                result = manager.configure_bgp_vrf(
-                    parameters['as_number'],
-                    parameters['vrf_name'],
-                    parameters.get('router_id'),
-                    parameters.get('import_rt'),
-                    parameters.get('export_rt')
-                )
-            
-            # Advanced BGP tasks
-            elif task_type == 'bgp_route_reflector':
-                manager = BGPManager(device)
-                result = manager.configure_bgp_route_reflector(
-                    parameters['as_number'],
-                    parameters['router_id'],
-                    parameters.get('cluster_id', 1),
-                    parameters.get('clients', [])
-                )
-            
-            elif task_type == 'bgp_confederation':
-                manager = BGPManager(device)
-                result = manager.configure_bgp_confederation(
-                    parameters['as_number'],
-                    parameters['confederation_id'],
-                    parameters.get('confederation_peers', [])
-                )
-            
-            elif task_type == 'bgp_community':
-                manager = BGPManager(device)
-                result = manager.configure_bgp_community(
-                    parameters['as_number'],
-                    parameters['community_list'],
-                    parameters.get('action', 'permit')
-                )
-            
-            elif task_type == 'bgp_route_map':
-                manager = BGPManager(device)
-                result = manager.configure_bgp_route_map(
-                    parameters['as_number'],
-                    parameters['route_map'],
-                    parameters['neighbor_ip'],
-                    parameters.get('direction', 'in')
-                )
-            
-            elif task_type == 'bgp_multipath':
-                manager = BGPManager(device)
-                result = manager.configure_bgp_multipath(
-                    parameters['as_number'],
-                    parameters.get('ebgp_paths', 4),
-                    parameters.get('ibgp_paths', 4)
-                )
-            
-            # Advanced OSPF tasks
-            elif task_type == 'ospf_area':
-                manager = OSPFManager(device)
-                result = manager.configure_ospf_area(
-                    parameters['process_id'],
-                    parameters['area_id'],
-                    parameters.get('area_type', 'standard'),
-                    parameters.get('stub_default_cost'),
-                    parameters.get('nssa_default_route', False)
-                )
-            
-            elif task_type == 'ospf_authentication':
-                manager = OSPFManager(device)
-                result = manager.configure_ospf_authentication(
-                    parameters['process_id'],
-                    parameters.get('area_id'),
-                    parameters.get('interface'),
-                    parameters.get('auth_type', 'md5'),
-                    parameters.get('key_id', 1),
-                    parameters.get('password', 'cisco123')
-                )
-            
-            elif task_type == 'ospf_redistribution':
-                manager = OSPFManager(device)
-                result = manager.configure_ospf_redistribution(
-                    parameters['process_id'],
-                    parameters['protocol'],
-                    parameters.get('metric'),
-                    parameters.get('metric_type'),
-                    parameters.get('vrf_name')
-                )
-            
-            # EVPN tasks
-            elif task_type == 'evpn_instance':
-                manager = JuniperEVPNManager(device)
-                result = manager.create_evpn_instance(
-                    parameters['instance_name'],
-                    parameters['vpls_id'],
-                    parameters.get('rd'),
-                    parameters.get('route_target'),
-                    parameters.get('route_target_id'),
-                    parameters.get('encapsulation', 'mpls'),
-                    parameters.get('replication_type', 'ingress'),
-                    parameters.get('description')
-                )
-            
-            elif task_type == 'bgp_evpn':
-                manager = EVPNManager(device)
-                result = manager.configure_bgp_evpn(
-                    parameters['as_number'],
-                    parameters['neighbor_ip'],
-                    parameters.get('source_interface')
-                )
-            
-            elif task_type == 'vbdif_interface':
-                manager = EVPNManager(device)
-                result = manager.configure_vbdif_interface(
-                    parameters['vbdif_id'],
-                    parameters['ip_address'],
-                    parameters['mask'],
-                    parameters['bridge_domain']
-                )
-            
-            elif task_type == 'bridge_domain':
-                manager = JuniperEVPNManager(device)
-                result = manager.add_bridge_domain_to_evpn(
-                    parameters['instance_name'],
-                    parameters['bd_name'],
-                    parameters['vlan_id'],
-                    parameters.get('interface'),
-                    parameters.get('description')
-                )
-            
-            elif task_type == 'evpn_ethernet_segment':
-                manager = EVPNManager(device)
-                result = manager.configure_evpn_ethernet_segment(
-                    parameters['interface'],
-                    parameters['esi'],
-                    parameters.get('df_election', 'mod')
-                )
-            
-            # VXLAN tasks
-            elif task_type == 'vxlan_tunnel':
-                manager = VXLANManager(device)
-                result = manager.configure_vxlan_tunnel(
-                    parameters['tunnel_id'],
-                    parameters['source_ip'],
-                    parameters['destination_ip'],
-                    parameters['vni']
-                )
-            
-            elif task_type == 'nve_interface':
-                manager = VXLANManager(device)
-                vni_mapping = parameters.get('vni_mapping') or parameters.get('vni_mappings')
-                if isinstance(vni_mapping, list):
-                    try:
-                        vni_mapping = {item['vni']: item['bridge_domain'] for item in vni_mapping}
-                    except Exception:
-                        vni_mapping = {}
-                elif not isinstance(vni_mapping, dict):
-                    vni_mapping = {}
-                result = manager.configure_nve_interface(
-                    parameters['nve_id'],
-                    parameters['source_ip'],
-                    vni_mapping
-                )
-            
-            elif task_type == 'vxlan_bd_binding':
-                manager = VXLANManager(device)
-                result = manager.configure_vxlan_bd_binding(
-                    parameters['bd_id'],
-                    parameters['vni'],
-                    parameters['nve_interface']
-                )
-            
-            elif task_type == 'vxlan_access_port':
-                manager = VXLANManager(device)
-                bd_id = parameters.get('bd_id') or parameters.get('bridge_domain_id')
-                result = manager.configure_vxlan_access_port(
-                    parameters['interface'],
-                    bd_id
-                )
-            
-            elif task_type == 'vxlan_gateway':
-                manager = VXLANManager(device)
-                bd_id = parameters.get('bd_id') or parameters.get('bridge_domain_id')
-                mask = parameters.get('mask') or parameters.get('subnet_mask')
-                result = manager.configure_vxlan_gateway(
-                    bd_id,
-                    parameters['gateway_ip'],
-                    mask,
-                    parameters.get('vbdif_id')
-                )
-            
-            # Datacenter Fabric tasks
-            elif task_type == 'ae_config':
-                manager = AEManager(device)
-                result = manager.create_ae(
-                    parameters['ae_name'],
-                    parameters.get('members', []),
-                    parameters.get('lacp', True)
-                )
-                if parameters.get('ip_address') and parameters.get('prefix_length'):
-                    result += ' ' + manager.configure_ae_unit(
-                        parameters['ae_name'],
-                        parameters['unit'],
-                        parameters['ip_address'],
-                        parameters['prefix_length'],
-                        parameters.get('description')
-                    )
-            
-            # EVPN/L2VPN task handlers
-            elif task_type == 'l2vpws':
-                if JuniperEVPNManager:
-                    manager = JuniperEVPNManager(device)
-                    result = manager.create_l2vpws(
-                        parameters['service_name'],
-                        parameters['local_if'],
-                        parameters['remote_ip'],
-                        parameters['vc_id'],
-                        parameters.get('description')
-                    )
-                else:
-                    raise NetworkAutomationError("EVPNManager not available")
-            
-            elif task_type == 'l2vpn_vpls':
-                if JuniperEVPNManager:
-                    manager = JuniperEVPNManager(device)
-                    result = manager.create_l2vpn_vpls(
-                        parameters['service_name'],
-                        parameters['vpls_id'],
-                        parameters.get('rd'),
-                        parameters.get('rt_both'),
-                        parameters.get('description')
-                    )
-                else:
-                    raise NetworkAutomationError("EVPNManager not available")
-            elif task_type == 'datacenter_fabric':
-                manager = DataCenterFabricManager(device)
-                # Pass parameters directly as fabric_config
-                fabric_config = parameters
-                result = manager.deploy_full_fabric_configuration(fabric_config)
-            
-            elif task_type == 'datacenter_fabric_single':
-                print(f"DEBUG: EXECUTING datacenter_fabric_single task")
-                print(f"DEBUG: Parameters: {parameters}")
-                try:
-                    manager = DataCenterFabricManager(device)
-                    # Pass parameters directly as fabric_config
-                    fabric_config = parameters
-                    print(f"DEBUG: About to call deploy_single_switch_to_fabric")
-                    result = manager.deploy_single_switch_to_fabric(fabric_config)
-                    print(f"DEBUG: deploy_single_switch_to_fabric completed successfully")
-                except Exception as e:
-                    print(f"DEBUG: ERROR in deploy_single_switch_to_fabric: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    raise
-            
-            elif task_type == 'spine_underlay':
-                manager = DataCenterFabricManager(device)
-                result = manager.configure_spine_underlay(
-                    parameters['router_id'],
-                    parameters['as_number'],
-                    parameters['spine_interfaces'],
-                    parameters.get('spine_ip_range', '10.0.0.0/30')
-                )
-            
-            elif task_type == 'leaf_underlay':
-                manager = DataCenterFabricManager(device)
-                result = manager.configure_leaf_underlay(
-                    parameters['router_id'],
-                    parameters['as_number'],
-                    parameters['spine_interfaces'],
-                    parameters['leaf_id']
-                )
-            
-            elif task_type == 'tenant_network':
-                manager = DataCenterFabricManager(device)
-                result = manager.deploy_tenant_network(
-                    parameters['tenant_name'],
-                    parameters['vni'],
-                    parameters['vlan_id'],
-                    parameters['gateway_ip'],
-                    parameters['subnet_mask'],
-                    parameters.get('access_interfaces', []),
-                    parameters.get('route_target')
-                )
-            
-            elif task_type == 'external_connectivity':
-                manager = DataCenterFabricManager(device)
-                result = manager.configure_external_connectivity(
-                    parameters['border_leaf_config']
-                )
-            
-            elif task_type == 'device_diagnostics':
-                manager = DataCenterFabricManager(device)
-                result = manager.diagnose_device_connectivity()
-            
-            elif task_type == 'multi_tenant_deployment':
-                manager = DataCenterFabricManager(device)
-                result = manager.deploy_multi_tenant_configuration(
-                    parameters['fabric_name'],
-                    parameters['tenant_networks']
-                )
-            
-            else:
-                raise NetworkAutomationError(f"Unknown task type: {task_type}")
-        
-        execution_time = time.time() - start_time
-        logger.info(f"Task {task_type} completed successfully in {execution_time:.2f}s")
-        return True, result, ""
-        
+        _resolve_task(task_type, parameters)
+    except NetworkAutomationError as e:
+        logger.error("Task %s rejected: %s", task_type, e)
+        return False, "", str(e)
+    
+    try:
+        if reuse:
+            with pooled_session(device_params) as device:
+                result = _dispatch_one(device, task_type, parameters)
+        else:
+            with NetworkDeviceManager(device_params) as device:
+                result = _dispatch_one(device, task_type, parameters)
     except Exception as e:
-        execution_time = time.time() - start_time
+        execution_time = (time.perf_counter_ns() - start_ns) / 1e9
         error_msg = str(e)
-        logger.error(f"Task {task_type} failed after {execution_time:.2f}s: {error_msg}")
+        logger.error("Task %s failed after %.2fs: %s", task_type, execution_time, error_msg)
         return False, "", error_msg
+    
+    execution_time = (time.perf_counter_ns() - start_ns) / 1e9
+    logger.info("Task %s completed successfully in %.2fs", task_type, execution_time)
+    return True, result, ""
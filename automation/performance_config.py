@@ -4,6 +4,9 @@ Performance optimization configuration for network automation tasks.
 This module contains settings and utilities for maximizing task execution speed.
 """
 import logging
+import logging.config
+from types import MappingProxyType
+from typing import Mapping
 
 # Performance-focused logging configuration
 FAST_LOGGING_CONFIG = {
@@ -72,6 +75,21 @@ DEVICE_SPEED_CONFIGS = {
     },
 }
 
+# Performance flags applied on top of every device profile
+_PERFORMANCE_FLAGS = {
+    'debug_mode': False,  # Disable debugging for speed
+    'auto_save': True,    # Keep auto-save for safety
+    'auto_commit': True,  # Keep auto-commit for Huawei
+}
+
+# Base settings, device-specific settings and performance flags merged once per device type.
+# Read-only views so no caller can mutate the shared templates in place.
+_MERGED_BASE = {
+    device_type: MappingProxyType({**SPEED_OPTIMIZED_PARAMS, **device_config, **_PERFORMANCE_FLAGS})
+    for device_type, device_config in DEVICE_SPEED_CONFIGS.items()
+}
+_MERGED_BASE[None] = MappingProxyType({**SPEED_OPTIMIZED_PARAMS, **_PERFORMANCE_FLAGS})
+
 def apply_speed_optimizations(device_params: dict) -> dict:
     """
     Apply speed optimizations to device parameters.
@@ -82,26 +100,19 @@ def apply_speed_optimizations(device_params: dict) -> dict:
     Returns:
         Optimized device parameters for maximum speed
     """
-    # Start with speed-optimized base settings
-    optimized = device_params.copy()
-    optimized.update(SPEED_OPTIMIZED_PARAMS)
-    
-    # Apply device-specific optimizations
+    # Speed settings take precedence over the caller's connection parameters
     device_type = device_params.get('device_type', '')
-    if device_type in DEVICE_SPEED_CONFIGS:
-        optimized.update(DEVICE_SPEED_CONFIGS[device_type])
-    
-    # Performance flags
-    optimized['debug_mode'] = False  # Disable debugging for speed
-    optimized['auto_save'] = True    # Keep auto-save for safety
-    optimized['auto_commit'] = True  # Keep auto-commit for Huawei
-    
-    return optimized
+    return {**device_params, **_MERGED_BASE.get(device_type, _MERGED_BASE[None])}
+
+_LOGGING_CONFIGURED = False
 
 def configure_fast_logging():
-    """Configure logging for maximum performance."""
-    import logging.config
+    """Configure logging for maximum performance; repeat calls are no-ops."""
+    global _LOGGING_CONFIGURED
+    if _LOGGING_CONFIGURED:
+        return
     logging.config.dictConfig(FAST_LOGGING_CONFIG)
+    _LOGGING_CONFIGURED = True
 
 # Command execution performance settings
 FAST_COMMAND_SETTINGS = {
@@ -125,9 +136,23 @@ FAST_COMMAND_SETTINGS = {
     }
 }
 
-def get_fast_command_settings(device_type: str) -> dict:
+# Read-only views of FAST_COMMAND_SETTINGS handed to callers, so the shared entries stay intact
+_SETTINGS_MATCH = tuple((key, MappingProxyType(settings)) for key, settings in FAST_COMMAND_SETTINGS.items())
+_GENERIC_SETTINGS = dict(_SETTINGS_MATCH)['generic']
+
+def _match_command_settings(dt: str):
+    return next((settings for key, settings in _SETTINGS_MATCH if key in dt), _GENERIC_SETTINGS)
+
+# Lower-cased device_type -> resolved settings; the platform's own device types are resolved up front
+_DEVICE_TYPE_TO_SETTINGS = {
+    dt: _match_command_settings(dt)
+    for dt in ('cisco_ios', 'cisco_xe', 'cisco_nxos', 'huawei', 'huawei_vrpv8', 'juniper_mx', 'juniper_srx')
+}
+
+def get_fast_command_settings(device_type: str) -> Mapping:
     """Get optimized command execution settings for device type."""
-    for key, settings in FAST_COMMAND_SETTINGS.items():
-        if key in device_type.lower():
-            return settings
-    return FAST_COMMAND_SETTINGS['generic']
\ No newline at end of file
+    dt = device_type.lower()
+    settings = _DEVICE_TYPE_TO_SETTINGS.get(dt)
+    if settings is None:
+        settings = _DEVICE_TYPE_TO_SETTINGS[dt] = _match_command_settings(dt)
+    return settings
@@ -0,0 +1,155 @@
+"""
+Background execution of NetworkTask jobs.
+
+Views hand device work to a bounded worker pool instead of starting a new thread
+per request, so a burst of submissions queues up instead of opening an unbounded
+number of SSH sessions at once. The queue itself is bounded too: a task submitted
+while it is full is marked failed instead of holding up the request.
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections, transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .device_cache import device_listing_cache_key
+from .models import NetworkTask
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def get_task_executor() -> ThreadPoolExecutor:
+    """Process-wide pool for device tasks; NETAUTO_TASK_WORKERS caps concurrent jobs."""
+    return ThreadPoolExecutor(
+        max_workers=getattr(settings, 'NETAUTO_TASK_WORKERS', 16),
+        thread_name_prefix='netauto-task',
+    )
+
+
+@lru_cache(maxsize=1)
+def _task_slots() -> threading.BoundedSemaphore:
+    """Jobs allowed in the pool at once: NETAUTO_TASK_WORKERS running plus NETAUTO_TASK_QUEUE_SIZE waiting."""
+    return threading.BoundedSemaphore(
+        getattr(settings, 'NETAUTO_TASK_WORKERS', 16) + getattr(settings, 'NETAUTO_TASK_QUEUE_SIZE', 64)
+    )
+
+
+def _log_failure(future):
+    error = future.exception()
+    if error is not None:
+        logger.error("Background task crashed: %s", error, exc_info=error)
+
+
+def _run_job(fn, args):
+    """Run one job on a pool thread between database connection cleanups, then free its slot.
+    Pool threads live for the whole process, so a connection left broken or past
+    CONN_MAX_AGE by one job is never handed to the next.
+    """
+    close_old_connections()
+    try:
+        return fn(*args)
+    finally:
+        close_old_connections()
+        _task_slots().release()
+
+
+# Error recorded on a task submitted while every worker and queue slot is taken
+QUEUE_FULL_ERROR = "Task queue is full; submit the task again once running tasks finish"
+
+
+def _reject_task(task):
+    logger.warning("Task queue full, task %s not run", task.id)
+    task.status = 'failed'
+    task.error_message = QUEUE_FULL_ERROR
+    task.completed_at = timezone.now()
+    task.save(update_fields=['status', 'error_message', 'completed_at'])
+
+
+def submit_task(fn, task):
+    """Run fn(task) on the task pool once the current transaction commits,
+    so the worker never reads a NetworkTask row that is not yet visible.
+    If the pool's running and waiting jobs are all taken, task is marked
+    failed right away; the submitting request never waits for a slot.
+    """
+    def enqueue():
+        slots = _task_slots()
+        if not slots.acquire(blocking=False):
+            _reject_task(task)
+            return
+        try:
+            future = get_task_executor().submit(_run_job, fn, (task,))
+        except BaseException:
+            slots.release()
+            raise
+        future.add_done_callback(_log_failure)
+    transaction.on_commit(enqueue)
+
+
+# Latest status of each task, mirrored into the cache so AJAX polling skips the database
+TASK_STATUS_TIMEOUT = 3600
+
+# Only tasks in these states have a final result worth shipping to pollers
+FINISHED_STATUSES = ('completed', 'failed')
+
+
+def _task_status_key(task_id) -> str:
+    return f"task:{task_id}:status"
+
+
+def _status_snapshot(task) -> dict:
+    return {
+        'status': task.status,
+        'started_at': task.started_at.isoformat() if task.started_at else None,
+        'completed_at': task.completed_at.isoformat() if task.completed_at else None,
+        # The captured output can be large; leave it out until the task has finished
+        'result': task.result if task.status in FINISHED_STATUSES else None,
+        'error_message': task.error_message,
+    }
+
+
+def publish_task_statuses(tasks):
+    """Store status snapshots for tasks and drop the device listings their changes made stale."""
+    cache.set_many({_task_status_key(task.id): _status_snapshot(task) for task in tasks}, TASK_STATUS_TIMEOUT)
+    # A completed configuration change may have added or removed interfaces or VRFs
+    stale = [
+        device_listing_cache_key(task.device_id, kind)
+        for task in tasks
+        if task.status == 'completed' and not task.task_type.startswith(('show_', 'backup_'))
+        for kind in ('interfaces', 'vrfs')
+    ]
+    if stale:
+        cache.delete_many(stale)
+
+
+@receiver(post_save, sender=NetworkTask, dispatch_uid='automation.publish_task_status')
+def publish_task_status(sender, instance, **kwargs):
+    """Store a status snapshot of every saved NetworkTask under its cache key once the save commits,
+    so pollers never see a status that is rolled back.
+    """
+    transaction.on_commit(lambda: publish_task_statuses([instance]))
+
+
+@receiver(post_delete, sender=NetworkTask, dispatch_uid='automation.forget_task_status')
+def forget_task_status(sender, instance, **kwargs):
+    cache.delete(_task_status_key(instance.id))
+
+
+def get_task_status(task_id):
+    """Status snapshot for task_id from the cache, falling back to the database.
+    Returns None if the task does not exist. 'result' is None until the task finishes.
+    """
+    data = cache.get(_task_status_key(task_id))
+    if data is not None:
+        return data
+    # result is deferred and only loaded by _status_snapshot for finished tasks
+    task = (NetworkTask.objects
+            .only('status', 'started_at', 'completed_at', 'error_message')
+            .filter(id=task_id).first())
+    return _status_snapshot(task) if task is not None else None
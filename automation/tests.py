@@ -1,3 +1,608 @@
-from django.test import TestCase
+import logging
+import threading
+import time
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Value
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from . import device_cache, forms, models, performance_config, tasks, views
+from .models import Device, FabricDeployment, NetworkTask, TaskResult
+from .network_automation import (
+    TASK_DISPATCH, TASK_REQUIRED_PARAMS, ConfigSentError, DataCenterFabricManager, NetworkAutomationError,
+    NetworkDeviceManager, VLANManager, VXLANManager, _SessionPool, _underlay_ip_table, execute_network_task,
+    pooled_session,
+)
+
+
+DEVICE_PARAMS = {
+    'device_type': 'cisco_ios',
+    'host': '192.0.2.1',
+    'username': 'admin',
+    'password': 'secret',
+}
+
+
+def make_device_manager(device_type='huawei', **params):
+    """NetworkDeviceManager with a mocked Netmiko connection; nothing is opened."""
+    device = NetworkDeviceManager({**DEVICE_PARAMS, 'device_type': device_type, **params})
+    device.connection = mock.Mock()
+    return device
+
+
+class BulkConfigTests(SimpleTestCase):
+    """execute_config_commands_bulk falls back to per-command execution only before the write"""
+
+    def setUp(self):
+        self.device = make_device_manager('cisco_ios')
+        self.device.connection.read_channel_timing.return_value = 'ok'
+        self.device.connection.save_config.return_value = 'saved'
+
+    def test_single_write(self):
+        result = self.device.execute_config_commands_bulk(['vlan 10', 'name users'])
+        self.device.connection.write_channel.assert_called_once_with('vlan 10\nname users\n')
+        self.assertIn('saved', result)
+
+    def test_failure_before_write_falls_back(self):
+        self.device.connection.config_mode.side_effect = OSError('prompt not found')
+        with mock.patch.object(self.device, 'execute_config_commands', return_value='fallback') as fallback:
+            result = self.device.execute_config_commands_bulk(['vlan 10'])
+        self.assertEqual(result, 'fallback')
+        fallback.assert_called_once_with(['vlan 10'])
+        self.device.connection.write_channel.assert_not_called()
+
+    def test_failure_after_write_does_not_replay(self):
+        self.device.connection.save_config.side_effect = OSError('socket is closed')
+        with mock.patch.object(self.device, 'execute_config_commands') as fallback:
+            with self.assertRaises(ConfigSentError):
+                self.device.execute_config_commands_bulk(['vlan 10'])
+        fallback.assert_not_called()
+        self.device.connection.write_channel.assert_called_once()
+
+    def test_chunk_sent_before_read_back_fails_is_not_retried(self):
+        device = make_device_manager('huawei')
+        device.connection.read_channel_timing.side_effect = OSError('Socket is closed')
+        fabric = DataCenterFabricManager(device)
+        with mock.patch.object(device, '_fast_enter_huawei_config'), \
+                mock.patch.object(device, '_check_connection_health', return_value=True), \
+                mock.patch.object(device, '_reconnect_if_needed'), \
+                mock.patch('automation.network_automation.time.sleep'):
+            result = fabric._execute_commands_in_chunks(['vlan 10', 'vlan 20'])
+        device.connection.write_channel.assert_called_once()
+        self.assertIn('CHUNK 1 FAILED', result)
+
+    def test_failed_write_does_not_replay(self):
+        self.device.connection.write_channel.side_effect = OSError('broken pipe')
+        with mock.patch.object(self.device, 'execute_config_commands') as fallback:
+            with self.assertRaises(NetworkAutomationError):
+                self.device.execute_config_commands_bulk(['vlan 10'])
+        fallback.assert_not_called()
+
+
+class UnderlayAddressingTests(SimpleTestCase):
+    """/30 link addresses are counted from the configured range's base address"""
+
+    def setUp(self):
+        self.fabric = DataCenterFabricManager(make_device_manager())
+
+    def test_network_range(self):
+        self.assertEqual(self.fabric._calculate_link_network('10.0.0.0/30', 1), '10.0.0.4')
+        self.assertEqual(self.fabric._calculate_spine_ip('10.0.0.0/30', 1), '10.0.0.5')
+        self.assertEqual(self.fabric._calculate_leaf_ip('10.0.0.0/30', 7, 1), '10.0.0.6')
+
+    def test_range_with_host_bits_keeps_written_base(self):
+        self.assertEqual(self.fabric._calculate_link_network('10.0.0.5/30', 0), '10.0.0.5')
+        self.assertEqual(self.fabric._calculate_spine_ip('10.0.0.5/30', 1), '10.0.0.10')
+        self.assertEqual(_underlay_ip_table('10.0.0.5/30', 2, 2),
+                         (('10.0.0.5', '10.0.0.7'), ('10.0.0.9', '10.0.0.11')))
+
+
+class HuaweiValidationTests(SimpleTestCase):
+    """_validate_huawei_connection issues its checks one at a time over the single session"""
+
+    def test_commands_run_in_order(self):
+        device = make_device_manager()
+        fabric = DataCenterFabricManager(device)
+        with mock.patch.object(device, 'execute_command', return_value='x' * 40) as execute:
+            self.assertTrue(fabric._validate_huawei_connection(strict=True))
+        self.assertEqual([c.args[0] for c in execute.call_args_list],
+                         ['display clock', 'display version', 'system-view', 'quit', 'display interface brief'])
+
+    def test_interface_check_ignores_padding(self):
+        device = make_device_manager()
+        fabric = DataCenterFabricManager(device)
+        outputs = {'display interface brief': 'Interface' + ' ' * 40}
+        with mock.patch.object(device, 'execute_command', side_effect=lambda cmd: outputs.get(cmd, 'x' * 40)), \
+                self.assertLogs('automation.network_automation', logging.WARNING):
+            self.assertFalse(fabric._validate_huawei_connection(strict=True))
+
+
+class VXLANPayloadTests(SimpleTestCase):
+    """Pre-encoded VXLAN batches carry UTF-8 text straight to the SSH channel"""
+
+    def setUp(self):
+        self.device = make_device_manager(auto_commit=False)
+        self.device.connection.read_channel_timing.return_value = ''
+        patcher = mock.patch.multiple(self.device, _fast_enter_huawei_config=mock.DEFAULT,
+                                      _fast_exit_huawei_config=mock.DEFAULT)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_non_ascii_interface_name(self):
+        VXLANManager(self.device).configure_vxlan_access_port('GE1/0/1 \u00fcplink', 10)
+        payload = self.device.connection.remote_conn.sendall.call_args.args[0]
+        self.assertTrue(payload.startswith('interface GE1/0/1 \u00fcplink\n'.encode('utf-8')))
+        self.assertIn(b'bridge-domain 10\n', payload)
+
+
+class FabricTrackingTests(TestCase):
+    """Fabric deploys read and record fabric members against the current database row"""
+
+    def setUp(self):
+        self.fabric = FabricDeployment.objects.create(
+            fabric_name='dc1', created_by=User.objects.create_user('ops'))
+        self.manager = DataCenterFabricManager(make_device_manager())
+        for name in ('configure_spine_underlay', 'configure_leaf_underlay'):
+            patcher = mock.patch.object(DataCenterFabricManager, name, return_value='')
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def add_members_elsewhere(self, **members):
+        """Change the fabric row the way another worker process would"""
+        type(self.fabric).objects.filter(pk=self.fabric.pk).update(**members)
+
+    def deploy_single(self, role, device_pk, device_id=1, **extra):
+        return self.manager.deploy_single_switch_to_fabric({
+            'fabric_name': 'dc1', 'device_role': role, 'device_id': device_id,
+            'current_device_id': device_pk, 'skip_validation': True, **extra,
+        })
+
+    def test_single_switch_peers_with_current_spines(self):
+        self.deploy_single('leaf', 11)
+        self.add_members_elsewhere(spine_devices=[{'device_id': 5, 'as_number': 65100}])
+        self.deploy_single('leaf', 12, device_id=2)
+        peer_as = DataCenterFabricManager.configure_leaf_underlay.call_args.args[5]
+        self.assertEqual(peer_as, [65100])
+
+    def test_single_switch_keeps_concurrent_members(self):
+        self.deploy_single('leaf', 11)
+        # Another worker records leaf 99 while this deploy is configuring the switch
+        DataCenterFabricManager.configure_leaf_underlay.side_effect = lambda *args: self.add_members_elsewhere(
+            leaf_devices=[{'device_id': 11}, {'device_id': 99}]) or ''
+        self.deploy_single('leaf', 12, device_id=2)
+        DataCenterFabricManager.configure_leaf_underlay.side_effect = None
+        self.deploy_single('leaf', 11, loopback_ip='10.255.254.50')
+        self.fabric.refresh_from_db()
+        self.assertEqual([leaf['device_id'] for leaf in self.fabric.leaf_devices], [11, 99, 12])
+        self.assertEqual(self.fabric.leaf_devices[0]['router_id'], '10.255.254.50')
+
+    def test_full_fabric_merges_with_locked_row(self):
+        leaf = Device.objects.create(name='leaf1', host='192.0.2.11', device_type='huawei',
+                                     username='admin', password='secret')
+        self.add_members_elsewhere(tenant_networks=[{'name': 'old', 'vni': 5000}])
+        # While this leaf is being configured another worker removes the old tenant and adds a spine
+        DataCenterFabricManager.configure_leaf_underlay.side_effect = lambda *args: self.add_members_elsewhere(
+            tenant_networks=[], spine_devices=[{'id': 7}]) or ''
+        with mock.patch.object(self.manager.device, 'execute_config_commands', return_value=''):
+            self.manager.deploy_full_fabric_configuration({
+                'fabric_name': 'dc1', 'device_role': 'leaf', 'current_device_id': leaf.id,
+                'skip_validation': True,
+                'tenant_networks': [{'name': 't1', 'vni': 10010, 'vlan_id': 10,
+                                     'gateway_ip': '10.1.0.1', 'subnet_mask': '255.255.255.0'}],
+            })
+        self.fabric.refresh_from_db()
+        self.assertEqual(self.fabric.spine_devices, [{'id': 7}])
+        self.assertEqual([member['id'] for member in self.fabric.leaf_devices], [leaf.id])
+        self.assertEqual([tenant['vni'] for tenant in self.fabric.tenant_networks], [10010])
+
+
+class TaskDispatchTests(SimpleTestCase):
+    """execute_network_task looks handlers up in TASK_DISPATCH and checks parameters before connecting"""
+
+    def setUp(self):
+        for name in ('connect', 'disconnect'):
+            patcher = mock.patch.object(NetworkDeviceManager, name)
+            setattr(self, name, patcher.start())
+            self.addCleanup(patcher.stop)
+
+    def test_dispatches_to_manager_method(self):
+        with mock.patch.object(VLANManager, 'create_vlan', return_value='vlan done') as create_vlan:
+            outcome = execute_network_task(dict(DEVICE_PARAMS), 'vlan_create', {'vlan_id': 10, 'vlan_name': 'users'})
+        self.assertEqual(outcome, (True, 'vlan done', ''))
+        create_vlan.assert_called_once_with(10, 'users')
+        self.connect.assert_called_once()
+        self.disconnect.assert_called_once()
+
+    def test_unknown_task_type_never_connects(self):
+        outcome = execute_network_task(dict(DEVICE_PARAMS), 'no_such_task', {})
+        self.assertEqual(outcome, (False, '', 'Unknown task type: no_such_task'))
+        self.connect.assert_not_called()
+
+    def test_missing_parameters_never_connect(self):
+        success, _, error = execute_network_task(dict(DEVICE_PARAMS), 'bgp_neighbor', {'as_number': 65000})
+        self.assertFalse(success)
+        self.assertIn('neighbor_ip, remote_as', error)
+        self.connect.assert_not_called()
+
+    def test_handler_error_becomes_failed_outcome(self):
+        with mock.patch.object(VLANManager, 'delete_vlan', side_effect=NetworkAutomationError('VLAN in use')):
+            outcome = execute_network_task(dict(DEVICE_PARAMS), 'vlan_delete', {'vlan_id': 10})
+        self.assertEqual(outcome, (False, '', 'VLAN in use'))
+        self.disconnect.assert_called_once()
+
+    def test_password_is_not_logged(self):
+        with mock.patch.object(VLANManager, 'create_vlan', return_value=''):
+            with self.assertLogs('automation.network_automation', 'DEBUG') as logs:
+                execute_network_task(dict(DEVICE_PARAMS), 'vlan_create', {'vlan_id': 10, 'password': 'hunter2'})
+        output = '\n'.join(logs.output)
+        self.assertNotIn('secret', output)
+        self.assertNotIn('hunter2', output)
+
+    def test_required_parameters_cover_known_tasks(self):
+        self.assertLessEqual(set(TASK_REQUIRED_PARAMS), set(TASK_DISPATCH))
+
+
+class SessionPoolTests(SimpleTestCase):
+    """Pooled sessions are matched on credentials and driver and closed once idle too long"""
+
+    def setUp(self):
+        patcher = mock.patch('automation.network_automation.NetworkDeviceManager', side_effect=self.open_session)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.opened = []
+
+    def open_session(self, device_params):
+        session = mock.Mock(device_params=device_params)
+        session._check_connection_health.return_value = True
+        self.opened.append(session)
+        return session
+
+    def test_reuses_matching_session(self):
+        pool = _SessionPool()
+        first = pool.acquire(DEVICE_PARAMS)
+        pool.release(first)
+        self.assertIs(pool.acquire(dict(DEVICE_PARAMS)), first)
+        self.assertEqual(len(self.opened), 1)
+        pool.close_all()
+
+    def test_credentials_and_driver_are_part_of_the_key(self):
+        pool = _SessionPool()
+        pool.release(pool.acquire(DEVICE_PARAMS))
+        other_password = pool.acquire({**DEVICE_PARAMS, 'password': 'rotated'})
+        other_driver = pool.acquire({**DEVICE_PARAMS, 'device_type': 'cisco_xe'})
+        self.assertEqual(len(self.opened), 3)
+        self.assertIsNot(other_password, self.opened[0])
+        self.assertIsNot(other_driver, self.opened[0])
+        pool.close_all()
+
+    def test_reap_closes_expired_sessions(self):
+        pool = _SessionPool(ttl=0)
+        session = pool.acquire(DEVICE_PARAMS)
+        pool.release(session)
+        pool.reap()
+        session.disconnect.assert_called_once()
+        self.assertIsNot(pool.acquire(DEVICE_PARAMS), session)
+
+    def test_reaper_thread_closes_idle_sessions(self):
+        pool = _SessionPool(ttl=0.01, reap_interval=0.01)
+        session = pool.acquire(DEVICE_PARAMS)
+        pool.release(session)
+        deadline = time.monotonic() + 2
+        while not session.disconnect.called and time.monotonic() < deadline:
+            time.sleep(0.01)
+        session.disconnect.assert_called_once()
+
+    def test_close_all_closes_idle_and_later_sessions(self):
+        pool = _SessionPool()
+        idle, busy = pool.acquire(DEVICE_PARAMS), pool.acquire(DEVICE_PARAMS)
+        pool.release(idle)
+        pool.close_all()
+        idle.disconnect.assert_called_once()
+        pool.release(busy)
+        busy.disconnect.assert_called_once()
+
+    def test_pooled_session_closes_session_on_error(self):
+        pool = _SessionPool()
+        with mock.patch('automation.network_automation._SESSION_POOL', pool):
+            with self.assertRaises(RuntimeError):
+                with pooled_session(DEVICE_PARAMS):
+                    raise RuntimeError('prompt lost')
+        self.opened[0].disconnect.assert_called_once()
+        self.assertNotIn(self.opened[0], [device for device, _ in pool._idle.values()])
+
+
+class FastLoggingTests(SimpleTestCase):
+    """configure_fast_logging only applies FAST_LOGGING_CONFIG and leaves process-wide logging alone"""
+
+    def test_process_logging_flags_untouched(self):
+        flags = (logging.logThreads, logging.logProcesses, logging.logMultiprocessing, logging._srcfile)
+        with mock.patch.object(performance_config, '_LOGGING_CONFIGURED', False), \
+                mock.patch('logging.config.dictConfig') as dict_config:
+            performance_config.configure_fast_logging()
+        dict_config.assert_called_once_with(performance_config.FAST_LOGGING_CONFIG)
+        self.assertEqual(
+            (logging.logThreads, logging.logProcesses, logging.logMultiprocessing, logging._srcfile), flags)
+
+
+class TaskExecutorTests(SimpleTestCase):
+    """Pool jobs run between connection cleanups and give their slot back"""
+
+    def test_job_cleans_connections_and_frees_its_slot(self):
+        slots = mock.Mock()
+        with mock.patch.object(tasks, '_task_slots', return_value=slots), \
+                mock.patch.object(tasks, 'close_old_connections') as close_old:
+            self.assertEqual(tasks._run_job(lambda x: x * 2, (21,)), 42)
+            with self.assertRaises(ValueError):
+                tasks._run_job(int, ('not a number',))
+        self.assertEqual(close_old.call_count, 4)
+        self.assertEqual(slots.release.call_count, 2)
+
+
+class TaskStatusTests(TestCase):
+    """Task status snapshots reach the cache only once the task's transaction commits"""
+
+    def setUp(self):
+        cache.clear()
+        self.device = Device.objects.create(name='r1', host='192.0.2.1', device_type='cisco_ios',
+                                            username='admin', password='secret')
+        self.user = User.objects.create_user('ops')
+
+    def test_status_published_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            task = NetworkTask.objects.create(device=self.device, task_type='show_version', created_by=self.user)
+            self.assertIsNone(cache.get(tasks._task_status_key(task.id)))
+        self.assertEqual(cache.get(tasks._task_status_key(task.id))['status'], 'pending')
+
+    def test_rolled_back_status_is_not_published(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            task = NetworkTask.objects.create(device=self.device, task_type='show_version', created_by=self.user)
+        callbacks.clear()  # the transaction is rolled back instead of committed
+        self.assertIsNone(cache.get(tasks._task_status_key(task.id)))
+
+    def test_full_queue_fails_task_without_waiting(self):
+        first = NetworkTask.objects.create(device=self.device, task_type='show_version', created_by=self.user)
+        second = NetworkTask.objects.create(device=self.device, task_type='show_version', created_by=self.user)
+        executor = mock.Mock()
+        with mock.patch.object(tasks, '_task_slots', return_value=threading.BoundedSemaphore(1)), \
+                mock.patch.object(tasks, 'get_task_executor', return_value=executor):
+            with self.captureOnCommitCallbacks(execute=True):
+                tasks.submit_task(print, first)
+                tasks.submit_task(print, second)
+        executor.submit.assert_called_once_with(tasks._run_job, print, (first,))
+        second.refresh_from_db()
+        self.assertEqual((second.status, second.error_message), ('failed', tasks.QUEUE_FULL_ERROR))
+        self.assertEqual(tasks.get_task_status(second.id)['status'], 'failed')
+
+    def test_result_withheld_until_finished(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            task = NetworkTask.objects.create(device=self.device, task_type='show_version',
+                                              created_by=self.user, status='running', result='partial')
+        self.assertIsNone(tasks.get_task_status(task.id)['result'])
+        with self.captureOnCommitCallbacks(execute=True):
+            task.status = 'completed'
+            task.save()
+        self.assertEqual(tasks.get_task_status(task.id)['result'], 'partial')
+
+
+class DeviceApiTests(TestCase):
+    """The form-helper APIs read over pooled sessions and serve repeat requests from the cache"""
+
+    INTERFACES = "Interface  PHY  Protocol\nGigabitEthernet0/0/1  up  up\n10GE1/0/1  down  down\n"
+
+    def setUp(self):
+        cache.clear()
+        self.device = Device.objects.create(name='sw1', host='192.0.2.2', device_type='huawei',
+                                            username='admin', password='secret')
+
+    def test_interfaces_read_once_over_pooled_session(self):
+        url = reverse('api_device_interfaces', args=[self.device.id])
+        with mock.patch.object(views, 'execute_network_task', return_value=(True, self.INTERFACES, None)) as run:
+            first = self.client.get(url).json()
+            second = self.client.get(url).json()
+        self.assertEqual(first, {'interfaces': ['GigabitEthernet0/0/1', '10GE1/0/1']})
+        self.assertEqual(second, first)
+        run.assert_called_once_with(self.device.get_connection_params(), 'show_interfaces', {}, reuse=True)
+
+    def test_vrf_debug_request_bypasses_cache(self):
+        url = reverse('api_device_vrfs', args=[self.device.id])
+        with mock.patch.object(views, 'execute_network_task', return_value=(True, '', None)) as run:
+            self.client.get(url)
+            self.client.get(url)
+            response = self.client.get(url, {'debug': '1'}).json()
+        self.assertEqual(run.call_count, 2)
+        self.assertEqual(run.call_args.args[1], 'show_vrfs')
+        self.assertEqual(response['debug']['device_type'], 'huawei')
+
+    def test_failed_read_is_not_cached(self):
+        url = reverse('api_device_interfaces', args=[self.device.id])
+        with mock.patch.object(views, 'execute_network_task', return_value=(False, None, 'timed out')) as run:
+            self.assertEqual(self.client.get(url).status_code, 500)
+            self.assertEqual(self.client.get(url).status_code, 500)
+        self.assertEqual(run.call_count, 2)
+
+    def test_inactive_device_not_found(self):
+        Device.objects.filter(id=self.device.id).update(is_active=False)
+        with mock.patch.object(views, 'execute_network_task') as run:
+            response = self.client.get(reverse('api_device_vrfs', args=[self.device.id]))
+        self.assertEqual(response.status_code, 404)
+        run.assert_not_called()
+
+    def test_task_status_reports_failure_message(self):
+        user = User.objects.create_user('ops')
+        task = NetworkTask.objects.create(device=self.device, task_type='show_version', created_by=user,
+                                          status='failed', error_message='auth failed')
+        response = self.client.get(reverse('api_task_status', args=[task.id])).json()
+        self.assertEqual(response, {'status': 'failed', 'progress': 0, 'message': 'auth failed'})
+        self.assertEqual(self.client.get(reverse('api_task_status', args=[task.id + 1])).status_code, 404)
+
+
+class TaskExecutionTests(TestCase):
+    """execute_task_async records the device outcome on the task and its TaskResult"""
+
+    def setUp(self):
+        device = Device.objects.create(name='r1', host='192.0.2.1', device_type='cisco_ios',
+                                       username='admin', password='secret')
+        self.task = NetworkTask.objects.create(device=device, task_type='show_version',
+                                               created_by=User.objects.create_user('ops'))
+
+    def test_success_records_result(self):
+        with mock.patch.object(views, 'execute_network_task', return_value=(True, 'IOS 15.2', None)):
+            views.execute_task_async(self.task)
+        self.task.refresh_from_db()
+        self.assertEqual((self.task.status, self.task.result), ('completed', 'IOS 15.2'))
+        self.assertTrue(TaskResult.objects.get(task=self.task).success)
+
+    def test_failure_records_error(self):
+        with mock.patch.object(views, 'execute_network_task', return_value=(False, None, 'timed out')):
+            views.execute_task_async(self.task)
+        self.task.refresh_from_db()
+        self.assertEqual((self.task.status, self.task.error_message), ('failed', 'timed out'))
+        self.assertEqual(TaskResult.objects.get(task=self.task).output, 'timed out')
+
+    def test_crash_marks_task_failed(self):
+        with mock.patch.object(views, 'execute_network_task', side_effect=RuntimeError('boom')), \
+                self.assertLogs('automation.views', logging.ERROR):
+            views.execute_task_async(self.task)
+        self.task.refresh_from_db()
+        self.assertEqual((self.task.status, self.task.error_message), ('failed', 'boom'))
+        self.assertIsNotNone(self.task.completed_at)
+
+
+class TaskListPaginationTests(TestCase):
+    """Cursor pages of the task list neither skip nor repeat tasks"""
+
+    def setUp(self):
+        cache.clear()
+        device = Device.objects.create(name='r1', host='192.0.2.1', device_type='cisco_ios',
+                                       username='admin', password='secret')
+        user = User.objects.create_user('ops')
+        NetworkTask.objects.bulk_create(
+            NetworkTask(device=device, task_type='show_version', created_by=user)
+            for _ in range(views.TASKS_PER_PAGE * 2 + 5)
+        )
+
+    def walk(self):
+        """ids of every task the list shows, following the Next cursor from the first page"""
+        response = self.client.get(reverse('task_list'))
+        seen = [task.id for task in response.context['page_obj']]
+        while response.context['next_cursor']:
+            response = self.client.get(reverse('task_list'), {'cursor': response.context['next_cursor']})
+            self.assertTrue(response.context['is_cursor_page'])
+            seen += [task.id for task in response.context['page_obj']]
+        return seen
+
+    def test_tasks_with_equal_timestamps(self):
+        NetworkTask.objects.update(created_at=timezone.now())
+        expected = list(NetworkTask.objects.order_by('-id').values_list('id', flat=True))
+        self.assertEqual(self.walk(), expected)
+
+    def test_newest_first(self):
+        now = timezone.now()
+        for offset, task in enumerate(NetworkTask.objects.order_by('id')):
+            NetworkTask.objects.filter(id=task.id).update(created_at=now - timedelta(minutes=offset))
+        expected = list(NetworkTask.objects.order_by('id').values_list('id', flat=True))
+        self.assertEqual(self.walk(), expected)
+
+    def test_malformed_cursor_shows_first_page(self):
+        for cursor in ('junk', '2024-01-01T00:00:00_x', 'nodate_5', '_7'):
+            response = self.client.get(reverse('task_list'), {'cursor': cursor})
+            self.assertFalse(response.context['is_cursor_page'])
+
+
+class OrjsonFieldTests(TestCase):
+    """NetworkTask.parameters stores the same JSON whether or not orjson does the encoding"""
+
+    PARAMETERS = {'vlan_id': 10, 'name': 'Gäste', 'counter': 2 ** 70, 'ports': ['Gi0/1', 'Gi0/2'], 'ok': True}
+
+    def setUp(self):
+        self.device = Device.objects.create(name='r1', host='192.0.2.1', device_type='cisco_ios',
+                                            username='admin', password='secret')
+        self.user = User.objects.create_user('ops')
+
+    def round_trip(self, parameters):
+        task = NetworkTask.objects.create(device=self.device, task_type='vlan_create',
+                                          created_by=self.user, parameters=parameters)
+        return NetworkTask.objects.get(id=task.id).parameters
+
+    def test_round_trip_with_orjson(self):
+        self.assertIsNotNone(models.orjson)
+        self.assertEqual(self.round_trip(self.PARAMETERS), self.PARAMETERS)
+
+    def test_round_trip_without_orjson(self):
+        with mock.patch.object(models, 'orjson', None):
+            self.assertEqual(self.round_trip(self.PARAMETERS), self.PARAMETERS)
+
+    def test_big_integers_keep_their_type(self):
+        self.assertIsInstance(self.round_trip({'counter': 2 ** 70})['counter'], int)
+
+    def test_lookups_and_expressions(self):
+        task = NetworkTask.objects.create(device=self.device, task_type='vlan_create',
+                                          created_by=self.user, parameters={'vlan_id': 10})
+        self.assertTrue(NetworkTask.objects.filter(parameters__vlan_id=10, parameters__has_key='vlan_id').exists())
+        field = NetworkTask._meta.get_field('parameters')
+        NetworkTask.objects.filter(id=task.id).update(parameters=Value({'vlan_id': 20}, field))
+        self.assertEqual(NetworkTask.objects.get(id=task.id).parameters, {'vlan_id': 20})
+
+    def test_field_is_a_plain_json_field_to_migrations(self):
+        field = NetworkTask._meta.get_field('parameters')
+        self.assertEqual(field.deconstruct()[1], 'django.db.models.JSONField')
+        self.assertEqual(field.get_db_prep_value({'a': 1}, connection), '{"a":1}')
+
+
+class DeviceChoiceCacheTests(TestCase):
+    """Active-device selects render from the cache, which device changes invalidate"""
+
+    def setUp(self):
+        cache.clear()
+        self.device = Device.objects.create(name='r1', host='192.0.2.1', device_type='cisco_ios',
+                                            username='admin', password='secret')
+
+    def choices(self):
+        return list(forms.DeviceSelectionForm().fields['device'].choices)
+
+    def test_choices_rendered_from_cache(self):
+        expected = [('', 'Select a device'), (self.device.pk, 'r1 (192.0.2.1)')]
+        self.assertEqual(self.choices(), expected)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.choices(), expected)
+            forms.DeviceSelectionForm().as_p()
+
+    def test_device_changes_invalidate_choices(self):
+        self.choices()
+        other = Device.objects.create(name='r2', host='192.0.2.2', device_type='huawei',
+                                      username='admin', password='secret')
+        self.assertIn((other.pk, 'r2 (192.0.2.2)'), self.choices())
+        other.is_active = False
+        other.save()
+        self.assertNotIn((other.pk, 'r2 (192.0.2.2)'), self.choices())
+        other.delete()
+        self.device.delete()
+        self.assertEqual(self.choices(), [('', 'Select a device')])
+
+    def test_connection_test_keeps_cached_choices(self):
+        self.choices()
+        self.device.last_connected = timezone.now()
+        self.device.save(update_fields=['last_connected'])
+        self.assertIsNotNone(cache.get(device_cache.DEVICE_CHOICES_KEY))
+
+    def test_connection_test_form_lists_active_devices(self):
+        Device.objects.create(name='r2', host='192.0.2.2', device_type='huawei',
+                              username='admin', password='secret', is_active=False)
+        choices = list(forms.DeviceTestForm().fields['device'].choices)
+        self.assertEqual(choices, self.choices())
+        form = forms.DeviceTestForm({'device': self.device.pk})
+        self.assertTrue(form.is_valid())
+        self.assertEqual(form.cleaned_data['device'].get_connection_params(), self.device.get_connection_params())
+
+    def test_submitted_device_validated_against_database(self):
+        self.choices()
+        Device.objects.filter(pk=self.device.pk).update(is_active=False)  # no signal, cache is stale
+        form = forms.DeviceSelectionForm({'device': self.device.pk})
+        self.assertFalse(form.is_valid())
+        self.assertIn('device', form.errors)
@@ -0,0 +1,44 @@
+"""
+Memoized URL resolution for the automation URLconf.
+
+Polling and API endpoints are requested with the same paths over and over; the
+resolver below remembers the match for each path instead of walking the pattern
+list on every request. Paths that do not match are never cached.
+"""
+import weakref
+from functools import lru_cache
+
+from django.core.signals import setting_changed
+from django.urls.resolvers import RoutePattern, URLResolver
+
+# Every CachingURLResolver built in this process, so settings changes can reset them all
+_RESOLVERS = weakref.WeakSet()
+
+
+class CachingURLResolver(URLResolver):
+    """URLResolver whose resolve() results are kept in a bounded per-path LRU."""
+
+    def __init__(self, *args, maxsize: int = 1024, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._resolve_cached = lru_cache(maxsize=maxsize)(super().resolve)
+        _RESOLVERS.add(self)
+
+    def resolve(self, path):
+        return self._resolve_cached(str(path))
+
+    def cache_clear(self):
+        self._resolve_cached.cache_clear()
+
+
+def cached_include(route: str, urlconf_module: str, maxsize: int = 1024) -> CachingURLResolver:
+    """Drop-in for path(route, include(urlconf_module)) with memoized resolution."""
+    return CachingURLResolver(RoutePattern(route, is_endpoint=False), urlconf_module, maxsize=maxsize)
+
+
+def invalidate(**kwargs):
+    """Forget every cached match, e.g. after ROOT_URLCONF is overridden in tests."""
+    for resolver in list(_RESOLVERS):
+        resolver.cache_clear()
+
+
+setting_changed.connect(invalidate)
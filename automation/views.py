@@ -1,13 +1,18 @@
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
+from django.views.decorators.cache import never_cache
 from django.views.decorators.http import require_http_methods
 from django.core.paginator import Paginator
+from django.core.cache import cache
+from django.utils.functional import cached_property
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from django.db import transaction
+from django.db.models import Count, Q
 import json
-import threading
+import re
 from .models import Device, NetworkTask, TaskResult
 from .evpn_l2vpn import EVPNManager
 from .forms import (
@@ -22,29 +27,74 @@ from .forms import (
     HuaweiEthTrunkMLAGForm, InterfaceIPv6Form, VLANInterfaceIPv6Form, StaticRouteV6Form, OSPFv3ConfigForm
 )
 from .network_automation import execute_network_task
+from .device_cache import (
+    ACTIVE_DEVICES_KEY, ACTIVE_DEVICES_TIMEOUT, DEVICE_LISTING_TIMEOUT, device_listing_cache_key
+)
+from .tasks import get_task_status, submit_task
+
+# Interface-name patterns used by the show-output parsers, compiled once
+_HUAWEI_IFACE_TOKEN_RE = re.compile(r'GigabitEthernet|10GE|25GE|40GE|100GE|Ethernet')
+_CISCO_IFACE_TOKEN_RE = re.compile(r'GigabitEthernet|TenGigabitEthernet|FastEthernet|Ethernet')
+_JUNIPER_IFACE_TOKEN_RE = re.compile(r'ge-|xe-|et-|ae')
+
+# Textarea inputs, one entry per line: each match is a non-blank line without its surrounding whitespace
+_LINES_RE = re.compile(r'\S[^\n]*\S|\S')
+# "VNI:BD" lines of the NVE form; lines without exactly one colon are skipped
+_VNI_MAPPING_RE = re.compile(r'^[^\S\n]*([^:\n]*?)[^\S\n]*:[^\S\n]*([^:\n]*?)[^\S\n]*$', re.M)
+
+
+class CachedCountPaginator(Paginator):
+    """Paginator that keeps large COUNT(*) results in the cache for a short time.
+    Small tables are always counted exactly, so new rows show up immediately.
+    """
+    
+    def __init__(self, *args, cache_key=None, timeout=30, cache_threshold=1000, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_key = cache_key
+        self.timeout = timeout
+        self.cache_threshold = cache_threshold
+    
+    @cached_property
+    def count(self):
+        value = cache.get(self.cache_key) if self.cache_key else None
+        if value is None:
+            value = super().count
+            if self.cache_key and value > self.cache_threshold:
+                cache.set(self.cache_key, value, self.timeout)
+        return value
+
 
+# Load balancers probe this several times a second; the body is encoded once here
+_HEALTHCHECK_BODY = b'{"status": "ok"}'
 
+
+@never_cache
+@require_http_methods(["GET", "HEAD"])
 def healthcheck(request):
-    return JsonResponse({"status": "ok"})
+    return HttpResponse(_HEALTHCHECK_BODY, content_type='application/json')
 
 
 def index(request):
     """Dashboard view showing overview of devices and recent tasks"""
-    device_count = Device.objects.count()
-    active_devices = Device.objects.filter(is_active=True).count()
-    recent_tasks = NetworkTask.objects.order_by('-created_at')[:5]
-    
-    # Task status statistics
-    task_stats = {
-        'pending': NetworkTask.objects.filter(status='pending').count(),
-        'running': NetworkTask.objects.filter(status='running').count(),
-        'completed': NetworkTask.objects.filter(status='completed').count(),
-        'failed': NetworkTask.objects.filter(status='failed').count(),
-    }
+    device_stats = Device.objects.aggregate(
+        total=Count('id'),
+        active=Count('id', filter=Q(is_active=True)),
+    )
+    recent_tasks = (NetworkTask.objects.select_related('device')
+                    .only('id', 'task_type', 'status', 'created_at', 'device__name')
+                    .order_by('-created_at')[:5])
+    
+    # Task status statistics, counted in one pass over the table
+    task_stats = NetworkTask.objects.aggregate(
+        pending=Count('id', filter=Q(status='pending')),
+        running=Count('id', filter=Q(status='running')),
+        completed=Count('id', filter=Q(status='completed')),
+        failed=Count('id', filter=Q(status='failed')),
+    )
     
     context = {
-        'device_count': device_count,
-        'active_devices': active_devices,
+        'device_count': device_stats['total'],
+        'active_devices': device_stats['active'],
         'recent_tasks': recent_tasks,
         'task_stats': task_stats,
     }
@@ -54,7 +104,7 @@ def index(request):
 def device_list(request):
     """List all devices with pagination"""
     devices = Device.objects.all().order_by('name')
-    paginator = Paginator(devices, 10)  # Show 10 devices per page
+    paginator = CachedCountPaginator(devices, 10, cache_key='devices:count')  # Show 10 devices per page
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
     
@@ -141,7 +191,7 @@ def device_test(request):
             
             if success:
                 device.last_connected = timezone.now()
-                device.save()
+                device.save(update_fields=['last_connected'])
                 messages.success(request, f'Successfully connected to {device.name}!')
                 context = {
                     'form': DeviceTestForm(),
@@ -158,9 +208,30 @@ def device_test(request):
     return render(request, 'automation/device_test.html', context)
 
 
+TASKS_PER_PAGE = 20
+
+
+def _task_cursor(task):
+    """Cursor for the page after task: its created_at and, to break timestamp ties, its id"""
+    return f"{task.created_at.isoformat()}_{task.id}"
+
+
+def _parse_task_cursor(value):
+    """(created_at, id) of the last task on the previous page, or None for a missing or bad cursor"""
+    created_at, _, task_id = (value or '').rpartition('_')
+    if not task_id.isdigit():
+        return None
+    try:
+        created_at = parse_datetime(created_at)
+    except ValueError:
+        return None
+    return (created_at, int(task_id)) if created_at is not None else None
+
+
 def task_list(request):
     """List all tasks with filtering and pagination"""
-    tasks = NetworkTask.objects.all().order_by('-created_at')
+    # id breaks ties between tasks created in the same instant, so the cursor below is unambiguous
+    tasks = NetworkTask.objects.select_related('device', 'created_by').order_by('-created_at', '-id')
     
     # Filter by status if provided
     status_filter = request.GET.get('status')
@@ -172,12 +243,30 @@ def task_list(request):
     if device_filter:
         tasks = tasks.filter(device_id=device_filter)
     
-    paginator = Paginator(tasks, 20)  # Show 20 tasks per page
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
+    cursor = _parse_task_cursor(request.GET.get('cursor'))
+    if cursor is not None:
+        # Pages after the first seek past the last task shown instead of skipping an OFFSET
+        created_at, task_id = cursor
+        page_obj = list(tasks.filter(
+            Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=task_id)
+        )[:TASKS_PER_PAGE + 1])
+        has_next = len(page_obj) > TASKS_PER_PAGE
+        page_obj = page_obj[:TASKS_PER_PAGE]
+    else:
+        # Only well-formed filter values become part of a cache key
+        cacheable = (status_filter or 'pending') in dict(NetworkTask.STATUS_CHOICES) and (device_filter or '0').isdigit()
+        cache_key = f"tasks:count:{status_filter or ''}:{device_filter or ''}" if cacheable else None
+        paginator = CachedCountPaginator(tasks, TASKS_PER_PAGE, cache_key=cache_key)
+        page_number = request.GET.get('page')
+        page_obj = paginator.get_page(page_number)
+        has_next = page_obj.has_next()
+    next_cursor = _task_cursor(page_obj[-1]) if has_next else None
     
     # Get devices for filter dropdown
-    devices = Device.objects.filter(is_active=True).order_by('name')
+    devices = cache.get(ACTIVE_DEVICES_KEY)
+    if devices is None:
+        devices = list(Device.objects.filter(is_active=True).order_by('name').values('id', 'name'))
+        cache.set(ACTIVE_DEVICES_KEY, devices, ACTIVE_DEVICES_TIMEOUT)
     
     context = {
         'page_obj': page_obj,
@@ -185,18 +274,17 @@ def task_list(request):
         'current_status': status_filter,
         'current_device': device_filter,
         'status_choices': NetworkTask.STATUS_CHOICES,
+        'is_cursor_page': cursor is not None,
+        'next_cursor': next_cursor,
     }
     return render(request, 'automation/task_list.html', context)
 
 
 def task_detail(request, task_id):
     """View task details and results"""
-    task = get_object_or_404(NetworkTask, id=task_id)
-    
-    try:
-        task_result = task.taskresult
-    except TaskResult.DoesNotExist:
-        task_result = None
+    task = get_object_or_404(NetworkTask.objects.select_related('device', 'created_by', 'taskresult'), id=task_id)
+    # Joined above; a task without a result raises RelatedObjectDoesNotExist, an AttributeError
+    task_result = getattr(task, 'taskresult', None)
     
     context = {
         'task': task,
@@ -210,28 +298,26 @@ def execute_task_async(task):
     import logging
     logger = logging.getLogger(__name__)
     
-    logger.info(f"Starting async execution for task {task.id}: {task.task_type}")
-    print(f"ASYNC DEBUG: Starting execution for task {task.id}: {task.task_type}")
-    print(f"ASYNC DEBUG: Task parameters: {task.parameters}")
+    logger.info("Starting async execution for task %s: %s", task.id, task.task_type)
+    # Values are left out: some tasks carry passwords in their parameters
+    logger.debug("Task %s parameters: %s", task.id, sorted(task.parameters))
     
     task.status = 'running'
     task.started_at = timezone.now()
-    task.save()
+    task.save(update_fields=['status', 'started_at'])
     
     try:
-        print(f"ASYNC DEBUG: About to call execute_network_task")
         success, result, error = execute_network_task(
             task.device.get_connection_params(),
             task.task_type,
             task.parameters
         )
-        print(f"ASYNC DEBUG: execute_network_task returned: success={success}")
+        logger.debug("Task %s finished on the device: success=%s", task.id, success)
         
         task.completed_at = timezone.now()
         if success:
             task.status = 'completed'
             task.result = result
-            print(f"ASYNC DEBUG: Task completed successfully")
             
             # Create task result
             TaskResult.objects.create(
@@ -251,16 +337,38 @@ def execute_task_async(task):
                 execution_time=(task.completed_at - task.started_at).total_seconds()
             )
         
-        task.save()
+        task.save(update_fields=['status', 'result', 'error_message', 'completed_at'])
         
     except Exception as e:
-        print(f"ASYNC DEBUG: EXCEPTION in execute_task_async: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Task %s crashed during execution", task.id)
         task.status = 'failed'
         task.error_message = str(e)
         task.completed_at = timezone.now()
-        task.save()
+        task.save(update_fields=['status', 'error_message', 'completed_at'])
+
+
+def _submit_task(request, form, device_form, task_type, label, make_params):
+    """Create a task_type NetworkTask from the bound forms and queue it for execution.
+    
+    make_params builds the task parameters from form.cleaned_data. Returns the
+    redirect to the task page, or None if either form is invalid so the caller
+    can re-render it with errors.
+    """
+    if not (form.is_valid() and device_form.is_valid()):
+        return None
+    
+    device = device_form.cleaned_data['device']
+    with transaction.atomic():
+        task = NetworkTask.objects.create(
+            device=device,
+            task_type=task_type,
+            parameters=make_params(form.cleaned_data),
+            created_by=request.user
+        )
+        submit_task(execute_task_async, task)
+    
+    messages.success(request, f'{label} task submitted for {device.name}')
+    return redirect('task_detail', task_id=task.id)
 
 
 @login_required
@@ -270,26 +378,15 @@ def vlan_create(request):
         form = VLANCreateForm(request.POST)
         device_form = DeviceSelectionForm(request.POST)
         
-        if form.is_valid() and device_form.is_valid():
-            device = device_form.cleaned_data['device']
-            
-            # Create network task
-            task = NetworkTask.objects.create(
-                device=device,
-                task_type='vlan_create',
-                parameters={
-                    'vlan_id': form.cleaned_data['vlan_id'],
-                    'vlan_name': form.cleaned_data.get('vlan_name', '')
-                },
-                created_by=request.user
-            )
-            
-            # Execute task asynchronously
-            thread = threading.Thread(target=execute_task_async, args=(task,))
-            thread.start()
-            
-            messages.success(request, f'VLAN creation task submitted for {device.name}')
-            return redirect('task_detail', task_id=task.id)
+        response = _submit_task(
+            request, form, device_form, 'vlan_create', 'VLAN creation',
+            lambda data: {
+                'vlan_id': data['vlan_id'],
+                'vlan_name': data.get('vlan_name', '')
+            },
+        )
+        if response is not None:
+            return response
     else:
         form = VLANCreateForm()
         device_form = DeviceSelectionForm()
@@ -310,23 +407,12 @@ def vlan_delete(request):
         form = VLANDeleteForm(request.POST)
         device_form = DeviceSelectionForm(request.POST)
         
-        if form.is_valid() and device_form.is_valid():
-            device = device_form.cleaned_data['device']
-            
-            # Create network task
-            task = NetworkTask.objects.create(
-                device=device,
-                task_type='vlan_delete',
-                parameters={'vlan_id': form.cleaned_data['vlan_id']},
-                created_by=request.user
-            )
-            
-            # Execute task asynchronously
-            thread = threading.Thread(target=execute_task_async, args=(task,))
-            thread.start()
-            
-            messages.success(request, f'VLAN deletion task submitted for {device.name}')
-            return redirect('task_detail', task_id=task.id)
+        response = _submit_task(
+            request, form, device_form, 'vlan_delete', 'VLAN deletion',
+            lambda data: {'vlan_id': data['vlan_id']},
+        )
+        if response is not None:
+            return response
     else:
         form = VLANDeleteForm()
         device_form = DeviceSelectionForm()
@@ -340,6 +426,23 @@ def vlan_delete(request):
     return render(request, 'automation/vlan_form.html', context)
 
 
+def _interface_config_params(data):
+    """Task parameters for interface_config; the extra keys depend on the mode"""
+    parameters = {
+        'interface': data['interface'],
+        'mode': data['mode']
+    }
+    
+    if data['mode'] == 'access':
+        parameters['vlan_id'] = data['vlan_id']
+    elif data['mode'] == 'trunk':
+        parameters['allowed_vlans'] = data.get('allowed_vlans', 'all')
+    elif data['mode'] == 'ip':
+        parameters['ip_address'] = data['ip_address']
+        parameters['subnet_mask'] = data['subnet_mask']
+    return parameters
+
+
 @login_required
 def interface_config(request):
     """Configure interface on selected device"""
@@ -347,37 +450,12 @@ def interface_config(request):
         form = InterfaceConfigForm(request.POST)
         device_form = DeviceSelectionForm(request.POST)
         
-        if form.is_valid() and device_form.is_valid():
-            device = device_form.cleaned_data['device']
-            
-            # Prepare parameters based on mode
-            parameters = {
-                'interface': form.cleaned_data['interface'],
-                'mode': form.cleaned_data['mode']
-            }
-            
-            if form.cleaned_data['mode'] == 'access':
-                parameters['vlan_id'] = form.cleaned_data['vlan_id']
-            elif form.cleaned_data['mode'] == 'trunk':
-                parameters['allowed_vlans'] = form.cleaned_data.get('allowed_vlans', 'all')
-            elif form.cleaned_data['mode'] == 'ip':
-                parameters['ip_address'] = form.cleaned_data['ip_address']
-                parameters['subnet_mask'] = form.cleaned_data['subnet_mask']
-            
-            # Create network task
-            task = NetworkTask.objects.create(
-                device=device,
-                task_type='interface_config',
-                parameters=parameters,
-                created_by=request.user
-            )
-            
-            # Execute task asynchronously
-            thread = threading.Thread(target=execute_task_async, args=(task,))
-            thread.start()
-            
-            messages.success(request, f'Interface configuration task submitted for {device.name}')
-            return redirect('task_detail', task_id=task.id)
+        response = _submit_task(
+            request, form, device_form, 'interface_config', 'Interface configuration',
+            _interface_config_params,
+        )
+        if response is not None:
+            return response
     else:
         form = InterfaceConfigForm()
         device_form = DeviceSelectionForm()
@@ -397,29 +475,18 @@ def routing_static(request):
         form = StaticRouteForm(request.POST)
         device_form = DeviceSelectionForm(request.POST)
         
-        if form.is_valid() and device_form.is_valid():
-            device = device_form.cleaned_data['device']
-            
-            # Create network task
-            task = NetworkTask.objects.create(
-                device=device,
-                task_type='routing_static',
-                parameters={
-                    'action': form.cleaned_data['action'],
-                    'network': form.cleaned_data['network'],
-                    'mask': form.cleaned_data['mask'],
-                    'next_hop': form.cleaned_data['next_hop'],
-                    'vrf_name': form.cleaned_data.get('vrf_name')
-                },
-                created_by=request.user
-            )
-            
-            # Execute task asynchronously
-            thread = threading.Thread(target=execute_task_async, args=(task,))
-            thread.start()
-            
-            messages.success(request, f'Static routing task submitted for {device.name}')
-            return redirect('task_detail', task_id=task.id)
+        response = _submit_task(
+            request, form, device_form, 'routing_static', 'Static routing',
+            lambda data: {
+                'action': data['action'],
+                'network': data['network'],
+                'mask': data['mask'],
+                'next_hop': data['next_hop'],
+                'vrf_name': data.get('vrf_name')
+            },
+        )
+        if response is not None:
+            return response
     else:
         form = StaticRouteForm()
         device_form = DeviceSelectionForm()
@@ -439,28 +506,17 @@ def routing_ospf(request):
         form = OSPFConfigForm(request.POST)
         device_form = DeviceSelectionForm(request.POST)
         
-        if form.is_valid() and device_form.is_valid():
-            device = device_form.cleaned_data['device']
-            
-            # Create network task
-            task = NetworkTask.objects.create(
-                device=device,
-                task_type='routing_ospf',
-                parameters={
-                    'process_id': form.cleaned_data['process_id'],
-                    'router_id': form.cleaned_data['router_id'],
-                    'networks': form.cleaned_data['networks'],
-                    'vrf_name': form.cleaned_data.get('vrf_name')
-                },
-                created_by=request.user
-            )
-            
-            # Execute task asynchronously
-            thread = threading.Thread(target=execute_task_async, args=(task,))
-            thread.start()
-            
-            messages.success(request, f'OSPF configuration task submitted for {device.name}')
-            return redirect('task_detail', task_id=task.id)
+        response = _submit_task(
+            request, form, device_form, 'routing_ospf', 'OSPF configuration',
+            lambda data: {
+                'process_id': data['process_id'],
+                'router_id': data['router_id'],
+                'networks': data['networks'],
+                'vrf_name': data.get('vrf_name')
+            },
+        )
+        if response is not None:
+            return response
     else:
         form = OSPFConfigForm()
         device_form = DeviceSelectionForm()
@@ -473,58 +529,59 @@ def routing_ospf(request):
     return render(request, 'automation/ospf_form.html', context)
 
 
+# URL command_type -> NetworkTask task_type for show_command
+SHOW_COMMAND_TASKS = {
+    'version': 'show_version',
+    'interfaces': 'show_interfaces',
+    'vlan': 'show_vlan',
+    'routes': 'show_routes',
+    'config': 'backup_config'
+}
+
+
 @login_required
 def show_command(request, command_type):
     """Execute show commands on selected device"""
     import logging
     logger = logging.getLogger(__name__)
     
-    command_map = {
-        'version': 'show_version',
-        'interfaces': 'show_interfaces',
-        'vlan': 'show_vlan',
-        'routes': 'show_routes',
-        'config': 'backup_config'
-    }
-    
-    if command_type not in command_map:
+    if command_type not in SHOW_COMMAND_TASKS:
         messages.error(request, 'Invalid command type')
         return redirect('index')
     
     if request.method == 'POST':
-        logger.info(f"Show command POST request: {command_type}, User: {request.user}")
+        logger.debug("Show command POST request: %s, User: %s", command_type, request.user)
         
         # Use special form for routes command to support VRF
         if command_type == 'routes':
-            from .forms import ShowRoutesForm
             form = ShowRoutesForm(request.POST)
             if form.is_valid():
                 device = form.cleaned_data['device']
                 vrf_name = form.cleaned_data.get('vrf_name')
-                logger.info(f"Device selected: {device.name} ({device.device_type}), VRF: {vrf_name or 'global'}")
+                logger.debug("Device selected: %s (%s), VRF: %s", device.name, device.device_type, vrf_name or 'global')
                 
                 # Create network task with VRF parameter
                 parameters = {}
                 if vrf_name:
                     parameters['vrf_name'] = vrf_name
                 
-                task = NetworkTask.objects.create(
-                    device=device,
-                    task_type=command_map[command_type],
-                    parameters=parameters,
-                    created_by=request.user
-                )
-                logger.info(f"Task created: ID {task.id}, Type: {task.task_type}, Parameters: {parameters}")
-                
-                # Execute task asynchronously
-                thread = threading.Thread(target=execute_task_async, args=(task,))
-                thread.start()
-                logger.info(f"Background thread started for task {task.id}")
+                with transaction.atomic():
+                    task = NetworkTask.objects.create(
+                        device=device,
+                        task_type=SHOW_COMMAND_TASKS[command_type],
+                        parameters=parameters,
+                        created_by=request.user
+                    )
+                    logger.debug("Task created: ID %s, Type: %s, Parameters: %s", task.id, task.task_type, parameters)
+                    
+                    # Execute task asynchronously
+                    submit_task(execute_task_async, task)
+                logger.debug("Task %s queued for execution", task.id)
                 
                 messages.success(request, f'Routes command submitted for {device.name}{f" (VRF: {vrf_name})" if vrf_name else ""}')
                 return redirect('task_detail', task_id=task.id)
             else:
-                logger.error(f"Routes form validation failed: {form.errors}")
+                logger.error("Routes form validation failed: %s", form.errors)
                 messages.error(request, 'Please correct the form errors')
         else:
             # Use regular device selection form for other commands
@@ -532,31 +589,30 @@ def show_command(request, command_type):
             
             if device_form.is_valid():
                 device = device_form.cleaned_data['device']
-                logger.info(f"Device selected: {device.name} ({device.device_type})")
+                logger.debug("Device selected: %s (%s)", device.name, device.device_type)
                 
                 # Create network task
-                task = NetworkTask.objects.create(
-                    device=device,
-                    task_type=command_map[command_type],
-                    parameters={},
-                    created_by=request.user
-                )
-                logger.info(f"Task created: ID {task.id}, Type: {task.task_type}")
-                
-                # Execute task asynchronously
-                thread = threading.Thread(target=execute_task_async, args=(task,))
-                thread.start()
-                logger.info(f"Background thread started for task {task.id}")
+                with transaction.atomic():
+                    task = NetworkTask.objects.create(
+                        device=device,
+                        task_type=SHOW_COMMAND_TASKS[command_type],
+                        parameters={},
+                        created_by=request.user
+                    )
+                    logger.debug("Task created: ID %s, Type: %s", task.id, task.task_type)
+                    
+                    # Execute task asynchronously
+                    submit_task(execute_task_async, task)
+                logger.debug("Task %s queued for execution", task.id)
                 
                 messages.success(request, f'{command_type.title()} command submitted for {device.name}')
                 return redirect('task_detail', task_id=task.id)
             else:
-                logger.error(f"Device form validation failed: {device_form.errors}")
+                logger.error("Device form validation failed: %s", device_form.errors)
                 messages.error(request, 'Please select a device')
     else:
         # Initialize forms based on command type
         if command_type == 'routes':
-            from .forms import ShowRoutesForm
             form = ShowRoutesForm()
         else:
             device_form = DeviceSelectionForm()
@@ -578,165 +634,6 @@ def show_command(request, command_type):
     return render(request, 'automation/show_command_form.html', context)
 
 
-@require_http_methods(["GET"])
-def api_task_status(request, task_id):
-    """API endpoint to get task status (for AJAX polling)"""
-    try:
-        task = NetworkTask.objects.get(id=task_id)
-        data = {
-            'status': task.status,
-            'started_at': task.started_at.isoformat() if task.started_at else None,
-            'completed_at': task.completed_at.isoformat() if task.completed_at else None,
-            'result': task.result,
-            'error_message': task.error_message
-        }
-        return JsonResponse(data)
-    except NetworkTask.DoesNotExist:
-        return JsonResponse({'error': 'Task not found'}, status=404)
-
-
-@require_http_methods(["GET"])
-def api_device_interfaces(request, device_id):
-    """API endpoint to get device interfaces"""
-    try:
-        device = Device.objects.get(id=device_id, is_active=True)
-        
-        # Execute show interfaces command
-        success, result, error = execute_network_task(
-            device.get_connection_params(),
-            'show_interfaces',
-            {}
-        )
-        
-        if not success:
-            return JsonResponse({'error': f'Failed to get interfaces: {error}'}, status=500)
-        
-        # Parse interfaces from the output
-        interfaces = parse_interfaces_from_output(result, device.device_type)
-        
-        return JsonResponse({'interfaces': interfaces})
-        
-    except Device.DoesNotExist:
-        return JsonResponse({'error': 'Device not found'}, status=404)
-    except Exception as e:
-        return JsonResponse({'error': str(e)}, status=500)
-
-
-@require_http_methods(["GET"])
-def api_device_vrfs(request, device_id):
-    """API endpoint to get device VRFs"""
-    try:
-        device = Device.objects.get(id=device_id, is_active=True)
-        
-        # Execute show VRFs command
-        if 'cisco' in device.device_type:
-            command = 'show ip vrf'
-        elif 'huawei' in device.device_type:
-            command = 'display ip vpn-instance'
-        else:
-            return JsonResponse({'error': f'Unsupported device type: {device.device_type}'}, status=400)
-        
-        from .network_automation import NetworkDeviceManager
-        try:
-            device_manager = NetworkDeviceManager(device.get_connection_params())
-            device_manager.connect()
-            result = device_manager.execute_command(command)
-            device_manager.disconnect()
-            
-            # Parse VRFs from the output
-            vrfs = parse_vrfs_from_output(result, device.device_type)
-            
-            return JsonResponse({'vrfs': vrfs})
-            
-        except Exception as e:
-            return JsonResponse({'vrfs': []})  # Return empty list if VRFs can't be retrieved
-        
-    except Device.DoesNotExist:
-        return JsonResponse({'error': 'Device not found'}, status=404)
-    except Exception as e:
-        return JsonResponse({'error': str(e)}, status=500)
-
-
-def parse_interfaces_from_output(output, device_type):
-    """Parse interface names from show interfaces output"""
-    interfaces = []
-    
-    if 'cisco' in device_type:
-        # Parse Cisco interface output
-        for line in output.split('\n'):
-            line = line.strip()
-            if line and not line.startswith(' ') and ' is ' in line:
-                interface_name = line.split(' is ')[0].strip()
-                if (interface_name and not interface_name.startswith('Interface') and
-                    (interface_name.startswith(('GigabitEthernet', 'FastEthernet', 'Ethernet', 'TenGigabitEthernet', 
-                                               'TenGigE', 'Loopback', 'Vlan', 'Serial', 'Tunnel')))):
-                    interfaces.append(interface_name)
-    
-    elif 'huawei' in device_type:
-        # Parse Huawei interface output
-        import re
-        for line in output.split('\n'):
-            line = line.strip()
-            if line and (line.startswith('GigabitEthernet') or line.startswith('Ethernet') or 
-                        line.startswith('FastEthernet') or line.startswith('TenGigabitEthernet') or
-                        line.startswith('100GE') or line.startswith('10GE') or
-                        re.match(r'^G\d+/\d+/\d+', line) or  # Match G1/0/1 pattern
-                        line.startswith('Vlanif') or line.startswith('LoopBack')):
-                interface_name = line.split()[0]
-                if interface_name:
-                    interfaces.append(interface_name)
-    
-    # Remove duplicates and sort
-    interfaces = sorted(list(set(interfaces)))
-    
-    # Add some common interface types if parsing failed
-    if not interfaces:
-        if 'cisco' in device_type:
-            interfaces = [
-                'GigabitEthernet0/0', 'GigabitEthernet0/1', 'GigabitEthernet0/2', 'GigabitEthernet0/3',
-                'TenGigabitEthernet0/0', 'TenGigabitEthernet0/1',
-                'FastEthernet0/0', 'FastEthernet0/1', 'Loopback0', 'Loopback1', 'Vlan1'
-            ]
-        elif 'huawei' in device_type:
-            interfaces = [
-                'GigabitEthernet0/0/1', 'GigabitEthernet0/0/2', 'GigabitEthernet0/0/3', 'GigabitEthernet0/0/4',
-                '100GE1/0/1', '100GE1/0/2', '10GE1/0/1', '10GE1/0/2',
-                'G1/0/1', 'G1/0/2', 'G1/0/3', 'G1/0/4',
-                'Ethernet0/0/1', 'Ethernet0/0/2', 'LoopBack0', 'LoopBack1', 'Vlanif1'
-            ]
-    
-    return interfaces
-
-
-def parse_vrfs_from_output(output, device_type):
-    """Parse VRF names from show VRF output"""
-    vrfs = []
-    
-    if 'cisco' in device_type:
-        # Parse Cisco VRF output
-        for line in output.split('\n'):
-            line = line.strip()
-            if line and not line.startswith('Name') and not line.startswith('---'):
-                parts = line.split()
-                if parts and not parts[0].lower() in ['name', 'default']:
-                    vrfs.append(parts[0])
-    
-    elif 'huawei' in device_type:
-        # Parse Huawei VRF output
-        for line in output.split('\n'):
-            line = line.strip()
-            if 'vpn-instance' in line.lower():
-                parts = line.split()
-                for i, part in enumerate(parts):
-                    if part.lower() == 'vpn-instance' and i + 1 < len(parts):
-                        vrfs.append(parts[i + 1])
-    
-    # Remove duplicates and sort
-    vrfs = sorted(list(set(vrfs)))
-    
-    return vrfs
-
-
 @login_required
 def vrf_create(request):
     """Create VRF on selected device"""
@@ -744,29 +641,18 @@ def vrf_create(request):
         form = VRFCreateForm(request.POST)
         device_form = DeviceSelectionForm(request.POST)
         
-        if form.is_valid() and device_form.is_valid():
-            device = device_form.cleaned_data['device']
-            
-            # Create network task
-            task = NetworkTask.objects.create(
-                device=device,
-                task_type='vrf_create',
-                parameters={
-                    'vrf_name': form.cleaned_data['vrf_name'],
-                    'rd': form.cleaned_data.get('rd', ''),
-                    'description': form.cleaned_data.get('description', ''),
-                    'import_rt': form.cleaned_data.get('import_rt', ''),
-                    'export_rt': form.cleaned_data.get('export_rt', '')
-                },
-                created_by=request.user
-            )
-            
-            # Execute task asynchronously
-            thread = threading.Thread(target=execute_task_async, args=(task,))
-            thread.start()
-            
-            messages.success(request, f'VRF creation task submitted for {device.name}')
-            return redirect('task_detail', task_id=task.id)
+        response = _submit_task(
+            request, form, device_form, 'vrf_create', 'VRF creation',
+            lambda data: {
+                'vrf_name': data['vrf_name'],
+                'rd': data.get('rd', ''),
+                'description': data.get('description', ''),
+                'import_rt': data.get('import_rt', ''),
+                'export_rt': data.get('export_rt', '')
+            },
+        )
+        if response is not None:
+            return response
     else:
         form = VRFCreateForm()
         device_form = DeviceSelectionForm()
@@ -787,28 +673,17 @@ def vrf_assign_interface(request):
         form = VRFAssignInterfaceForm(request.POST)
         device_form = DeviceSelectionForm(request.POST)
         
-        if form.is_valid() and device_form.is_valid():
-            device = device_form.cleaned_data['device']
-            
-            # Create network task
-            task = NetworkTask.objects.create(
-                device=device,
-                task_type='vrf_assign_interface',
-                parameters={
-                    'vrf_name': form.cleaned_data['vrf_name'],
-                    'interface': form.cleaned_data['interface'],
-                    'ip_address': form.cleaned_data.get('ip_address', ''),
-                    'subnet_mask': form.cleaned_data.get('subnet_mask', '')
-                },
-                created_by=request.user
-            )
-            
-            # Execute task asynchronously
-            thread = threading.Thread(target=execute_task_async, args=(task,))
-            thread.start()
-            
-            messages.success(request, f'VRF interface assignment task submitted for {device.name}')
-            return redirect('task_detail', task_id=task.id)
+        response = _submit_task(
+            request, form, device_form, 'vrf_assign_interface', 'VRF interface assignment',
+            lambda data: {
+                'vrf_name': data['vrf_name'],
+                'interface': data['interface'],
+                'ip_address': data.get('ip_address', ''),
+                'subnet_mask': data.get('subnet_mask', '')
+            },
+        )
+        if response is not None:
+            return response
     else:
         form = VRFAssignInterfaceForm()
         device_form = DeviceSelectionForm()
@@ -828,29 +703,18 @@ def bgp_neighbor(request):
         form = BGPNeighborForm(request.POST)
         device_form = DeviceSelectionForm(request.POST)
         
-        if form.is_valid() and device_form.is_valid():
-            device = device_form.cleaned_data['device']
-            
-            # Create network task
-            task = NetworkTask.objects.create(
-                device=device,
-                task_type='bgp_neighbor',
-                parameters={
-                    'as_number': form.cleaned_data['as_number'],
-                    'neighbor_ip': form.cleaned_data['neighbor_ip'],
-                    'remote_as': form.cleaned_data['remote_as'],
-                    'vrf_name': form.cleaned_data.get('vrf_name', ''),
-                    'description': form.cleaned_data.get('description', '')
-                },
-                created_by=request.user
-            )
-            
-            # Execute task asynchronously
-            thread = threading.Thread(target=execute_task_async, args=(task,))
-            thread.start()
-            
-            messages.success(request, f'BGP neighbor configuration task submitted for {device.name}')
-            return redirect('task_detail', task_id=task.id)
+        response = _submit_task(
+            request, form, device_form, 'bgp_neighbor', 'BGP neighbor configuration',
+            lambda data: {
+                'as_number': data['as_number'],
+                'neighbor_ip': data['neighbor_ip'],
+                'remote_as': data['remote_as'],
+                'vrf_name': data.get('vrf_name', ''),
+                'description': data.get('description', '')
+            },
+        )
+        if response is not None:
+            return response
     else:
         form = BGPNeighborForm()
         device_form = DeviceSelectionForm()
@@ -870,28 +734,17 @@ def bgp_network(request):
         form = BGPNetworkForm(request.POST)
         device_form = DeviceSelectionForm(request.POST)
         
-        if form.is_valid() and device_form.is_valid():
-            device = device_form.cleaned_data['device']
-            
-            # Create network task
-            task = NetworkTask.objects.create(
-                device=device,
-                task_type='bgp_network',
-                parameters={
-                    'as_number': form.cleaned_data['as_number'],
-                    'network': form.cleaned_data['network'],
-                    'mask': form.cleaned_data['mask'],
-                    'vrf_name': form.cleaned_data.get('vrf_name', '')
-                },
-                created_by=request.user
-            )
-            
-            # Execute task asynchronously
-            thread = threading.Thread(target=execute_task_async, args=(task,))
-            thread.start()
-            
-            messages.success(request, f'BGP network advertisement task submitted for {device.name}')
-            return redirect('task_detail', task_id=task.id)
+        response = _submit_task(
+            request, form, device_form, 'bgp_network', 'BGP network advertisement',
+            lambda data: {
+                'as_number': data['as_number'],
+                'network': data['network'],
+                'mask': data['mask'],
+                'vrf_name': data.get('vrf_name', '')
+            },
+        )
+        if response is not None:
+            return response
     else:
         form = BGPNetworkForm()
         device_form = DeviceSelectionForm()
@@ -911,29 +764,18 @@ def bgp_vrf_config(request):
         form = BGPVRFConfigForm(request.POST)
         device_form = DeviceSelectionForm(request.POST)
         
-        if form.is_valid() and device_form.is_valid():
-            device = device_form.cleaned_data['device']
-            
-            # Create network task
-            task = NetworkTask.objects.create(
-                device=device,
-                task_type='bgp_vrf_config',
-                parameters={
-                    'as_number': form.cleaned_data['as_number'],
-                    'vrf_name': form.cleaned_data['vrf_name'],
-                    'router_id': form.cleaned_data.get('router_id', ''),
-                    'import_rt': form.cleaned_data.get('import_rt', ''),
-                    'export_rt': form.cleaned_data.get('export_rt', '')
-                },
-                created_by=request.user
-            )
-            
-            # Execute task asynchronously
-            thread = threading.Thread(target=execute_task_async, args=(task,))
-            thread.start()
-            
-            messages.success(request, f'BGP VRF configuration task submitted for {device.name}')
-            return redirect('task_detail', task_id=task.id)
+        response = _submit_task(
+            request, form, device_form, 'bgp_vrf_config', 'BGP VRF configuration',
+            lambda data: {
+                'as_number': data['as_number'],
+                'vrf_name': data['vrf_name'],
+                'router_id': data.get('router_id', ''),
+                'import_rt': data.get('import_rt', ''),
+                'export_rt': data.get('export_rt', '')
+            },
+        )
+        if response is not None:
+            return response
     else:
         form = BGPVRFConfigForm()
         device_form = DeviceSelectionForm()
@@ -953,30 +795,19 @@ def vlan_interface_config(request):
         form = VLANInterfaceConfigForm(request.POST)
         device_form = DeviceSelectionForm(request.POST)
         
-        if form.is_valid() and device_form.is_valid():
-            device = device_form.cleaned_data['device']
-            
-            # Create network task
-            task = NetworkTask.objects.create(
-                device=device,
-                task_type='vlan_interface_config',
-                parameters={
-                    'vlan_id': form.cleaned_data['vlan_id'],
-                    'ip_address': form.cleaned_data['ip_address'],
-                    'subnet_mask': form.cleaned_data['subnet_mask'],
-                    'vrf_name': form.cleaned_data.get('vrf_name'),
-                    'description': form.cleaned_data.get('description'),
-                    'enable_interface': form.cleaned_data.get('enable_interface', True)
-                },
-                created_by=request.user
-            )
-            
-            # Execute task asynchronously
-            thread = threading.Thread(target=execute_task_async, args=(task,))
-            thread.start()
-            
-            messages.success(request, f'VLAN interface configuration task submitted for {device.name}')
-            return redirect('task_detail', task_id=task.id)
+        response = _submit_task(
+            request, form, device_form, 'vlan_interface_config', 'VLAN interface configuration',
+            lambda data: {
+                'vlan_id': data['vlan_id'],
+                'ip_address': data['ip_address'],
+                'subnet_mask': data['subnet_mask'],
+                'vrf_name': data.get('vrf_name'),
+                'description': data.get('description'),
+                'enable_interface': data.get('enable_interface', True)
+            },
+        )
+        if response is not None:
+            return response
     else:
         form = VLANInterfaceConfigForm()
         device_form = DeviceSelectionForm()
@@ -989,6 +820,20 @@ def vlan_interface_config(request):
     return render(request, 'automation/vlan_interface_form.html', context)
 
 
+def _bgp_route_reflector_params(data):
+    """Task parameters for bgp_route_reflector"""
+    # Process clients (one per line)
+    clients_text = data.get('clients', '')
+    clients = _LINES_RE.findall(clients_text)
+    
+    return {
+        'as_number': data['as_number'],
+        'router_id': data['router_id'],
+        'cluster_id': data['cluster_id'],
+        'clients': clients
+    }
+
+
 @login_required
 def bgp_route_reflector(request):
     """Configure BGP Route Reflector on selected device"""
@@ -996,32 +841,12 @@ def bgp_route_reflector(request):
         form = BGPRouteReflectorForm(request.POST)
         device_form = DeviceSelectionForm(request.POST)
         
-        if form.is_valid() and device_form.is_valid():
-            device = device_form.cleaned_data['device']
-            
-            # Process clients (one per line)
-            clients_text = form.cleaned_data.get('clients', '')
-            clients = [client.strip() for client in clients_text.split('\n') if client.strip()]
-            
-            # Create network task
-            task = NetworkTask.objects.create(
-                device=device,
-                task_type='bgp_route_reflector',
-                parameters={
-                    'as_number': form.cleaned_data['as_number'],
-                    'router_id': form.cleaned_data['router_id'],
-                    'cluster_id': form.cleaned_data['cluster_id'],
-                    'clients': clients
-                },
-                created_by=request.user
-            )
-            
-            # Execute task asynchronously
-            thread = threading.Thread(target=execute_task_async, args=(task,))
-            thread.start()
-            
-            messages.success(request, f'BGP Route Reflector configuration task submitted for {device.name}')
-            return redirect('task_detail', task_id=task.id)
+        response = _submit_task(
+            request, form, device_form, 'bgp_route_reflector', 'BGP Route Reflector configuration',
+            _bgp_route_reflector_params,
+        )
+        if response is not None:
+            return response
     else:
         form = BGPRouteReflectorForm()
         device_form = DeviceSelectionForm()
@@ -1034,6 +859,19 @@ def bgp_route_reflector(request):
     return render(request, 'automation/bgp_route_reflector_form.html', context)
 
 
+def _bgp_confederation_params(data):
+    """Task parameters for bgp_confederation"""
+    # Process confederation peers (one per line)
+    peers_text = data.get('confederation_peers', '')
+    peers = _LINES_RE.findall(peers_text)
+    
+    return {
+        'as_number': data['as_number'],
+        'confederation_id': data['confederation_id'],
+        'confederation_peers': peers
+    }
+
+
 @login_required
 def bgp_confederation(request):
     """Configure BGP Confederation on selected device"""
@@ -1041,31 +879,12 @@ def bgp_confederation(request):
         form = BGPConfederationForm(request.POST)
         device_form = DeviceSelectionForm(request.POST)
         
-        if form.is_valid() and device_form.is_valid():
-            device = device_form.cleaned_data['device']
-            
-            # Process confederation peers (one per line)
-            peers_text = form.cleaned_data.get('confederation_peers', '')
-            peers = [peer.strip() for peer in peers_text.split('\n') if peer.strip()]
-            
-            # Create network task
-            task = NetworkTask.objects.create(
-                device=device,
-                task_type='bgp_confederation',
-                parameters={
-                    'as_number': form.cleaned_data['as_number'],
-                    'confederation_id': form.cleaned_data['confederation_id'],
-                    'confederation_peers': peers
-                },
-                created_by=request.user
-            )
-            
-            # Execute task asynchronously
-            thread = threading.Thread(target=execute_task_async, args=(task,))
-            thread.start()
-            
-            messages.success(request, f'BGP Confederation configuration task submitted for {device.name}')
-            return redirect('task_detail', task_id=task.id)
+        response = _submit_task(
+            request, form, device_form, 'bgp_confederation', 'BGP Confederation configuration',
+            _bgp_confederation_params,
+        )
+        if response is not None:
+            return response
     else:
         form = BGPConfederationForm()
         device_form = DeviceSelectionForm()
@@ -1085,27 +904,16 @@ def bgp_multipath(request):
         form = BGPMultipathForm(request.POST)
         device_form = DeviceSelectionForm(request.POST)
         
-        if form.is_valid() and device_form.is_valid():
-            device = device_form.cleaned_data['device']
-            
-            # Create network task
-            task = NetworkTask.objects.create(
-                device=device,
-                task_type='bgp_multipath',
-                parameters={
-                    'as_number': form.cleaned_data['as_number'],
-                    'ebgp_paths': form.cleaned_data['ebgp_paths'],
-                    'ibgp_paths': form.cleaned_data['ibgp_paths']
-                },
-                created_by=request.user
-            )
-            
-            # Execute task asynchronously
-            thread = threading.Thread(target=execute_task_async, args=(task,))
-            thread.start()
-            
-            messages.success(request, f'BGP Multipath configuration task submitted for {device.name}')
-            return redirect('task_detail', task_id=task.id)
+        response = _submit_task(
+            request, form, device_form, 'bgp_multipath', 'BGP Multipath configuration',
+            lambda data: {
+                'as_number': data['as_number'],
+                'ebgp_paths': data['ebgp_paths'],
+                'ibgp_paths': data['ibgp_paths']
+            },
+        )
+        if response is not None:
+            return response
     else:
         form = BGPMultipathForm()
         device_form = DeviceSelectionForm()
@@ -1125,29 +933,18 @@ def ospf_area(request):
         form = OSPFAreaForm(request.POST)
         device_form = DeviceSelectionForm(request.POST)
         
-        if form.is_valid() and device_form.is_valid():
-            device = device_form.cleaned_data['device']
-            
-            # Create network task
-            task = NetworkTask.objects.create(
-                device=device,
-                task_type='ospf_area',
-                parameters={
-                    'process_id': form.cleaned_data['process_id'],
-                    'area_id': form.cleaned_data['area_id'],
-                    'area_type': form.cleaned_data['area_type'],
-                    'stub_default_cost': form.cleaned_data.get('stub_default_cost'),
-                    'nssa_default_route': form.cleaned_data.get('nssa_default_route', False)
-                },
-                created_by=request.user
-            )
-            
-            # Execute task asynchronously
-            thread = threading.Thread(target=execute_task_async, args=(task,))
-            thread.start()
-            
-            messages.success(request, f'OSPF Area configuration task submitted for {device.name}')
-            return redirect('task_detail', task_id=task.id)
+        response = _submit_task(
+            request, form, device_form, 'ospf_area', 'OSPF Area configuration',
+            lambda data: {
+                'process_id': data['process_id'],
+                'area_id': data['area_id'],
+                'area_type': data['area_type'],
+                'stub_default_cost': data.get('stub_default_cost'),
+                'nssa_default_route': data.get('nssa_default_route', False)
+            },
+        )
+        if response is not None:
+            return response
     else:
         form = OSPFAreaForm()
         device_form = DeviceSelectionForm()
@@ -1167,30 +964,19 @@ def ospf_authentication(request):
         form = OSPFAuthenticationForm(request.POST)
         device_form = DeviceSelectionForm(request.POST)
         
-        if form.is_valid() and device_form.is_valid():
-            device = device_form.cleaned_data['device']
-            
-            # Create network task
-            task = NetworkTask.objects.create(
-                device=device,
-                task_type='ospf_authentication',
-                parameters={
-                    'process_id': form.cleaned_data['process_id'],
-                    'area_id': form.cleaned_data.get('area_id'),
-                    'interface': form.cleaned_data.get('interface'),
-                    'auth_type': form.cleaned_data['auth_type'],
-                    'key_id': form.cleaned_data['key_id'],
-                    'password': form.cleaned_data['password']
-                },
-                created_by=request.user
-            )
-            
-            # Execute task asynchronously
-            thread = threading.Thread(target=execute_task_async, args=(task,))
-            thread.start()
-            
-            messages.success(request, f'OSPF Authentication configuration task submitted for {device.name}')
-            return redirect('task_detail', task_id=task.id)
+        response = _submit_task(
+            request, form, device_form, 'ospf_authentication', 'OSPF Authentication configuration',
+            lambda data: {
+                'process_id': data['process_id'],
+                'area_id': data.get('area_id'),
+                'interface': data.get('interface'),
+                'auth_type': data['auth_type'],
+                'key_id': data['key_id'],
+                'password': data['password']
+            },
+        )
+        if response is not None:
+            return response
     else:
         form = OSPFAuthenticationForm()
         device_form = DeviceSelectionForm()
@@ -1210,28 +996,17 @@ def evpn_instance(request):
         form = EVPNInstanceForm(request.POST)
         device_form = DeviceSelectionForm(request.POST)
         
-        if form.is_valid() and device_form.is_valid():
-            device = device_form.cleaned_data['device']
-            
-            # Create network task
-            task = NetworkTask.objects.create(
-                device=device,
-                task_type='evpn_instance',
-                parameters={
-                    'evpn_instance': form.cleaned_data['evpn_instance'],
-                    'route_distinguisher': form.cleaned_data['route_distinguisher'],
-                    'export_rt': form.cleaned_data['export_rt'],
-                    'import_rt': form.cleaned_data['import_rt']
-                },
-                created_by=request.user
-            )
-            
-            # Execute task asynchronously
-            thread = threading.Thread(target=execute_task_async, args=(task,))
-            thread.start()
-            
-            messages.success(request, f'EVPN Instance configuration task submitted for {device.name}')
-            return redirect('task_detail', task_id=task.id)
+        response = _submit_task(
+            request, form, device_form, 'evpn_instance', 'EVPN Instance configuration',
+            lambda data: {
+                'evpn_instance': data['evpn_instance'],
+                'route_distinguisher': data['route_distinguisher'],
+                'export_rt': data['export_rt'],
+                'import_rt': data['import_rt']
+            },
+        )
+        if response is not None:
+            return response
     else:
         form = EVPNInstanceForm()
         device_form = DeviceSelectionForm()
@@ -1251,27 +1026,16 @@ def bgp_evpn(request):
         form = BGPEVPNForm(request.POST)
         device_form = DeviceSelectionForm(request.POST)
         
-        if form.is_valid() and device_form.is_valid():
-            device = device_form.cleaned_data['device']
-            
-            # Create network task
-            task = NetworkTask.objects.create(
-                device=device,
-                task_type='bgp_evpn',
-                parameters={
-                    'as_number': form.cleaned_data['as_number'],
-                    'neighbor_ip': form.cleaned_data['neighbor_ip'],
-                    'source_interface': form.cleaned_data.get('source_interface')
-                },
-                created_by=request.user
-            )
-            
-            # Execute task asynchronously
-            thread = threading.Thread(target=execute_task_async, args=(task,))
-            thread.start()
-            
-            messages.success(request, f'BGP EVPN configuration task submitted for {device.name}')
-            return redirect('task_detail', task_id=task.id)
+        response = _submit_task(
+            request, form, device_form, 'bgp_evpn', 'BGP EVPN configuration',
+            lambda data: {
+                'as_number': data['as_number'],
+                'neighbor_ip': data['neighbor_ip'],
+                'source_interface': data.get('source_interface')
+            },
+        )
+        if response is not None:
+            return response
     else:
         form = BGPEVPNForm()
         device_form = DeviceSelectionForm()
@@ -1291,28 +1055,17 @@ def vxlan_tunnel(request):
         form = VXLANTunnelForm(request.POST)
         device_form = DeviceSelectionForm(request.POST)
         
-        if form.is_valid() and device_form.is_valid():
-            device = device_form.cleaned_data['device']
-            
-            # Create network task
-            task = NetworkTask.objects.create(
-                device=device,
-                task_type='vxlan_tunnel',
-                parameters={
-                    'tunnel_id': form.cleaned_data['tunnel_id'],
-                    'source_ip': form.cleaned_data['source_ip'],
-                    'destination_ip': form.cleaned_data['destination_ip'],
-                    'vni': form.cleaned_data['vni']
-                },
-                created_by=request.user
-            )
-            
-            # Execute task asynchronously
-            thread = threading.Thread(target=execute_task_async, args=(task,))
-            thread.start()
-            
-            messages.success(request, f'VXLAN Tunnel configuration task submitted for {device.name}')
-            return redirect('task_detail', task_id=task.id)
+        response = _submit_task(
+            request, form, device_form, 'vxlan_tunnel', 'VXLAN Tunnel configuration',
+            lambda data: {
+                'tunnel_id': data['tunnel_id'],
+                'source_ip': data['source_ip'],
+                'destination_ip': data['destination_ip'],
+                'vni': data['vni']
+            },
+        )
+        if response is not None:
+            return response
     else:
         form = VXLANTunnelForm()
         device_form = DeviceSelectionForm()
@@ -1325,6 +1078,22 @@ def vxlan_tunnel(request):
     return render(request, 'automation/vxlan_tunnel_form.html', context)
 
 
+def _nve_interface_params(data):
+    """Task parameters for nve_interface"""
+    # Process VNI mappings (one per line)
+    vni_mappings_text = data.get('vni_mappings', '')
+    vni_mappings = [
+        {'vni': vni, 'bridge_domain': bd}
+        for vni, bd in _VNI_MAPPING_RE.findall(vni_mappings_text)
+    ]
+    
+    return {
+        'nve_id': data['nve_id'],
+        'source_ip': data['source_ip'],
+        'vni_mappings': vni_mappings
+    }
+
+
 @login_required
 def nve_interface(request):
     """Configure NVE Interface on selected device"""
@@ -1332,35 +1101,12 @@ def nve_interface(request):
         form = NVEInterfaceForm(request.POST)
         device_form = DeviceSelectionForm(request.POST)
         
-        if form.is_valid() and device_form.is_valid():
-            device = device_form.cleaned_data['device']
-            
-            # Process VNI mappings (one per line)
-            vni_mappings_text = form.cleaned_data.get('vni_mappings', '')
-            vni_mappings = []
-            for line in vni_mappings_text.split('\n'):
-                if ':' in line:
-                    vni, bd = line.strip().split(':')
-                    vni_mappings.append({'vni': vni.strip(), 'bridge_domain': bd.strip()})
-            
-            # Create network task
-            task = NetworkTask.objects.create(
-                device=device,
-                task_type='nve_interface',
-                parameters={
-                    'nve_id': form.cleaned_data['nve_id'],
-                    'source_ip': form.cleaned_data['source_ip'],
-                    'vni_mappings': vni_mappings
-                },
-                created_by=request.user
-            )
-            
-            # Execute task asynchronously
-            thread = threading.Thread(target=execute_task_async, args=(task,))
-            thread.start()
-            
-            messages.success(request, f'NVE Interface configuration task submitted for {device.name}')
-            return redirect('task_detail', task_id=task.id)
+        response = _submit_task(
+            request, form, device_form, 'nve_interface', 'NVE Interface configuration',
+            _nve_interface_params,
+        )
+        if response is not None:
+            return response
     else:
         form = NVEInterfaceForm()
         device_form = DeviceSelectionForm()
@@ -1380,28 +1126,17 @@ def vxlan_gateway(request):
         form = VXLANGatewayForm(request.POST)
         device_form = DeviceSelectionForm(request.POST)
         
-        if form.is_valid() and device_form.is_valid():
-            device = device_form.cleaned_data['device']
-            
-            # Create network task
-            task = NetworkTask.objects.create(
-                device=device,
-                task_type='vxlan_gateway',
-                parameters={
-                    'bridge_domain_id': form.cleaned_data['bridge_domain_id'],
-                    'gateway_ip': form.cleaned_data['gateway_ip'],
-                    'subnet_mask': form.cleaned_data['subnet_mask'],
-                    'vbdif_id': form.cleaned_data.get('vbdif_id')
-                },
-                created_by=request.user
-            )
-            
-            # Execute task asynchronously
-            thread = threading.Thread(target=execute_task_async, args=(task,))
-            thread.start()
-            
-            messages.success(request, f'VXLAN Gateway configuration task submitted for {device.name}')
-            return redirect('task_detail', task_id=task.id)
+        response = _submit_task(
+            request, form, device_form, 'vxlan_gateway', 'VXLAN Gateway configuration',
+            lambda data: {
+                'bridge_domain_id': data['bridge_domain_id'],
+                'gateway_ip': data['gateway_ip'],
+                'subnet_mask': data['subnet_mask'],
+                'vbdif_id': data.get('vbdif_id')
+            },
+        )
+        if response is not None:
+            return response
     else:
         form = VXLANGatewayForm()
         device_form = DeviceSelectionForm()
@@ -1421,26 +1156,15 @@ def vxlan_access_port(request):
         form = VXLANAccessPortForm(request.POST)
         device_form = DeviceSelectionForm(request.POST)
         
-        if form.is_valid() and device_form.is_valid():
-            device = device_form.cleaned_data['device']
-            
-            # Create network task
-            task = NetworkTask.objects.create(
-                device=device,
-                task_type='vxlan_access_port',
-                parameters={
-                    'interface': form.cleaned_data['interface'],
-                    'bridge_domain_id': form.cleaned_data['bridge_domain_id']
-                },
-                created_by=request.user
-            )
-            
-            # Execute task asynchronously
-            thread = threading.Thread(target=execute_task_async, args=(task,))
-            thread.start()
-            
-            messages.success(request, f'VXLAN Access Port configuration task submitted for {device.name}')
-            return redirect('task_detail', task_id=task.id)
+        response = _submit_task(
+            request, form, device_form, 'vxlan_access_port', 'VXLAN Access Port configuration',
+            lambda data: {
+                'interface': data['interface'],
+                'bridge_domain_id': data['bridge_domain_id']
+            },
+        )
+        if response is not None:
+            return response
     else:
         form = VXLANAccessPortForm()
         device_form = DeviceSelectionForm()
@@ -1465,7 +1189,7 @@ def datacenter_fabric(request):
             
             # Process spine interfaces (one per line)
             interfaces_text = form.cleaned_data.get('spine_interfaces', '')
-            interfaces = [iface.strip() for iface in interfaces_text.split('\n') if iface.strip()]
+            interfaces = _LINES_RE.findall(interfaces_text)
             
             # Debug logging
             print(f"DEBUG: Form data: {form.cleaned_data}")
@@ -1494,8 +1218,7 @@ def datacenter_fabric(request):
             
             # Execute task asynchronously
             print(f"ASYNC DEBUG: About to start thread for task {task.id}")
-            thread = threading.Thread(target=execute_task_async, args=(task,))
-            thread.start()
+            submit_task(execute_task_async, task)
             print(f"ASYNC DEBUG: Thread started for task {task.id}")
             
             messages.success(request, f'Datacenter Fabric deployment task submitted for {device.name}')
@@ -1518,6 +1241,24 @@ def datacenter_fabric(request):
     return render(request, 'automation/datacenter_fabric_form.html', context)
 
 
+def _tenant_network_params(data):
+    """Task parameters for tenant_network"""
+    # Process access interfaces (one per line)
+    interfaces_text = data.get('access_interfaces', '')
+    interfaces = _LINES_RE.findall(interfaces_text)
+    
+    return {
+        'tenant_name': data['tenant_name'],
+        'vni': data['vni'],
+        'vlan_id': data['vlan_id'],
+        'gateway_ip': data['gateway_ip'],
+        'subnet_mask': data['subnet_mask'],
+        'route_target': data.get('route_target'),
+        'access_interfaces': interfaces,
+        'advertise_external': data.get('advertise_external', False)
+    }
+
+
 @login_required
 def tenant_network(request):
     """Deploy Tenant Network on selected device"""
@@ -1525,36 +1266,12 @@ def tenant_network(request):
         form = TenantNetworkForm(request.POST)
         device_form = DeviceSelectionForm(request.POST)
         
-        if form.is_valid() and device_form.is_valid():
-            device = device_form.cleaned_data['device']
-            
-            # Process access interfaces (one per line)
-            interfaces_text = form.cleaned_data.get('access_interfaces', '')
-            interfaces = [iface.strip() for iface in interfaces_text.split('\n') if iface.strip()]
-            
-            # Create network task
-            task = NetworkTask.objects.create(
-                device=device,
-                task_type='tenant_network',
-                parameters={
-                    'tenant_name': form.cleaned_data['tenant_name'],
-                    'vni': form.cleaned_data['vni'],
-                    'vlan_id': form.cleaned_data['vlan_id'],
-                    'gateway_ip': form.cleaned_data['gateway_ip'],
-                    'subnet_mask': form.cleaned_data['subnet_mask'],
-                    'route_target': form.cleaned_data.get('route_target'),
-                    'access_interfaces': interfaces,
-                    'advertise_external': form.cleaned_data.get('advertise_external', False)
-                },
-                created_by=request.user
-            )
-            
-            # Execute task asynchronously
-            thread = threading.Thread(target=execute_task_async, args=(task,))
-            thread.start()
-            
-            messages.success(request, f'Tenant Network deployment task submitted for {device.name}')
-            return redirect('task_detail', task_id=task.id)
+        response = _submit_task(
+            request, form, device_form, 'tenant_network', 'Tenant Network deployment',
+            _tenant_network_params,
+        )
+        if response is not None:
+            return response
     else:
         form = TenantNetworkForm()
         device_form = DeviceSelectionForm()
@@ -1586,8 +1303,7 @@ def bgp_neighbor_v6(request):
                 },
                 created_by=request.user
             )
-            thread = threading.Thread(target=execute_task_async, args=(task,))
-            thread.start()
+            submit_task(execute_task_async, task)
             messages.success(request, f'BGP IPv6 neighbor task submitted for {device.name}')
             return redirect('task_detail', task_id=task.id)
     else:
@@ -1629,8 +1345,7 @@ def bgp_network_v6(request):
                 },
                 created_by=request.user
             )
-            thread = threading.Thread(target=execute_task_async, args=(task,))
-            thread.start()
+            submit_task(execute_task_async, task)
             messages.success(request, f'BGP IPv6 network task submitted for {device.name}')
             return redirect('task_detail', task_id=task.id)
     else:
@@ -1646,32 +1361,21 @@ def external_connectivity(request):
         form = ExternalConnectivityForm(request.POST)
         device_form = DeviceSelectionForm(request.POST)
         
-        if form.is_valid() and device_form.is_valid():
-            device = device_form.cleaned_data['device']
-            
-            # Create network task
-            task = NetworkTask.objects.create(
-                device=device,
-                task_type='external_connectivity',
-                parameters={
-                    'vrf_name': form.cleaned_data['vrf_name'],
-                    'external_interface': form.cleaned_data['external_interface'],
-                    'external_ip': form.cleaned_data['external_ip'],
-                    'external_mask': form.cleaned_data['external_mask'],
-                    'external_peer_ip': form.cleaned_data['external_peer_ip'],
-                    'external_as': form.cleaned_data['external_as'],
-                    'route_distinguisher': form.cleaned_data.get('route_distinguisher'),
-                    'route_target': form.cleaned_data['route_target']
-                },
-                created_by=request.user
-            )
-            
-            # Execute task asynchronously
-            thread = threading.Thread(target=execute_task_async, args=(task,))
-            thread.start()
-            
-            messages.success(request, f'External Connectivity configuration task submitted for {device.name}')
-            return redirect('task_detail', task_id=task.id)
+        response = _submit_task(
+            request, form, device_form, 'external_connectivity', 'External Connectivity configuration',
+            lambda data: {
+                'vrf_name': data['vrf_name'],
+                'external_interface': data['external_interface'],
+                'external_ip': data['external_ip'],
+                'external_mask': data['external_mask'],
+                'external_peer_ip': data['external_peer_ip'],
+                'external_as': data['external_as'],
+                'route_distinguisher': data.get('route_distinguisher'),
+                'route_target': data['route_target']
+            },
+        )
+        if response is not None:
+            return response
     else:
         form = ExternalConnectivityForm()
         device_form = DeviceSelectionForm()
@@ -1700,7 +1404,7 @@ def multi_tenant_deployment(request):
                 return render(request, 'automation/multi_tenant_deployment_form.html', context)
             
             # Process device names (one per line)
-            device_names = [name.strip() for name in form.cleaned_data['deploy_to_devices'].split('\n') if name.strip()]
+            device_names = _LINES_RE.findall(form.cleaned_data['deploy_to_devices'])
             
             # Get devices by name
             devices = Device.objects.filter(name__in=device_names, is_active=True)
@@ -1709,27 +1413,28 @@ def multi_tenant_deployment(request):
                 context = {'form': form, 'title': 'Deploy Multi-Tenant Configuration'}
                 return render(request, 'automation/multi_tenant_deployment_form.html', context)
             
-            # Create tasks for each device
-            task_ids = []
-            for device in devices:
-                task = NetworkTask.objects.create(
-                    device=device,
-                    task_type='multi_tenant_deployment',
-                    parameters={
-                        'fabric_name': form.cleaned_data['fabric_name'],
-                        'tenant_networks': tenant_networks
-                    },
-                    created_by=request.user
-                )
-                task_ids.append(task.id)
+            # Create tasks for each device with a single multi-row INSERT
+            with transaction.atomic():
+                tasks = NetworkTask.objects.bulk_create([
+                    NetworkTask(
+                        device=device,
+                        task_type='multi_tenant_deployment',
+                        parameters={
+                            'fabric_name': form.cleaned_data['fabric_name'],
+                            'tenant_networks': tenant_networks
+                        },
+                        created_by=request.user
+                    )
+                    for device in devices
+                ])
                 
-                # Execute task asynchronously
-                thread = threading.Thread(target=execute_task_async, args=(task,))
-                thread.start()
+                # Execute tasks asynchronously
+                for task in tasks:
+                    submit_task(execute_task_async, task)
             
-            messages.success(request, f'Multi-Tenant deployment tasks submitted for {len(devices)} devices')
+            messages.success(request, f'Multi-Tenant deployment tasks submitted for {len(tasks)} devices')
             # Redirect to the first task (could be improved to show all tasks)
-            return redirect('task_detail', task_id=task_ids[0] if task_ids else 1)
+            return redirect('task_detail', task_id=tasks[0].id)
     else:
         form = MultiTenantDeploymentForm()
     
@@ -1753,8 +1458,8 @@ def huawei_eth_trunk_mlag(request):
             mlag_id = form.cleaned_data.get('mlag_id')
             allowed_vlans = form.cleaned_data.get('allowed_vlans')
             desc = form.cleaned_data.get('description')
-            members_p = [m.strip() for m in form.cleaned_data['members_primary'].split('\n') if m.strip()]
-            members_q = [m.strip() for m in form.cleaned_data['members_peer'].split('\n') if m.strip()]
+            members_p = _LINES_RE.findall(form.cleaned_data['members_primary'])
+            members_q = _LINES_RE.findall(form.cleaned_data['members_peer'])
 
             task_p = NetworkTask.objects.create(
                 device=p,
@@ -1783,9 +1488,8 @@ def huawei_eth_trunk_mlag(request):
                 created_by=request.user
             )
 
-            t1 = threading.Thread(target=execute_task_async, args=(task_p,))
-            t2 = threading.Thread(target=execute_task_async, args=(task_q,))
-            t1.start(); t2.start()
+            submit_task(execute_task_async, task_p)
+            submit_task(execute_task_async, task_q)
 
             messages.success(request, f'Eth-Trunk{trunk_id} MLAG tasks submitted for {p.name} and {q.name}')
             return redirect('task_detail', task_id=task_p.id)
@@ -1811,8 +1515,7 @@ def interface_ipv6_config(request):
                 },
                 created_by=request.user
             )
-            thread = threading.Thread(target=execute_task_async, args=(task,))
-            thread.start()
+            submit_task(execute_task_async, task)
             messages.success(request, f'IPv6 interface configuration task submitted for {device.name}')
             return redirect('task_detail', task_id=task.id)
     else:
@@ -1841,8 +1544,7 @@ def vlan_interface_ipv6_config(request):
                 },
                 created_by=request.user
             )
-            thread = threading.Thread(target=execute_task_async, args=(task,))
-            thread.start()
+            submit_task(execute_task_async, task)
             messages.success(request, f'IPv6 VLAN interface configuration task submitted for {device.name}')
             return redirect('task_detail', task_id=task.id)
     else:
@@ -1869,8 +1571,7 @@ def routing_static_v6(request):
                 },
                 created_by=request.user
             )
-            thread = threading.Thread(target=execute_task_async, args=(task,))
-            thread.start()
+            submit_task(execute_task_async, task)
             messages.success(request, f'IPv6 static route task submitted for {device.name}')
             return redirect('task_detail', task_id=task.id)
     else:
@@ -1896,8 +1597,7 @@ def routing_ospf_v6(request):
                 },
                 created_by=request.user
             )
-            thread = threading.Thread(target=execute_task_async, args=(task,))
-            thread.start()
+            submit_task(execute_task_async, task)
             messages.success(request, f'OSPFv3 configuration task submitted for {device.name}')
             return redirect('task_detail', task_id=task.id)
     else:
@@ -1906,6 +1606,23 @@ def routing_ospf_v6(request):
     return render(request, 'automation/ospf_v6_form.html', {'form': form, 'device_form': device_form, 'title': 'Configure OSPFv3 (IPv6)'})
 
 
+def _ae_config_params(data):
+    """Task parameters for ae_config"""
+    # Process members (one per line)
+    members_text = data.get('members', '')
+    members = _LINES_RE.findall(members_text)
+    
+    return {
+        'ae_name': data['ae_name'],
+        'lacp': data['lacp'],
+        'members': members,
+        'unit': data['unit'],
+        'ip_address': data.get('ip_address'),
+        'prefix_length': data.get('prefix_length'),
+        'description': data.get('description')
+    }
+
+
 @login_required
 def ae_config(request):
     """Configure Aggregated Ethernet (AE) interface on selected device"""
@@ -1913,35 +1630,12 @@ def ae_config(request):
         form = AEForm(request.POST)
         device_form = DeviceSelectionForm(request.POST)
         
-        if form.is_valid() and device_form.is_valid():
-            device = device_form.cleaned_data['device']
-            
-            # Process members (one per line)
-            members_text = form.cleaned_data.get('members', '')
-            members = [m.strip() for m in members_text.split('\n') if m.strip()]
-            
-            # Create network task
-            task = NetworkTask.objects.create(
-                device=device,
-                task_type='ae_config',
-                parameters={
-                    'ae_name': form.cleaned_data['ae_name'],
-                    'lacp': form.cleaned_data['lacp'],
-                    'members': members,
-                    'unit': form.cleaned_data['unit'],
-                    'ip_address': form.cleaned_data.get('ip_address'),
-                    'prefix_length': form.cleaned_data.get('prefix_length'),
-                    'description': form.cleaned_data.get('description')
-                },
-                created_by=request.user
-            )
-            
-            # Execute task asynchronously
-            thread = threading.Thread(target=execute_task_async, args=(task,))
-            thread.start()
-            
-            messages.success(request, f'AE configuration task submitted for {device.name}')
-            return redirect('task_detail', task_id=task.id)
+        response = _submit_task(
+            request, form, device_form, 'ae_config', 'AE configuration',
+            _ae_config_params,
+        )
+        if response is not None:
+            return response
     else:
         form = AEForm()
         device_form = DeviceSelectionForm()
@@ -2080,8 +1774,7 @@ def full_fabric_deploy(request):
                 )
                 task_ids.append(task.id)
 
-                thread = threading.Thread(target=execute_task_async, args=(task,))
-                thread.start()
+                submit_task(execute_task_async, task)
 
             messages.success(request, f'Full fabric deployment tasks submitted for {len(task_ids)} devices')
             return redirect('task_detail', task_id=task_ids[0] if task_ids else 1)
@@ -2118,33 +1811,39 @@ def full_fabric_deploy(request):
 
 def api_task_status(request, task_id):
     """API endpoint to get task status"""
-    try:
-        task = NetworkTask.objects.get(id=task_id)
-        data = {
-            'status': task.status,
-            'progress': getattr(task, 'progress', 0),
-            'message': task.error_message if task.status == 'failed' else ''
-        }
-        return JsonResponse(data)
-    except NetworkTask.DoesNotExist:
+    snapshot = get_task_status(task_id)
+    if snapshot is None:
         return JsonResponse({'error': 'Task not found'}, status=404)
+    data = {
+        'status': snapshot['status'],
+        'progress': 0,
+        'message': snapshot['error_message'] if snapshot['status'] == 'failed' else ''
+    }
+    return JsonResponse(data)
 
 
 def api_device_interfaces(request, device_id):
     """API endpoint to get device interfaces"""
     try:
-        device = Device.objects.get(id=device_id, is_active=True)
+        device = Device.objects.only('id', *Device.CONNECTION_FIELDS).get(id=device_id, is_active=True)
         
-        # Execute show interfaces command to get interface list
+        cache_key = device_listing_cache_key(device.id, 'interfaces')
+        interfaces = cache.get(cache_key)
+        if interfaces is not None:
+            return JsonResponse({'interfaces': interfaces})
+        
+        # Execute show interfaces command to get interface list over a pooled session
         success, result, error = execute_network_task(
             device.get_connection_params(),
             'show_interfaces',
-            {}
+            {},
+            reuse=True
         )
         
         if success:
             # Parse interfaces from the result
             interfaces = parse_interfaces_from_output(result, device.device_type)
+            cache.set(cache_key, interfaces, DEVICE_LISTING_TIMEOUT)
             return JsonResponse({'interfaces': interfaces})
         else:
             return JsonResponse({'error': f'Failed to retrieve interfaces: {error}'}, status=500)
@@ -2158,24 +1857,33 @@ def api_device_interfaces(request, device_id):
 def api_device_vrfs(request, device_id):
     """API endpoint to get device VRFs"""
     try:
-        device = Device.objects.get(id=device_id, is_active=True)
+        device = Device.objects.only('id', *Device.CONNECTION_FIELDS).get(id=device_id, is_active=True)
+        debug = request.GET.get('debug') == '1'
+        
+        # Debug requests need the raw device output, so they always go to the device
+        cache_key = device_listing_cache_key(device.id, 'vrfs')
+        vrfs = None if debug else cache.get(cache_key)
+        if vrfs is not None:
+            return JsonResponse({'vrfs': vrfs})
         
-        # Execute show VRF command to get VRF list
+        # Execute show VRF command to get VRF list over a pooled session
         success, result, error = execute_network_task(
             device.get_connection_params(),
             'show_vrfs',
-            {}
+            {},
+            reuse=True
         )
         
         if success:
             # Parse VRFs from the result
             vrfs = parse_vrfs_from_output(result, device.device_type)
+            cache.set(cache_key, vrfs, DEVICE_LISTING_TIMEOUT)
             
             # Include raw output in debug mode for troubleshooting
             response_data = {'vrfs': vrfs}
             
             # Add debug info if requested
-            if request.GET.get('debug') == '1':
+            if debug:
                 response_data['debug'] = {
                     'raw_output': result,
                     'device_type': device.device_type,
@@ -2195,55 +1903,49 @@ def api_device_vrfs(request, device_id):
 
 def parse_interfaces_from_output(output, device_type):
     """Parse interface names from show interfaces output"""
-    interfaces = []
+    seen = {}
     
     if not output:
-        return interfaces
+        return []
     
-    lines = output.split('\n')
+    lines = output.splitlines()
     
     try:
         if device_type in ['huawei', 'huawei_vrpv8']:
             # Huawei interface parsing
             for line in lines:
                 line = line.strip()
-                if any(prefix in line for prefix in ['GigabitEthernet', '10GE', '25GE', '40GE', '100GE', 'Ethernet']):
+                if _HUAWEI_IFACE_TOKEN_RE.search(line):
                     # Extract interface name (first word)
                     parts = line.split()
                     if parts:
-                        interface_name = parts[0]
-                        if interface_name not in interfaces:
-                            interfaces.append(interface_name)
+                        seen[parts[0]] = None
         
         elif device_type in ['cisco_ios', 'cisco_xe']:
             # Cisco interface parsing
             for line in lines:
                 line = line.strip()
-                if any(prefix in line for prefix in ['GigabitEthernet', 'TenGigabitEthernet', 'FastEthernet', 'Ethernet']):
+                if _CISCO_IFACE_TOKEN_RE.search(line):
                     # Extract interface name (first word)
                     parts = line.split()
                     if parts:
-                        interface_name = parts[0]
-                        if interface_name not in interfaces:
-                            interfaces.append(interface_name)
+                        seen[parts[0]] = None
         
         elif device_type in ['juniper_mx', 'juniper_srx']:
             # Juniper interface parsing
             for line in lines:
                 line = line.strip()
-                if any(prefix in line for prefix in ['ge-', 'xe-', 'et-', 'ae']):
+                if _JUNIPER_IFACE_TOKEN_RE.search(line):
                     # Extract interface name (first word)
                     parts = line.split()
                     if parts:
-                        interface_name = parts[0]
-                        if interface_name not in interfaces:
-                            interfaces.append(interface_name)
+                        seen[parts[0]] = None
     
     except Exception:
         # Fallback: return empty list if parsing fails
         pass
     
-    return sorted(interfaces)
+    return list(seen)
 
 
 def parse_vrfs_from_output(output, device_type):
@@ -2259,7 +1961,7 @@ def parse_vrfs_from_output(output, device_type):
     logger.info(f"Parsing VRFs from {device_type} output (length: {len(output)})")
     logger.debug(f"Raw VRF output: {repr(output[:500])}...")  # First 500 chars for debugging
     
-    lines = output.split('\n')
+    lines = output.splitlines()
     logger.info(f"Processing {len(lines)} lines for VRF parsing")
     
     try:
@@ -2278,7 +1980,7 @@ def parse_vrfs_from_output(output, device_type):
         pass
     
     logger.info(f"Parsed {len(vrfs)} VRFs: {vrfs}")
-    return sorted(vrfs)
+    return list(dict.fromkeys(vrfs))
 
 
 def parse_huawei_vrfs(lines, logger):
@@ -135,3 +135,9 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 LOGIN_URL = '/accounts/login/'
 LOGIN_REDIRECT_URL = '/'
 LOGOUT_REDIRECT_URL = '/'
+
+# Background task execution
+# Size of the worker pool that runs device tasks (automation.tasks.get_task_executor)
+NETAUTO_TASK_WORKERS = env.int('NETAUTO_TASK_WORKERS', default=16)
+# Submitted tasks allowed to wait for a free worker; tasks submitted beyond this are marked failed
+NETAUTO_TASK_QUEUE_SIZE = env.int('NETAUTO_TASK_QUEUE_SIZE', default=64)